@@ -0,0 +1 @@
+"""Benchmarks for pandas-flavor, run with airspeed velocity (asv)."""
@@ -0,0 +1,483 @@
+"""Per-call overhead of registered methods compared to a bare function call."""
+
+import time
+from contextlib import nullcontext
+
+import pandas as pd
+
+import pandas_flavor as pf
+
+
+def bench_bare(obj):
+    """Return the object unchanged.
+
+    Args:
+        obj: A pandas or xarray object.
+
+    Returns:
+        The same object.
+    """
+    return obj
+
+
+@pf.register_dataframe_method
+def bench_accessor(df):
+    """Return the DataFrame unchanged.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The same DataFrame.
+    """
+    return df
+
+
+@pf.register_dataframe_method(direct=True)
+def bench_direct(df):
+    """Return the DataFrame unchanged.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The same DataFrame.
+    """
+    return df
+
+
+@pf.register_series_method
+def bench_series_accessor(s):
+    """Return the Series unchanged.
+
+    Args:
+        s: A pandas Series.
+
+    Returns:
+        The same Series.
+    """
+    return s
+
+
+@pf.register_series_method(direct=True)
+def bench_series_direct(s):
+    """Return the Series unchanged.
+
+    Args:
+        s: A pandas Series.
+
+    Returns:
+        The same Series.
+    """
+    return s
+
+
+@pf.register_dataframe_groupby_method
+def bench_dataframe_groupby_accessor(grp):
+    """Return the GroupBy object unchanged.
+
+    Args:
+        grp: A pandas DataFrameGroupBy.
+
+    Returns:
+        The same GroupBy object.
+    """
+    return grp
+
+
+@pf.register_dataframe_groupby_method(direct=True)
+def bench_dataframe_groupby_direct(grp):
+    """Return the GroupBy object unchanged.
+
+    Args:
+        grp: A pandas DataFrameGroupBy.
+
+    Returns:
+        The same GroupBy object.
+    """
+    return grp
+
+
+@pf.register_series_groupby_method
+def bench_series_groupby_accessor(grp):
+    """Return the GroupBy object unchanged.
+
+    Args:
+        grp: A pandas SeriesGroupBy.
+
+    Returns:
+        The same GroupBy object.
+    """
+    return grp
+
+
+@pf.register_series_groupby_method(direct=True)
+def bench_series_groupby_direct(grp):
+    """Return the GroupBy object unchanged.
+
+    Args:
+        grp: A pandas SeriesGroupBy.
+
+    Returns:
+        The same GroupBy object.
+    """
+    return grp
+
+
+@pf.register_dataframe_method(direct=True)
+def bench_many_parameters(df, a, b, c=1, d=2, e=3, f=4, g=5, h=6, *, i=7, j=8):
+    """Return the DataFrame unchanged.
+
+    Args:
+        df: A pandas DataFrame.
+        a: An unused argument.
+        b: An unused argument.
+        c: An unused argument.
+        d: An unused argument.
+        e: An unused argument.
+        f: An unused argument.
+        g: An unused argument.
+        h: An unused argument.
+        i: An unused argument.
+        j: An unused argument.
+
+    Returns:
+        The same DataFrame.
+    """
+    return df
+
+
+class BindingContext:
+    """Method call context binding the arguments, as most contexts do.
+
+    Args:
+        method_name: The name of the called method.
+        args: The arguments of the call.
+        kwargs: The keyword arguments of the call.
+    """
+
+    def __init__(self, method_name, args, kwargs):
+        pass
+
+    def __enter__(self):
+        """Enter the context.
+
+        Returns:
+            The context.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the context.
+
+        Args:
+            exc_type: The type of the exception, if any.
+            exc_value: The exception, if any.
+            traceback: The traceback of the exception, if any.
+        """
+
+    def handle_start_method_call(self, method_name, method_signature, args, kwargs):
+        """Bind the arguments.
+
+        Args:
+            method_name: The name of the method.
+            method_signature: The signature of the method.
+            args: The arguments of the method, starting with the object.
+            kwargs: The keyword arguments of the method.
+
+        Returns:
+            The unmodified arguments and keyword arguments.
+        """
+        method_signature.bind(*args, **kwargs).apply_defaults()
+        return args, kwargs
+
+    def handle_end_method_call(self, ret):
+        """Handle the end of the call.
+
+        Args:
+            ret: The return value of the method.
+        """
+
+
+def null_factory(method_name, args, kwargs):
+    """Trace nothing, measuring the cost of the tracing hook itself.
+
+    Args:
+        method_name: The name of the called method.
+        args: The arguments of the call.
+        kwargs: The keyword arguments of the call.
+
+    Returns:
+        A context entering to None.
+    """
+    return nullcontext()
+
+
+class TimeDataFrameDispatch:
+    """Time a call on a fresh DataFrame, as in chains of intermediates."""
+
+    def setup(self):
+        """Create the frames to call the methods on."""
+        self.frames = [pd.DataFrame({"a": [1, 2, 3]}) for _ in range(1000)]
+
+    def time_bare_function(self):
+        """Call the bare function."""
+        for df in self.frames:
+            bench_bare(df)
+
+    def time_accessor_method(self):
+        """Call the accessor-registered method on fresh frames."""
+        for df in self.frames:
+            # drop the pinned accessor so each call pays for a new instance
+            df.__dict__.pop("bench_accessor", None)
+            df.bench_accessor()
+
+    def time_direct_method(self):
+        """Call the directly registered method."""
+        for df in self.frames:
+            df.bench_direct()
+
+
+class TimeSeriesDispatch:
+    """Time a call on a fresh Series."""
+
+    def setup(self):
+        """Create the Series to call the methods on."""
+        self.series = [pd.Series([1, 2, 3]) for _ in range(1000)]
+
+    def time_bare_function(self):
+        """Call the bare function."""
+        for s in self.series:
+            bench_bare(s)
+
+    def time_accessor_method(self):
+        """Call the accessor-registered method on fresh Series."""
+        for s in self.series:
+            s.__dict__.pop("bench_series_accessor", None)
+            s.bench_series_accessor()
+
+    def time_direct_method(self):
+        """Call the directly registered method."""
+        for s in self.series:
+            s.bench_series_direct()
+
+
+class TimeGroupByDispatch:
+    """Time a call on a fresh GroupBy object."""
+
+    def setup(self):
+        """Create the GroupBy objects to call the methods on."""
+        df = pd.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]})
+        self.df_groupbys = [df.groupby("a") for _ in range(1000)]
+        self.series_groupbys = [df.groupby("a")["b"] for _ in range(1000)]
+
+    def time_bare_function(self):
+        """Call the bare function."""
+        for grp in self.df_groupbys:
+            bench_bare(grp)
+
+    def time_dataframe_groupby_accessor_method(self):
+        """Call the accessor-registered DataFrameGroupBy method."""
+        for grp in self.df_groupbys:
+            grp.__dict__.pop("bench_dataframe_groupby_accessor", None)
+            grp.bench_dataframe_groupby_accessor()
+
+    def time_dataframe_groupby_direct_method(self):
+        """Call the directly registered DataFrameGroupBy method."""
+        for grp in self.df_groupbys:
+            grp.bench_dataframe_groupby_direct()
+
+    def time_series_groupby_accessor_method(self):
+        """Call the accessor-registered SeriesGroupBy method."""
+        for grp in self.series_groupbys:
+            grp.__dict__.pop("bench_series_groupby_accessor", None)
+            grp.bench_series_groupby_accessor()
+
+    def time_series_groupby_direct_method(self):
+        """Call the directly registered SeriesGroupBy method."""
+        for grp in self.series_groupbys:
+            grp.bench_series_groupby_direct()
+
+
+class TimeTracedDispatch:
+    """Time registered method calls with the built-in tracer enabled."""
+
+    def setup(self):
+        """Create the frame and enable the tracer."""
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+        self.tracer = pf.MethodCallTracer(capacity=1024).enable()
+
+    def teardown(self):
+        """Disable the tracer."""
+        self.tracer.disable()
+
+    def time_traced_accessor_method(self):
+        """Call the accessor-registered method under the tracer."""
+        for _ in range(1000):
+            self.df.bench_accessor()
+
+    def time_traced_direct_method(self):
+        """Call the directly registered method under the tracer."""
+        for _ in range(1000):
+            self.df.bench_direct()
+
+    def time_traced_direct_method_memory(self):
+        """Call the directly registered method, recording memory usage."""
+        self.tracer.memory = True
+        for _ in range(1000):
+            self.df.bench_direct()
+
+
+class TimeFactoryDispatch:
+    """Time registered method calls with a factory tracing nothing."""
+
+    def setup(self):
+        """Create the frame."""
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+
+    def time_accessor_method_null_factory(self):
+        """Call the accessor-registered method under the null factory."""
+        with pf.call_context(null_factory):
+            for _ in range(1000):
+                self.df.bench_accessor()
+
+    def time_direct_method_null_factory(self):
+        """Call the directly registered method under the null factory."""
+        with pf.call_context(null_factory):
+            for _ in range(1000):
+                self.df.bench_direct()
+
+
+class TimeTracedBinding:
+    """Time traced calls of a method with many parameters."""
+
+    def setup(self):
+        """Create the frame."""
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+
+    def time_many_parameters_untraced(self):
+        """Call the method without any factory."""
+        for _ in range(1000):
+            self.df.bench_many_parameters(1, 2, 3, e=4, i=5)
+
+    def time_many_parameters_binding_context(self):
+        """Call the method under a context binding its arguments."""
+        with pf.call_context(BindingContext):
+            for _ in range(1000):
+                self.df.bench_many_parameters(1, 2, 3, e=4, i=5)
+
+    def time_many_parameters_tracer(self):
+        """Call the method under the built-in tracer."""
+        with pf.MethodCallTracer(capacity=1024).scoped():
+            for _ in range(1000):
+                self.df.bench_many_parameters(1, 2, 3, e=4, i=5)
+
+
+class TimeScopedDispatch:
+    """Time untraced calls while another context has a factory installed."""
+
+    def setup(self):
+        """Create the frame."""
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+
+    def time_direct_method_untraced(self):
+        """Call the directly registered method without any factory."""
+        for _ in range(1000):
+            self.df.bench_direct()
+
+    def time_direct_method_scoped_tracer(self):
+        """Call the directly registered method under a scoped tracer."""
+        with pf.MethodCallTracer(capacity=1024).scoped():
+            for _ in range(1000):
+                self.df.bench_direct()
+
+
+class TimeRawDispatch:
+    """Time calls with instrumentation switched on and off."""
+
+    params = ["instrumented", "raw"]
+    param_names = ["mode"]
+
+    def setup(self, mode):
+        """Create the frame and switch the instrumentation.
+
+        Args:
+            mode: "instrumented" or "raw".
+        """
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+        pf.set_instrumentation(mode == "instrumented")
+
+    def teardown(self, mode):
+        """Instrument the methods again.
+
+        Args:
+            mode: "instrumented" or "raw".
+        """
+        pf.set_instrumentation(True)
+
+    def time_accessor_method(self, mode):
+        """Call the accessor-registered method.
+
+        Args:
+            mode: "instrumented" or "raw".
+        """
+        for _ in range(1000):
+            self.df.bench_accessor()
+
+    def time_direct_method(self, mode):
+        """Call the directly registered method.
+
+        Args:
+            mode: "instrumented" or "raw".
+        """
+        for _ in range(1000):
+            self.df.bench_direct()
+
+
+class SlowExporter:
+    """Span exporter taking 10 ms per batch, like a remote collector."""
+
+    def export(self, spans):
+        """Wait 10 ms.
+
+        Args:
+            spans: The spans to export.
+        """
+        time.sleep(0.01)
+
+
+class TimeSpanDispatch:
+    """Time calls exported as spans, with exporters of different speeds."""
+
+    params = ["in_memory", "slow"]
+    param_names = ["exporter"]
+
+    def setup(self, exporter):
+        """Create the frame and enable the span tracer.
+
+        Args:
+            exporter: "in_memory" or "slow".
+        """
+        from pandas_flavor.otel import InMemorySpanExporter
+
+        self.df = pd.DataFrame({"a": [1, 2, 3]})
+        exporter = InMemorySpanExporter() if exporter == "in_memory" else SlowExporter()
+        self.tracer = pf.SpanTracer(exporter, max_batch_size=100).enable()
+
+    def teardown(self, exporter):
+        """Disable and shut down the span tracer.
+
+        Args:
+            exporter: "in_memory" or "slow".
+        """
+        self.tracer.disable()
+        self.tracer.shutdown()
+
+    def time_direct_method(self, exporter):
+        """Call the directly registered method.
+
+        Args:
+            exporter: "in_memory" or "slow".
+        """
+        for _ in range(1000):
+            self.df.bench_direct()
@@ -0,0 +1,57 @@
+"""Memory allocated per registered method lookup."""
+
+import tracemalloc
+
+import pandas as pd
+
+from .bench_dispatch import bench_accessor, bench_direct  # noqa: F401
+
+
+def allocated_per_lookup(objects, name):
+    """Measure the memory allocated by looking up a method on each object.
+
+    Args:
+        objects: The objects to look the method up on.
+        name: The name of the method.
+
+    Returns:
+        float: The number of bytes allocated per object.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        methods = [getattr(obj, name) for obj in objects]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # the list holding the methods is not part of the cost
+    list_size = methods.__sizeof__()
+    return (after - before - list_size) / len(objects)
+
+
+class MemoryPerObject:
+    """Track the memory an object keeps for each registered method used on it."""
+
+    unit = "bytes"
+
+    def setup(self):
+        """Create the frames to look the methods up on."""
+        self.frames = [pd.DataFrame({"a": [1, 2, 3]}) for _ in range(1000)]
+
+    def track_accessor_instance(self):
+        """Memory of the accessor instance pinned on each frame.
+
+        Returns:
+            float: The number of bytes per frame.
+        """
+        return allocated_per_lookup(self.frames, "bench_accessor")
+
+    def track_direct_bound_method(self):
+        """Memory of the bound method of a directly registered method.
+
+        Unlike accessor instances, bound methods are not kept on the frame.
+
+        Returns:
+            float: The number of bytes per frame.
+        """
+        return allocated_per_lookup(self.frames, "bench_direct")
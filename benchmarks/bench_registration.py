@@ -0,0 +1,150 @@
+"""Cost of importing pandas_flavor and registering methods."""
+
+import itertools
+
+import pandas as pd
+
+import pandas_flavor as pf
+from pandas_flavor import register
+
+_counter = itertools.count()
+
+_REGISTER_100_METHODS = """
+for i in range(100):
+    def method(df):
+        return df
+    method.__name__ = f"method_{i}"
+    pf.register_dataframe_method(method)
+"""
+
+
+def make_methods(n):
+    """Make functions with names never registered before.
+
+    Args:
+        n: The number of functions.
+
+    Returns:
+        list: The functions.
+    """
+    methods = []
+    for _ in range(n):
+
+        def method(df, value=None):
+            """Return the DataFrame unchanged.
+
+            Args:
+                df: A pandas DataFrame.
+                value: An unused argument.
+
+            Returns:
+                The same DataFrame.
+            """
+            return df
+
+        method.__name__ = f"bench_registered_{next(_counter)}"
+        methods.append(method)
+    return methods
+
+
+def unregister_all():
+    """Remove the methods registered by the benchmarks from DataFrame."""
+    for cls, name in list(register._registered_methods):
+        if cls is pd.DataFrame and name.startswith("bench_registered_"):
+            delattr(pd.DataFrame, name)
+            pd.DataFrame._accessors.discard(name)
+            del register._registered_methods[cls, name]
+
+
+class TimeRegistration:
+    """Time registering N methods on DataFrame."""
+
+    params = [10, 100, 1000]
+    param_names = ["n_methods"]
+    # one registration of N methods per sample (setup runs before each),
+    # without warmup calls using up the prepared functions
+    number = 1
+    repeat = 20
+    warmup_time = 0
+
+    def setup(self, n_methods):
+        """Make the functions to register.
+
+        Args:
+            n_methods: The number of methods to register.
+        """
+        self.n_methods = n_methods
+        self.batches = [make_methods(n_methods)]
+
+    def teardown(self, n_methods):
+        """Remove the registered methods.
+
+        Args:
+            n_methods: The number of methods registered.
+        """
+        unregister_all()
+
+    def _next_batch(self):
+        """Return functions not registered yet.
+
+        Returns:
+            list: The functions.
+        """
+        if self.batches:
+            return self.batches.pop()
+        # only if asv calls the benchmark again without setup
+        return make_methods(self.n_methods)
+
+    def time_register_accessor_methods(self, n_methods):
+        """Register the methods through accessors, one by one.
+
+        Args:
+            n_methods: The number of methods to register.
+        """
+        for method in self._next_batch():
+            pf.register_dataframe_method(method)
+
+    def time_register_direct_methods(self, n_methods):
+        """Register the methods directly, one by one.
+
+        Args:
+            n_methods: The number of methods to register.
+        """
+        for method in self._next_batch():
+            pf.register_dataframe_method(method, direct=True)
+
+    def time_register_many(self, n_methods):
+        """Register the methods in a batch.
+
+        Args:
+            n_methods: The number of methods to register.
+        """
+        pf.register_many(self._next_batch())
+
+
+class TimeImport:
+    """Time importing pandas_flavor in a fresh interpreter."""
+
+    def timeraw_import_pandas_flavor(self):
+        """Import the package alone.
+
+        Returns:
+            str: The code to time.
+        """
+        return "import pandas_flavor"
+
+    def timeraw_import_register(self):
+        """Import the package and its pandas registration functions.
+
+        Returns:
+            str: The code to time.
+        """
+        return "import pandas_flavor as pf; pf.register_dataframe_method"
+
+    def timeraw_register_100_methods(self):
+        """Register 100 methods, as a library of methods does on import.
+
+        Returns:
+            tuple: The code to time and its setup.
+        """
+        return _REGISTER_100_METHODS, "import pandas_flavor as pf; import pandas"
@@ -0,0 +1,127 @@
+"""Elementwise Series methods: Series.apply against vectorized registration."""
+
+import numpy as np
+import pandas as pd
+
+import pandas_flavor as pf
+
+
+def clip_score(x, low=0.0, high=1.0):
+    """Clip a value.
+
+    Args:
+        x: The value.
+        low: The lower bound.
+        high: The upper bound.
+
+    Returns:
+        The clipped value.
+    """
+    return min(max(x, low), high)
+
+
+def initial(x):
+    """Return the capitalized initial of a string.
+
+    Args:
+        x: The string.
+
+    Returns:
+        str: The initial.
+    """
+    return x[:1].upper()
+
+
+pf.register_series_ufunc(clip_score)
+pf.register_series_ufunc(initial)
+
+
+class TimeElementwise:
+    """Time applying scalar functions to every element of a Series."""
+
+    def setup(self):
+        """Create the Series."""
+        rng = np.random.default_rng(0)
+        self.numbers = pd.Series(rng.normal(size=100_000))
+        self.words = pd.Series(rng.choice(["alpha", "beta", "gamma"], 100_000))
+
+    def time_numbers_apply(self):
+        """Apply a numeric function with Series.apply."""
+        self.numbers.apply(clip_score)
+
+    def time_numbers_vectorized(self):
+        """Apply a numeric function as a vectorized method."""
+        self.numbers.clip_score()
+
+    def time_words_apply(self):
+        """Apply a string function with Series.apply."""
+        self.words.apply(initial)
+
+    def time_words_vectorized(self):
+        """Apply a string function as a vectorized method."""
+        self.words.initial()
+
+
+@pf.register_series_method(elementwise=True)
+def bench_strip(s):
+    """Strip whitespace.
+
+    Args:
+        s: A Series of strings.
+
+    Returns:
+        The stripped Series.
+    """
+    return s.str.strip()
+
+
+@pf.register_series_method(elementwise=True)
+def bench_lower(s):
+    """Lowercase strings.
+
+    Args:
+        s: A Series of strings.
+
+    Returns:
+        The lowercased Series.
+    """
+    return s.str.lower()
+
+
+@pf.register_series_method(elementwise=True)
+def bench_replace(s, old, new):
+    """Replace a substring.
+
+    Args:
+        s: A Series of strings.
+        old: The substring to replace.
+        new: The replacement.
+
+    Returns:
+        The Series with the substring replaced.
+    """
+    return s.str.replace(old, new, regex=False)
+
+
+class TimeElementwiseFusion:
+    """Time a chain of elementwise string methods, eager or fused."""
+
+    def setup(self):
+        """Create a string column with repeated values."""
+        rng = np.random.default_rng(0)
+        values = [f"  Category {i} " for i in range(1000)]
+        self.words = pd.Series(rng.choice(values, 1_000_000))
+
+    def time_eager(self):
+        """Call the methods one after the other."""
+        self.words.bench_strip().bench_lower().bench_replace(" ", "_")
+
+    def time_fused(self):
+        """Run the methods as a fused lazy chain."""
+        (
+            self.words.pf.lazy()
+            .bench_strip()
+            .bench_lower()
+            .bench_replace(" ", "_")
+            .collect()
+        )
@@ -0,0 +1,120 @@
+"""Per-call overhead of registered xarray methods compared to a bare function call."""
+
+import numpy as np
+import xarray as xr
+
+import pandas_flavor as pf
+
+from .bench_dispatch import bench_bare
+
+
+@pf.register_xarray_dataarray_method
+def bench_dataarray_accessor(da):
+    """Return the DataArray unchanged.
+
+    Args:
+        da: An xarray DataArray.
+
+    Returns:
+        The same DataArray.
+    """
+    return da
+
+
+@pf.register_xarray_dataset_method
+def bench_dataset_accessor(ds):
+    """Return the Dataset unchanged.
+
+    Args:
+        ds: An xarray Dataset.
+
+    Returns:
+        The same Dataset.
+    """
+    return ds
+
+
+class TimeXarrayDispatch:
+    """Time a call on a fresh DataArray or Dataset."""
+
+    def setup(self):
+        """Create the objects to call the methods on."""
+        self.arrays = [xr.DataArray(np.arange(3), dims="x") for _ in range(1000)]
+        self.datasets = [xr.Dataset({"a": array}) for array in self.arrays]
+
+    def time_bare_function(self):
+        """Call the bare function."""
+        for da in self.arrays:
+            bench_bare(da)
+
+    def time_dataarray_accessor_method(self):
+        """Call the registered DataArray method."""
+        for da in self.arrays:
+            # drop the cached accessor so each call pays for a new instance
+            da._cache = {}
+            da.bench_dataarray_accessor()
+
+    def time_dataset_accessor_method(self):
+        """Call the registered Dataset method."""
+        for ds in self.datasets:
+            ds._cache = {}
+            ds.bench_dataset_accessor()
+
+
+def smooth(values):
+    """Compute a costly elementwise function of an array.
+
+    Args:
+        values: A NumPy array.
+
+    Returns:
+        The transformed array.
+    """
+    return np.sqrt(np.abs(np.sin(values) * np.cos(values)))
+
+
+@pf.register_xarray_dataarray_method
+def bench_smooth_eager(da):
+    """Smooth the values of a DataArray, loading them at once.
+
+    Args:
+        da: An xarray DataArray.
+
+    Returns:
+        The smoothed DataArray.
+    """
+    return da.copy(data=smooth(da.values))
+
+
+@pf.register_xarray_dataarray_method(blockwise="apply_ufunc")
+def bench_smooth_blockwise(values):
+    """Smooth the values of a chunk.
+
+    Args:
+        values: A NumPy array.
+
+    Returns:
+        The smoothed array.
+    """
+    return smooth(values)
+
+
+class TimeXarrayBlockwise:
+    """Time an elementwise method on a chunked DataArray, eager or blockwise."""
+
+    def setup(self):
+        """Create the chunked DataArray."""
+        try:
+            import dask  # noqa: F401
+        except ImportError:
+            raise NotImplementedError("dask is not installed")
+        data = np.random.default_rng(0).normal(size=(4000, 2000))
+        self.da = xr.DataArray(data, dims=("x", "y")).chunk({"x": 500})
+
+    def time_eager(self):
+        """Call the method loading the whole array."""
+        self.da.bench_smooth_eager()
+
+    def time_blockwise(self):
+        """Call the blockwise method and compute the chunks in parallel."""
+        self.da.bench_smooth_blockwise().compute()
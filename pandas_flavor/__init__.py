@@ -1,22 +1,113 @@
-"""Top-level API for pandas-flavor."""
-
-from .register import (
-    register_dataframe_accessor,
-    register_dataframe_groupby_accessor,
-    register_dataframe_groupby_method,
-    register_dataframe_method,
-    register_series_accessor,
-    register_series_groupby_accessor,
-    register_series_groupby_method,
-    register_series_method,
-)
-from .xarray import (
-    register_xarray_dataarray_method,
-    register_xarray_dataset_method,
-)
+"""Top-level API for pandas-flavor.
+
+Submodules are imported on first use of the names they define,
+so that importing pandas_flavor does not import pandas or xarray:
+xarray is only imported when an xarray registration function is used.
+The `pf` accessor of pandas objects is registered as soon as pandas is imported.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+# Not imported from typing, which would cost more than the rest of this module.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .asynchronous import AsyncRunner
+    from .backends import call
+    from .cache import ResultCache
+    from .checkpoint import DiskCache
+    from .grouping import GroupingCache
+    from .lazy import LazyFrame
+    from .memory import MemoryGrowthWarning, MemoryTracker
+    from .otel import SpanTracer
+    from .profiling import SamplingProfiler
+    from .register import (
+        RegistrationBatch,
+        call_context,
+        register_dataframe_accessor,
+        register_dataframe_groupby_accessor,
+        register_dataframe_groupby_method,
+        register_dataframe_method,
+        register_many,
+        register_series_accessor,
+        register_series_groupby_accessor,
+        register_series_groupby_method,
+        register_series_method,
+        register_series_ufunc,
+        registered_methods,
+        set_instrumentation,
+    )
+    from .streaming import ChunkStream, stream
+    from .tracing import MethodCallTracer
+    from .xarray import (
+        register_xarray_dataarray_method,
+        register_xarray_dataset_method,
+    )
+
+# public name -> submodule defining it
+_lazy_attributes = {
+    "call_context": "register",
+    "RegistrationBatch": "register",
+    "register_many": "register",
+    "register_series_method": "register",
+    "register_series_ufunc": "register",
+    "registered_methods": "register",
+    "set_instrumentation": "register",
+    "register_series_accessor": "register",
+    "register_dataframe_method": "register",
+    "register_dataframe_accessor": "register",
+    "register_dataframe_groupby_accessor": "register",
+    "register_dataframe_groupby_method": "register",
+    "register_series_groupby_accessor": "register",
+    "register_series_groupby_method": "register",
+    "register_xarray_dataarray_method": "xarray",
+    "register_xarray_dataset_method": "xarray",
+    "MethodCallTracer": "tracing",
+    "SamplingProfiler": "profiling",
+    "MemoryTracker": "memory",
+    "MemoryGrowthWarning": "memory",
+    "SpanTracer": "otel",
+    "LazyFrame": "lazy",
+    "ResultCache": "cache",
+    "AsyncRunner": "asynchronous",
+    "call": "backends",
+    "DiskCache": "checkpoint",
+    "GroupingCache": "grouping",
+    "ChunkStream": "streaming",
+    "stream": "streaming",
+}
+
+_submodules = {
+    "accessors",
+    "aggregate",
+    "asynchronous",
+    "backends",
+    "cache",
+    "checkpoint",
+    "grouping",
+    "lazy",
+    "memory",
+    "mutation",
+    "otel",
+    "parallel",
+    "profiling",
+    "register",
+    "streaming",
+    "tracing",
+    "vectorize",
+    "xarray",
+}
 
 __all__ = [
+    "call_context",
+    "RegistrationBatch",
+    "register_many",
     "register_series_method",
+    "register_series_ufunc",
+    "registered_methods",
+    "set_instrumentation",
     "register_series_accessor",
     "register_dataframe_method",
     "register_dataframe_accessor",
@@ -26,4 +117,112 @@ __all__ = [
     "register_series_groupby_method",
     "register_xarray_dataarray_method",
     "register_xarray_dataset_method",
+    "MethodCallTracer",
+    "SamplingProfiler",
+    "MemoryTracker",
+    "MemoryGrowthWarning",
+    "SpanTracer",
+    "LazyFrame",
+    "ResultCache",
+    "DiskCache",
+    "GroupingCache",
+    "AsyncRunner",
+    "call",
+    "ChunkStream",
+    "stream",
 ]
+
+
+class _PandasImportHook:
+    """Import finder registering the `pf` accessor once pandas is imported.
+
+    It finds nothing itself: on the import of pandas, it removes itself from
+    `sys.meta_path` and wraps the loader found by the other finders.
+    """
+
+    def __init__(self):
+        self._loader = None
+
+    def find_spec(self, name: str, path=None, target=None):
+        """Wrap the loader of pandas.
+
+        Args:
+            name: The name of the module to import.
+            path: The search path of the parent package.
+            target: The module to reload, if any.
+
+        Returns:
+            The module spec of pandas, or None for other modules.
+        """
+        if name != "pandas":
+            return None
+        sys.meta_path.remove(self)
+        import importlib.util
+
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.loader is not None:
+            self._loader = spec.loader
+            spec.loader = self
+        return spec
+
+    def create_module(self, spec):
+        """Create the module with the loader of pandas.
+
+        Args:
+            spec: The module spec of pandas.
+
+        Returns:
+            The module, or None for the default module creation.
+        """
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        """Execute pandas, then register the `pf` accessor.
+
+        Args:
+            module: The pandas module.
+        """
+        spec = module.__spec__
+        spec.loader = module.__loader__ = self._loader
+        self._loader.exec_module(module)
+        # pandas imported by register, which imports accessors once done
+        if f"{__name__}.register" not in sys.modules:
+            importlib.import_module(f"{__name__}.accessors")
+
+
+if "pandas" in sys.modules:
+    importlib.import_module(f"{__name__}.accessors")
+else:
+    sys.meta_path.insert(0, _PandasImportHook())
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access.
+
+    Args:
+        name: The name of a public function, class or submodule.
+
+    Raises:
+        AttributeError: if pandas_flavor has no such attribute.
+
+    Returns:
+        The attribute.
+    """
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_lazy_attributes[name]}", __name__)
+    value = getattr(module, name)
+    # cache it, so that __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of the package, including the lazy ones.
+
+    Returns:
+        list: The attribute names.
+    """
+    return sorted(set(globals()) | set(_lazy_attributes) | _submodules)
@@ -0,0 +1,133 @@
+"""The `pf` namespace of pandas objects.
+
+Importing pandas_flavor registers a `pf` accessor on pandas objects
+that gives access to the pandas_flavor utilities working on them,
+e.g. `df.pf.lazy()`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pandas.api.extensions import (
+    register_dataframe_accessor,
+    register_series_accessor,
+)
+
+from .register import (
+    register_dataframe_groupby_accessor,
+    register_series_groupby_accessor,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from pandas.core.groupby.generic import DataFrameGroupBy
+
+    from .lazy import LazyFrame
+
+
+class _FlavorAccessor:
+    """pandas_flavor utilities common to DataFrames and Series.
+
+    Args:
+        pandas_obj: The pandas object.
+    """
+
+    def __init__(self, pandas_obj):
+        self._obj = pandas_obj
+
+    def lazy(self) -> LazyFrame:
+        """Start a lazy chain of registered method calls.
+
+        See `pandas_flavor.lazy`.
+
+        Returns:
+            LazyFrame: A lazy frame with an empty plan.
+        """
+        # imported here: pandas_flavor.lazy imports the register module,
+        # which imports this one
+        from .lazy import LazyFrame
+
+        return LazyFrame(self._obj)
+
+    async def acall(self, name: str, /, *args, **kwargs):
+        """Call a registered method in a worker thread, awaiting its result.
+
+        See `pandas_flavor.asynchronous`. Use an `AsyncRunner`
+        to choose the worker pool and the concurrency limit.
+
+        Args:
+            name: The name of the registered method.
+            *args: The arguments to pass to the method.
+            **kwargs: The keyword arguments to pass to the method.
+
+        Returns:
+            The result of the method.
+        """
+        from .asynchronous import default_runner
+
+        return await default_runner().call(self._obj, name, *args, **kwargs)
+
+
+@register_dataframe_accessor("pf")
+class DataFrameFlavorAccessor(_FlavorAccessor):
+    """pandas_flavor utilities for a DataFrame, available as `df.pf`.
+
+    Args:
+        pandas_obj: The pandas DataFrame.
+    """
+
+    def groupby(self, by, **options) -> DataFrameGroupBy:
+        """Group the DataFrame, reusing the grouping of previous calls.
+
+        See `pandas_flavor.grouping`.
+
+        Args:
+            by: A column label or a list of column labels.
+            **options: The `sort`, `dropna`, `observed`, `as_index`
+                and `group_keys` options of `DataFrame.groupby`.
+
+        Returns:
+            DataFrameGroupBy: The groupby object.
+        """
+        from .grouping import default_grouping_cache
+
+        return default_grouping_cache.groupby(self._obj, by, **options)
+
+
+@register_series_accessor("pf")
+class SeriesFlavorAccessor(_FlavorAccessor):
+    """pandas_flavor utilities for a Series, available as `s.pf`.
+
+    Args:
+        pandas_obj: The pandas Series.
+    """
+
+
+@register_dataframe_groupby_accessor("pf")
+@register_series_groupby_accessor("pf")
+class GroupByFlavorAccessor:
+    """pandas_flavor utilities for a groupby object, available as `grp.pf`.
+
+    Args:
+        groupby_obj: The DataFrameGroupBy or SeriesGroupBy.
+    """
+
+    def __init__(self, groupby_obj):
+        self._obj = groupby_obj
+
+    def multi(self, **calls) -> pd.DataFrame:
+        """Call several registered groupby methods, batching their reductions.
+
+        See `pandas_flavor.aggregate`.
+
+        Args:
+            **calls: output name -> the method name, or a tuple of the method
+                name and its positional arguments.
+
+        Returns:
+            pd.DataFrame: The results, one column per output name.
+        """
+        from .aggregate import multi
+
+        return multi(self._obj, **calls)
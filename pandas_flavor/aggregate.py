@@ -0,0 +1,170 @@
+"""Running several registered groupby aggregations together.
+
+Each registered groupby method reads its columns separately:
+
+    totals = grp.total_spent()
+    means = grp.mean_basket()
+
+A groupby method returning a single reduction of a column can declare it
+at registration, and `grp.pf.multi` then computes the declared reductions
+of all the requested methods together, with one grouped call per
+reduction over all the columns it applies to:
+
+    @pf.register_dataframe_groupby_method(agg=("amount", "sum"))
+    def total_spent(grp):
+        return grp["amount"].sum()
+
+    @pf.register_dataframe_groupby_method(agg=lambda column: (column, "mean"))
+    def average(grp, column):
+        return grp[column].mean()
+
+    grp.pf.multi(total=("total_spent",), basket=("average", "items"))
+
+The result is a DataFrame with one column per requested method,
+indexed by group. Methods without a declared reduction are called
+the regular way.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+from pandas.core.groupby.generic import DataFrameGroupBy
+
+from .binding import MethodSignature
+from .register import (
+    find_registered_method,
+    get_method_call_ctx_factory,
+    handle_pandas_extension_call,
+)
+
+
+def _parse_call(call) -> tuple:
+    """Split a requested call into the method name and its arguments.
+
+    Args:
+        call: A method name, or a tuple of a method name and its arguments.
+
+    Returns:
+        tuple: The method name and the tuple of arguments.
+    """
+    if isinstance(call, str):
+        return call, ()
+    name, *args = call
+    return name, tuple(args)
+
+
+def _reduction(registered, grp, args: tuple) -> tuple | None:
+    """Return the reduction a registered groupby method call amounts to.
+
+    Args:
+        registered: The registered method.
+        grp: The groupby object.
+        args: The arguments of the call.
+
+    Returns:
+        tuple: The column (None for SeriesGroupBy methods) and the name
+        of the reduction, or None if the method declares no reduction.
+    """
+    agg = registered.agg
+    if agg is None:
+        return None
+    if callable(agg):
+        agg = agg(*args)
+    if isinstance(grp, DataFrameGroupBy):
+        column, func = agg
+        return column, func
+    return None, agg
+
+
+def _reduce(grp, reductions: dict) -> dict:
+    """Compute reductions with one grouped call per reduction.
+
+    Args:
+        grp: The groupby object.
+        reductions: reduction name -> list of (output name, column).
+
+    Returns:
+        dict: output name -> result.
+    """
+    results = {}
+    for func, outputs in reductions.items():
+        if isinstance(grp, DataFrameGroupBy):
+            columns = list(dict.fromkeys(column for _, column in outputs))
+            reduced = getattr(grp[columns], func)()
+        else:
+            reduced = getattr(grp, func)()
+        for output, column in outputs:
+            if isinstance(reduced, pd.DataFrame):
+                results[output] = reduced[column]
+            else:
+                # e.g. size, which does not depend on the columns
+                results[output] = reduced
+    return results
+
+
+def multi(grp, **calls) -> pd.DataFrame:
+    """Call several registered groupby methods, batching their reductions.
+
+    Args:
+        grp: A DataFrameGroupBy or SeriesGroupBy grouped with `as_index=True`.
+        **calls: output name -> the method name, or a tuple of the method
+            name and its positional arguments.
+
+    Returns:
+        pd.DataFrame: The results of the methods, one column per output name.
+
+    Raises:
+        AttributeError: if a method is not registered for the groupby object.
+        ValueError: if the groupby object was grouped with `as_index=False`.
+    """
+    if not grp.as_index:
+        raise ValueError(
+            "multi requires groupby objects grouped with as_index=True; "
+            "reset the index of the result instead"
+        )
+    reductions = {}
+    others = {}
+    names = []
+    for output, call in calls.items():
+        name, args = _parse_call(call)
+        registered = find_registered_method(grp, name)
+        if registered is None:
+            raise AttributeError(
+                f"{name!r} is not a method registered with pandas_flavor "
+                f"for {type(grp).__name__}"
+            )
+        reduction = _reduction(registered, grp, args)
+        if reduction is None:
+            others[output] = (name, args)
+            continue
+        column, func = reduction
+        reductions.setdefault(func, []).append((output, column))
+        names.append(name)
+
+    results = {}
+    if reductions:
+
+        def batched(grp):
+            """Compute the declared reductions.
+
+            Args:
+                grp: The groupby object.
+
+            Returns:
+                dict: output name -> result.
+            """
+            return _reduce(grp, reductions)
+
+        batched.__name__ = "+".join(dict.fromkeys(names))
+        if get_method_call_ctx_factory() is None:
+            results.update(batched(grp))
+        else:
+            # traced as a single call of the batched methods
+            results.update(
+                handle_pandas_extension_call(
+                    batched, MethodSignature.from_callable(batched), grp, (), {}
+                )
+            )
+    for output, (name, args) in others.items():
+        results[output] = getattr(grp, name)(*args)
+    return pd.concat([results[output] for output in calls], axis=1, keys=list(calls))
@@ -0,0 +1,278 @@
+"""Asynchronous calls of registered methods.
+
+Calling a heavy registered method from a coroutine blocks the event loop.
+`df.pf.acall` runs it in a worker thread (or process) instead,
+so that one asyncio service can serve many DataFrame jobs at once:
+
+    result = await df.pf.acall("expensive_features", window=30)
+
+Calls go through an `AsyncRunner`, which owns the worker pool
+and limits the number of calls in flight:
+
+    runner = pf.AsyncRunner(max_workers=8, max_concurrency=32)
+    result = await runner.call(df, "expensive_features", window=30)
+
+The context of the calling task (e.g. a tracer installed with
+`pf.call_context`) applies to the call in the worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextvars
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from .register import (
+    find_registered_method,
+    get_method_call_ctx_factory,
+    handle_pandas_extension_call,
+)
+
+ENGINES = ("threads", "processes")
+
+
+def _call_registered(method, obj, name: str, args: tuple, kwargs: dict):
+    """Call a registered method by name.
+
+    This runs in the worker processes: unpickling `method` imports the
+    module registering it, which registers the method in the worker too.
+
+    Args:
+        method: The registered function.
+        obj: The object the method is called on.
+        name: The name of the method.
+        args: The arguments to pass to the method.
+        kwargs: The keyword arguments to pass to the method.
+
+    Returns:
+        The result of the method.
+    """
+    return getattr(obj, name)(*args, **kwargs)
+
+
+def _release(loop, semaphore, future):
+    """Release a slot of an event loop from the thread completing a call.
+
+    Args:
+        loop: The event loop of the semaphore.
+        semaphore: The semaphore holding the slot of the call.
+        future: The future of the completed call.
+    """
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        # the loop was closed while the call ran, e.g. at the end of
+        # asyncio.run: nothing waits for the slot anymore
+        pass
+
+
+class AsyncRunner:
+    """Run registered method calls in a worker pool, awaiting their results.
+
+    With the thread engine, the registered method is called the regular way
+    in a worker thread, within a copy of the context of the awaiting task,
+    so `call_context` and other context variables apply to it.
+    With the process engine, the object, arguments and result are pickled,
+    and the call is traced in the awaiting process.
+
+    A call cancelled before it starts never runs. A call that already
+    started cannot be interrupted: cancelling it only discards its result,
+    and it keeps its concurrency slot until it completes.
+
+    Args:
+        max_workers: The number of worker threads or processes,
+            `os.cpu_count()` by default.
+        engine: "threads" or "processes".
+        max_concurrency: The maximum number of calls submitted to the pool
+            at once, per event loop; further calls wait for a slot.
+            None for no limit (calls then queue in the pool).
+
+    Raises:
+        ValueError: if the engine is unknown or max_concurrency
+            is not positive.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        engine: str = "threads",
+        max_concurrency: int | None = None,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.engine = engine
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._threads = None
+        self._processes = None
+        # event loop -> semaphore limiting the calls in flight
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        """Return the worker threads, started on first use.
+
+        With the process engine, the threads wait for the processes
+        and run the tracing hook.
+
+        Returns:
+            The thread pool.
+        """
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="pandas_flavor"
+                )
+            return self._threads
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """Return the worker processes, started on first use.
+
+        Returns:
+            The process pool.
+        """
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(self.max_workers)
+            return self._processes
+
+    def _semaphore(self) -> asyncio.Semaphore | None:
+        """Return the semaphore limiting the calls of the running event loop.
+
+        Returns:
+            The semaphore, or None if the calls are not limited.
+        """
+        if self.max_concurrency is None:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def _call_in_process(self, registered, obj, name, args, kwargs):
+        """Call a method in a worker process, waiting for its result.
+
+        This runs in a worker thread, so that the call is traced
+        like a regular call.
+
+        Args:
+            registered: The registered method.
+            obj: The object the method is called on.
+            name: The name of the method.
+            args: The arguments to pass to the method.
+            kwargs: The keyword arguments to pass to the method.
+
+        Returns:
+            The result of the method.
+        """
+        pool = self._process_pool()
+
+        def process_call(obj, *args, **kwargs):
+            """Run the call in a worker process.
+
+            Args:
+                obj: The object the method is called on.
+                *args: The arguments to pass to the method.
+                **kwargs: The keyword arguments to pass to the method.
+
+            Returns:
+                The result of the method.
+            """
+            return pool.submit(
+                _call_registered, registered.method, obj, name, args, kwargs
+            ).result()
+
+        process_call.__name__ = name
+        if get_method_call_ctx_factory() is None:
+            return process_call(obj, *args, **kwargs)
+        return handle_pandas_extension_call(
+            process_call, registered.method_signature, obj, args, kwargs
+        )
+
+    async def call(self, obj, name: str, /, *args, **kwargs):
+        """Call a registered method in the worker pool.
+
+        Args:
+            obj: The object to call the method on.
+            name: The name of the registered method.
+            *args: The arguments to pass to the method.
+            **kwargs: The keyword arguments to pass to the method.
+
+        Returns:
+            The result of the method.
+
+        Raises:
+            AttributeError: if no method is registered under `name`
+                for the type of `obj`.
+        """
+        registered = find_registered_method(obj, name)
+        if registered is None:
+            raise AttributeError(
+                f"{name!r} is not a method registered with pandas_flavor "
+                f"for {type(obj).__name__}"
+            )
+        if self.engine == "threads":
+            func = partial(getattr(obj, name), *args, **kwargs)
+        else:
+            func = partial(self._call_in_process, registered, obj, name, args, kwargs)
+        context = contextvars.copy_context()
+
+        semaphore = self._semaphore()
+        if semaphore is None:
+            future = self._thread_pool().submit(context.run, func)
+            return await asyncio.wrap_future(future)
+
+        await semaphore.acquire()
+        try:
+            future = self._thread_pool().submit(context.run, func)
+        except BaseException:
+            semaphore.release()
+            raise
+        # the slot is held until the call completes, even if cancelled
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(partial(_release, loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the worker pools.
+
+        Args:
+            wait: Whether to wait for the running calls to complete.
+        """
+        with self._lock:
+            pools = [pool for pool in (self._threads, self._processes) if pool]
+            self._threads = self._processes = None
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_default_runner = None
+_default_runner_lock = threading.Lock()
+
+
+def default_runner() -> AsyncRunner:
+    """Return the runner of `df.pf.acall`, a thread runner created on first use.
+
+    Returns:
+        AsyncRunner: The default runner.
+    """
+    global _default_runner
+    with _default_runner_lock:
+        if _default_runner is None:
+            _default_runner = AsyncRunner()
+        return _default_runner
+
+
+@atexit.register
+def _shutdown_default_runner():
+    """Shut down the default runner."""
+    if _default_runner is not None:
+        _default_runner.shutdown(wait=False)
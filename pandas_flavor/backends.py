@@ -0,0 +1,224 @@
+"""Calling registered methods on Arrow tables and Polars frames.
+
+Registered DataFrame and Series methods can be called on pyarrow and Polars
+data with `pf.call`, which dispatches on the type of the object:
+
+    @pf.register_dataframe_method
+    def positive(df, column):
+        return df[df[column] > 0]
+
+    @positive.register_impl("polars")
+    def _(df, column):
+        return df.filter(pl.col(column) > 0)
+
+    pf.call(polars_df, "positive", "x")    # the Polars implementation
+    pf.call(arrow_table, "positive", "x")  # the pandas one, see below
+
+When no implementation is registered for the backend of the object,
+it is converted to a pandas object backed by the same Arrow memory
+(`pd.ArrowDtype` columns, without copying), the pandas method is called,
+and DataFrame and Series results are converted back to the backend.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from .register import (
+    find_registered_method,
+    get_method_call_ctx_factory,
+    handle_pandas_extension_call,
+)
+
+BACKENDS = ("pyarrow", "polars")
+
+
+def backend_of(obj) -> str:
+    """Return the name of the library an object comes from.
+
+    The type of the object is inspected without importing any library.
+
+    Args:
+        obj: The object.
+
+    Returns:
+        str: "pandas", "pyarrow", "polars" or the top-level module
+        of the type of the object.
+    """
+    return type(obj).__module__.partition(".")[0]
+
+
+def _pandas_class(obj, backend: str) -> type:
+    """Return the pandas class an object of another backend converts to.
+
+    Args:
+        obj: The object.
+        backend: The backend of the object.
+
+    Returns:
+        type: `pd.DataFrame` or `pd.Series`.
+
+    Raises:
+        TypeError: if the object is not a frame or a series of a known backend.
+    """
+    # the backend is already imported, since obj is one of its objects
+    if backend == "pyarrow":
+        import pyarrow as pa
+
+        if isinstance(obj, (pa.Table, pa.RecordBatch)):
+            return pd.DataFrame
+        if isinstance(obj, (pa.Array, pa.ChunkedArray)):
+            return pd.Series
+    elif backend == "polars":
+        import polars as pl
+
+        if isinstance(obj, pl.DataFrame):
+            return pd.DataFrame
+        if isinstance(obj, pl.Series):
+            return pd.Series
+    raise TypeError(
+        f"registered methods cannot be called on {type(obj).__name__} objects"
+    )
+
+
+def to_pandas(obj, backend: str):
+    """Convert a pyarrow or Polars object to an Arrow-backed pandas object.
+
+    The columns of the result are `pd.ArrowDtype` arrays wrapping the Arrow
+    memory of the object, so the conversion does not copy the data.
+
+    Args:
+        obj: The table, record batch, array, DataFrame or Series.
+        backend: "pyarrow" or "polars".
+
+    Returns:
+        The pandas DataFrame or Series.
+    """
+    if backend == "polars":
+        return obj.to_pandas(use_pyarrow_extension_array=True)
+    if _pandas_class(obj, backend) is pd.Series:
+        return pd.Series(pd.arrays.ArrowExtensionArray(obj), copy=False)
+    return obj.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _has_named_index(obj) -> bool:
+    """Return whether the index of a pandas object holds values to keep.
+
+    Args:
+        obj: A pandas DataFrame or Series.
+
+    Returns:
+        bool: Whether the index is named or is a `MultiIndex`.
+    """
+    index = obj.index
+    return isinstance(index, pd.MultiIndex) or index.name is not None
+
+
+def from_pandas(result, backend: str):
+    """Convert a pandas result back to a backend.
+
+    Arrow and Polars objects have no index: named indexes and
+    MultiIndexes (e.g. the keys of a groupby, or the values counted by
+    `value_counts`) become columns, so Series with such an index become
+    two-column tables, or Polars DataFrames. Other indexes, such as the
+    row labels left by a filter, are dropped.
+    Results that are not DataFrames or Series are returned unchanged.
+
+    Args:
+        result: The result of a pandas method.
+        backend: "pyarrow" or "polars".
+
+    Returns:
+        The converted result.
+    """
+    if not isinstance(result, (pd.DataFrame, pd.Series)):
+        return result
+    import pyarrow as pa
+
+    if isinstance(result, pd.Series) and not _has_named_index(result):
+        # Arrow-backed values are passed through without copying
+        array = pa.chunked_array(pa.array(result))
+        if backend == "polars":
+            import polars as pl
+
+            return pl.Series(result.name, array)
+        return array
+    if isinstance(result, pd.Series):
+        result = result.to_frame().reset_index()
+    elif _has_named_index(result):
+        result = result.reset_index()
+    table = pa.Table.from_pandas(result, preserve_index=False)
+    if backend == "polars":
+        import polars as pl
+
+        return pl.from_arrow(table)
+    return table
+
+
+def _call_impl(impl, registered, obj, args, kwargs):
+    """Call a backend implementation, traced like the pandas method.
+
+    Args:
+        impl: The backend implementation.
+        registered: The registered method.
+        obj: The object the method is called on.
+        args: The arguments to pass to the method.
+        kwargs: The keyword arguments to pass to the method.
+
+    Returns:
+        The result of the implementation.
+    """
+    if get_method_call_ctx_factory() is None:
+        return impl(obj, *args, **kwargs)
+
+    def backend_method(obj, *args, **kwargs):
+        """Call the backend implementation.
+
+        Args:
+            obj: The object the method is called on.
+            *args: The arguments to pass to the implementation.
+            **kwargs: The keyword arguments to pass to the implementation.
+
+        Returns:
+            The result of the implementation.
+        """
+        return impl(obj, *args, **kwargs)
+
+    backend_method.__name__ = registered.name
+    return handle_pandas_extension_call(
+        backend_method, registered.method_signature, obj, args, kwargs
+    )
+
+
+def call(obj, name: str, /, *args, **kwargs):
+    """Call a registered method on a pandas, pyarrow or Polars object.
+
+    Args:
+        obj: A pandas DataFrame or Series, a pyarrow Table, RecordBatch,
+            Array or ChunkedArray, or a Polars DataFrame or Series.
+        name: The name of the registered method.
+        *args: The arguments to pass to the method.
+        **kwargs: The keyword arguments to pass to the method.
+
+    Returns:
+        The result of the implementation registered for the backend
+        of the object, or of the pandas method converted back to the backend.
+
+    Raises:
+        TypeError: if the object is of an unsupported type.
+        AttributeError: if no method is registered under `name`.
+    """
+    backend = backend_of(obj)
+    if backend == "pandas":
+        return getattr(obj, name)(*args, **kwargs)
+    cls = _pandas_class(obj, backend)
+    registered = find_registered_method(cls, name)
+    if registered is None:
+        raise AttributeError(
+            f"{name!r} is not a method registered with pandas_flavor for {cls.__name__}"
+        )
+    impl = registered.impls.get(backend)
+    if impl is not None:
+        return _call_impl(impl, registered, obj, args, kwargs)
+    result = getattr(to_pandas(obj, backend), name)(*args, **kwargs)
+    return from_pandas(result, backend)
@@ -0,0 +1,178 @@
+"""Fast argument binding for registered methods.
+
+Method call contexts and result caches bind the arguments of each call
+to the signature of the registered method. `inspect.Signature.bind`
+walks all the parameters in Python on every call, which dominates the
+cost of a traced call for methods with many parameters.
+
+`MethodSignature` is the `inspect.Signature` handed to method call contexts.
+It precomputes a binding plan when the method is registered
+and binds the common calls with a few dict operations,
+falling back to `inspect.Signature.bind` for the others
+(and to report binding errors).
+"""
+
+from __future__ import annotations
+
+import inspect
+
+_PLANNED_KINDS = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+
+class _BoundArguments(inspect.BoundArguments):
+    """Arguments bound by the fast path of `MethodSignature.bind`."""
+
+    __slots__ = ()
+
+    def apply_defaults(self):
+        """Set the default values of the missing arguments."""
+        if len(self.arguments) < len(self._signature._defaults):
+            arguments = self._signature._defaults.copy()
+            arguments.update(self.arguments)
+            self.arguments = arguments
+
+
+class MethodSignature(inspect.Signature):
+    """The signature of a registered method, with a fast `bind`.
+
+    Signatures with only positional-or-keyword and keyword-only parameters
+    are bound by the fast path; signatures with positional-only, `*args`
+    or `**kwargs` parameters use `inspect.Signature.bind`.
+    """
+
+    __slots__ = (
+        "_planned",
+        "_names",
+        "_positional",
+        "_n_required",
+        "_required_keywords",
+        "_defaults",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        parameters = self.parameters.values()
+        empty = inspect.Parameter.empty
+        self._planned = all(
+            parameter.kind in _PLANNED_KINDS for parameter in parameters
+        )
+        self._names = frozenset(self.parameters)
+        self._positional = tuple(
+            parameter.name
+            for parameter in parameters
+            if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+        )
+        # parameters without defaults come first among positional parameters
+        self._n_required = sum(
+            parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+            and parameter.default is empty
+            for parameter in parameters
+        )
+        self._required_keywords = frozenset(
+            parameter.name
+            for parameter in parameters
+            if parameter.kind == inspect.Parameter.KEYWORD_ONLY
+            and parameter.default is empty
+        )
+        # every parameter in order, with its default, or None if required:
+        # updated with the bound arguments, it keeps the parameter order
+        self._defaults = {
+            parameter.name: None if parameter.default is empty else parameter.default
+            for parameter in parameters
+        }
+
+    @classmethod
+    def from_callable(cls, method, **kwargs) -> MethodSignature:
+        """Compute the signature of a method.
+
+        Args:
+            method: The method.
+            **kwargs: The options of `inspect.signature`.
+
+        Returns:
+            MethodSignature: The signature.
+        """
+        signature = inspect.signature(method, **kwargs)
+        return cls(
+            signature.parameters.values(),
+            return_annotation=signature.return_annotation,
+            __validate_parameters__=False,
+        )
+
+    def _fits_plan(self, args: tuple, kwargs: dict) -> bool:
+        """Whether the fast path binds a call.
+
+        Args:
+            args: The positional arguments, starting with the object.
+            kwargs: The keyword arguments.
+
+        Returns:
+            bool: True if the arguments match the signature
+            and the signature has a binding plan.
+        """
+        n_args = len(args)
+        if not self._planned or n_args > len(self._positional):
+            return False
+        if not kwargs:
+            return n_args >= self._n_required and not self._required_keywords
+        keywords = kwargs.keys()
+        return (
+            keywords <= self._names
+            and keywords.isdisjoint(self._positional[:n_args])
+            and self._required_keywords <= keywords
+            and all(
+                name in kwargs for name in self._positional[n_args : self._n_required]
+            )
+        )
+
+    def bind(self, /, *args, **kwargs) -> inspect.BoundArguments:
+        """Bind arguments to the parameters of the method.
+
+        Args:
+            *args: The positional arguments, starting with the object.
+            **kwargs: The keyword arguments.
+
+        Returns:
+            inspect.BoundArguments: The bound arguments.
+
+        Raises:
+            TypeError: if the arguments do not match the signature.
+        """
+        if not self._fits_plan(args, kwargs):
+            return super().bind(*args, **kwargs)
+        arguments = dict(zip(self._positional, args))
+        if kwargs:
+            arguments.update(kwargs)
+            # in parameter order, as inspect.Signature.bind does
+            arguments = {
+                name: arguments[name] for name in self._defaults if name in arguments
+            }
+        return _BoundArguments(self, arguments)
+
+    def normalize(self, args: tuple, kwargs: dict) -> dict:
+        """Bind arguments and apply the defaults of the missing ones.
+
+        This is `bind(*args, **kwargs)` followed by `apply_defaults()`,
+        without creating the intermediate BoundArguments.
+
+        Args:
+            args: The positional arguments, starting with the object.
+            kwargs: The keyword arguments.
+
+        Returns:
+            dict: The value of every parameter, in parameter order.
+
+        Raises:
+            TypeError: if the arguments do not match the signature.
+        """
+        if not self._fits_plan(args, kwargs):
+            bound = super().bind(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+        arguments = self._defaults.copy()
+        arguments.update(zip(self._positional, args))
+        arguments.update(kwargs)
+        return arguments
@@ -0,0 +1,330 @@
+"""Memoization of pure registered methods.
+
+Methods registered with `pure=True` (or with an explicit `cache=`)
+are called through a `ResultCache`, which returns the previous result
+when the method is called again on the same, unmodified object
+with the same arguments:
+
+    @pf.register_dataframe_method(pure=True)
+    def summarize(df, by):
+        ...
+
+    df.summarize(by="a")  # computed
+    df.summarize("a")  # same arguments once bound: served from the cache
+
+Results are keyed on the identity of the object,
+a fingerprint of its content and the arguments of the call
+normalized with the method signature (defaults applied).
+Modifying the object changes its fingerprint, so stale results
+are never returned.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import inspect
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+from .binding import MethodSignature
+from .mutation import copy_on_write_enabled
+from .tracing import _memory_usage
+
+
+def _freeze(value):
+    """Make an argument value hashable.
+
+    Lists, dicts and sets are converted to tagged tuples,
+    so that e.g. a list of column names can be part of a cache key.
+    Other values are paired with their type, since values of different
+    types can be equal (e.g. 1, 1.0 and True) but give different results.
+
+    Args:
+        value: The argument value.
+
+    Returns:
+        A hashable equivalent of the value.
+    """
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(item) for item in value))
+    if isinstance(value, tuple):
+        return ("tuple", tuple(_freeze(item) for item in value))
+    if isinstance(value, dict):
+        return (
+            "dict",
+            tuple((_freeze(key), _freeze(item)) for key, item in value.items()),
+        )
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_freeze(item) for item in value))
+    return type(value), value
+
+
+def _copy_result(result):
+    """Copy a cached result, so that modifying it leaves the cache untouched.
+
+    Args:
+        result: The cached result.
+
+    Returns:
+        A copy of DataFrames, Series, NumPy arrays, lists, dicts and sets,
+        other results unchanged.
+    """
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        # with copy-on-write, a new object sharing the cached data:
+        # modifying it in place leaves the cached result untouched
+        return result.copy(deep=not copy_on_write_enabled())
+    if isinstance(result, np.ndarray):
+        return result.copy()
+    if isinstance(result, (list, dict, set)):
+        # shallow copies: the items themselves are shared
+        return copy.copy(result)
+    return result
+
+
+def content_fingerprint(obj):
+    """Return a fingerprint of the content of a DataFrame or Series.
+
+    The fingerprint covers the values and the index
+    (via `pandas.util.hash_pandas_object`), the column names or Series name
+    and the dtypes, so any modification of the object changes it,
+    including reordering its rows.
+
+    Args:
+        obj: A pandas DataFrame or Series.
+
+    Returns:
+        A hashable fingerprint.
+
+    Raises:
+        TypeError: if obj is neither a DataFrame nor a Series,
+            or holds unhashable values.
+    """
+    # a digest of the row hashes in order, unlike their sum
+    values = hashlib.blake2b(
+        pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes(),
+        digest_size=16,
+    ).hexdigest()
+    if isinstance(obj, pd.DataFrame):
+        return values, obj.shape, tuple(obj.columns), tuple(obj.dtypes)
+    if isinstance(obj, pd.Series):
+        return values, obj.shape, obj.name, obj.dtype
+    raise TypeError(f"cannot fingerprint {type(obj).__name__}")
+
+
+def _signature_getter(method_signature):
+    """Return a function returning the `MethodSignature` of a method.
+
+    Args:
+        method_signature: The signature of the method, or the
+            `RegisteredMethod`, whose signature is then only computed
+            on the first call of the returned function.
+
+    Returns:
+        callable: The function, without arguments.
+    """
+    if isinstance(method_signature, MethodSignature):
+        return lambda: method_signature
+    if isinstance(method_signature, inspect.Signature):
+        method_signature = MethodSignature(
+            method_signature.parameters.values(),
+            return_annotation=method_signature.return_annotation,
+        )
+        return lambda: method_signature
+    registered = method_signature
+    return lambda: registered.method_signature
+
+
+def _result_nbytes(result) -> int:
+    """Return an estimate of the memory used by a cached result.
+
+    Args:
+        result: The cached result.
+
+    Returns:
+        int: The number of bytes.
+    """
+    nbytes = _memory_usage(result)
+    return nbytes if nbytes >= 0 else sys.getsizeof(result)
+
+
+class ResultCache:
+    """LRU cache of registered method results.
+
+    Args:
+        maxsize: The maximum number of cached results.
+        max_bytes: The maximum total memory usage of the cached results,
+            or None for no limit. Results larger than this are not cached.
+        fingerprint: The function computing the fingerprint of the object
+            a method is called on, `content_fingerprint` by default.
+            It may raise TypeError for objects it cannot fingerprint,
+            in which case the call is not cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        max_bytes: int | None = None,
+        fingerprint=content_fingerprint,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        """Drop all cached results and reset the statistics."""
+        with self._lock:
+            # key -> (weak reference to the object, result, nbytes)
+            self._entries = OrderedDict()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = self._uncacheable = 0
+
+    def stats(self) -> dict:
+        """Return the cache statistics.
+
+        Returns:
+            dict: The number of hits, misses, evictions and uncacheable calls,
+            the number of cached results and their total size in bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "uncacheable": self._uncacheable,
+                "entries": len(self._entries),
+                "bytes": self._nbytes,
+            }
+
+    def __len__(self):
+        """Return the number of cached results.
+
+        Returns:
+            int: The number of cached results.
+        """
+        return len(self._entries)
+
+    def _key(self, method, method_signature, obj, args, kwargs):
+        """Compute the cache key of a call.
+
+        Args:
+            method: The registered method.
+            method_signature: The `MethodSignature` of the method.
+            obj: The object the method is called on.
+            args: The arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            The key, or None if the call cannot be cached.
+        """
+        try:
+            arguments = method_signature.normalize((obj, *args), kwargs)
+            arguments = tuple(
+                (name, _freeze(value)) for name, value in list(arguments.items())[1:]
+            )
+            key = (method, id(obj), self.fingerprint(obj), arguments)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _remove(self, key):
+        """Remove an entry, if still present.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._nbytes -= entry[2]
+
+    def _store(self, key, obj, result):
+        """Store a result, evicting the least recently used ones if needed.
+
+        Args:
+            key: The key of the call.
+            obj: The object the method was called on.
+            result: The result of the call.
+        """
+        nbytes = _result_nbytes(result)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        # entries of collected objects can never be hit again
+        ref = weakref.ref(obj, lambda _, key=key: self._remove(key))
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (ref, result, nbytes)
+            self._nbytes += nbytes
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes
+            ):
+                _, (_, _, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self._evictions += 1
+
+    def wrap(self, method, method_signature):
+        """Wrap a registered method so that its results are cached.
+
+        Args:
+            method: The registered method.
+            method_signature: The signature of the method, or the
+                `RegisteredMethod`, whose signature is then computed
+                on the first call.
+
+        Returns:
+            callable: The caching function.
+        """
+        get_signature = _signature_getter(method_signature)
+
+        @wraps(method)
+        def cached_method(obj, *args, **kwargs):
+            """Call the method, or return its cached result.
+
+            Args:
+                obj: The object the method is called on.
+                *args: The arguments to pass to the method.
+                **kwargs: The keyword arguments to pass to the method.
+
+            Returns:
+                The result of the method.
+            """
+            try:
+                key = self._key(method, get_signature(), obj, args, kwargs)
+                weakref.ref(obj)
+            except TypeError:
+                key = None
+            if key is None:
+                with self._lock:
+                    self._uncacheable += 1
+                return method(obj, *args, **kwargs)
+
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0]() is obj:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    result = entry[1]
+                else:
+                    self._misses += 1
+                    entry = None
+            if entry is None:
+                result = method(obj, *args, **kwargs)
+                self._store(key, obj, result)
+            return _copy_result(result)
+
+        return cached_method
+
+
+# The cache used by methods registered with `pure=True` and no explicit cache.
+default_cache = ResultCache()
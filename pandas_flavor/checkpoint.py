@@ -0,0 +1,465 @@
+"""Persistent cache of registered method results.
+
+Registered methods given a `DiskCache` store their results in a local
+directory, so that re-running a pipeline after a failure, or in the next
+nightly job, reloads the steps that already completed instead of
+recomputing them:
+
+    checkpoints = pf.DiskCache("~/.cache/pipeline", max_bytes=20 * 2**30)
+
+    @pf.register_dataframe_method(cache=checkpoints)
+    def expensive_features(df, window=30):
+        ...
+
+Results are keyed on a fingerprint of the content of the object
+(see `pandas_flavor.cache.content_fingerprint`), a hash of the source
+code of the method and the arguments of the call. DataFrame and Series
+results are stored as uncompressed Arrow IPC (Feather V2) files; other
+results are pickled. With `mmap=True`, stored DataFrames and Series are
+memory-mapped, so that numeric columns without missing values are not
+copied into memory, but are read-only.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+import warnings
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+from .cache import _freeze, _signature_getter, content_fingerprint
+
+_ARROW_SUFFIX = ".arrow"
+_PICKLE_SUFFIX = ".pkl"
+
+# schema metadata marking the tables storing a Series, holding its name
+_SERIES_KEY = b"pandas_flavor.series_name"
+_SERIES_COLUMN = "__series__"
+# schema metadata holding the column index of a DataFrame, whose type
+# (e.g. RangeIndex) and attributes (e.g. freq) Arrow does not keep
+_COLUMNS_KEY = b"pandas_flavor.columns"
+
+
+# argument values represented by their repr, which identifies them in every process
+_REPR_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+def _digest(data: bytes) -> str:
+    """Return a digest of bytes.
+
+    Args:
+        data: The bytes.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _stable(value):
+    """Make a frozen argument value representable the same way in every process.
+
+    Sets are represented in an order that depends on the hash seed
+    of the process: their items are sorted by representation.
+    NumPy arrays and pandas objects are represented by a digest of their
+    content, as their repr elides the values of large objects.
+
+    Args:
+        value: The argument value, frozen with `_freeze`.
+
+    Returns:
+        A value whose representation does not depend on the process.
+
+    Raises:
+        TypeError: if the value has no such representation, e.g. objects
+            represented by their address or arrays of Python objects.
+    """
+    if isinstance(value, _REPR_TYPES):
+        return value
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, tuple):
+        return tuple(_stable(item) for item in value)
+    if isinstance(value, frozenset):
+        return ("frozenset", tuple(sorted(repr(_stable(item)) for item in value)))
+    if isinstance(value, np.generic) and not isinstance(value, np.object_):
+        return ("numpy", value.dtype.str, value.item())
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            # the bytes of object arrays are addresses
+            raise TypeError("cannot represent arrays of Python objects")
+        data = np.ascontiguousarray(value).tobytes()
+        return ("ndarray", value.dtype.str, value.shape, _digest(data))
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return (type(value).__name__, repr(content_fingerprint(value)))
+    if isinstance(value, pd.Index):
+        digest = _digest(pd.util.hash_pandas_object(value).to_numpy().tobytes())
+        return ("Index", str(value.dtype), tuple(value.names), digest)
+    raise TypeError(f"cannot represent {type(value).__name__} arguments")
+
+
+def source_hash(method) -> str:
+    """Return a hash of the source code of a method.
+
+    Wrappers (made with `functools.wraps`) are unwrapped first.
+    Only the code of the method itself is hashed, not the code it calls.
+
+    Args:
+        method: The method.
+
+    Returns:
+        str: The hash, of the bytecode if the source is not available.
+    """
+    method = inspect.unwrap(method)
+    try:
+        source = inspect.getsource(method).encode()
+    except (OSError, TypeError):
+        code = method.__code__
+        source = code.co_code + repr(code.co_consts).encode()
+    return hashlib.sha256(source).hexdigest()
+
+
+def _write_arrow(path: str, result):
+    """Write a DataFrame or Series as an Arrow IPC file.
+
+    Args:
+        path: The path of the file.
+        result: The DataFrame or Series.
+
+    Raises:
+        Exception: if the result cannot be converted to Arrow.
+    """
+    import pyarrow as pa
+
+    metadata = {}
+    if isinstance(result, pd.Series):
+        metadata[_SERIES_KEY] = pickle.dumps(result.name)
+        result = result.to_frame(_SERIES_COLUMN)
+    else:
+        metadata[_COLUMNS_KEY] = pickle.dumps(result.columns)
+    table = pa.Table.from_pandas(result)
+    table = table.replace_schema_metadata({**table.schema.metadata, **metadata})
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_arrow(path: str, mmap: bool = False):
+    """Read a DataFrame or Series from an Arrow IPC file.
+
+    Args:
+        path: The path of the file.
+        mmap: Whether to memory-map the file. Numeric columns without
+            missing values are then read-only views of the file,
+            otherwise all columns are writable copies.
+
+    Returns:
+        The DataFrame or Series.
+    """
+    import pyarrow as pa
+
+    if mmap:
+        # the table keeps the mapping alive as long as the data uses it
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        # one block per column: numeric columns without nulls are zero-copy
+        result = table.to_pandas(split_blocks=True)
+    else:
+        table = pa.ipc.open_file(path).read_all()
+        # consolidating the blocks copies Arrow's immutable buffers
+        result = table.to_pandas()
+    metadata = table.schema.metadata or {}
+    if _SERIES_KEY in metadata:
+        result = result[_SERIES_COLUMN].rename(pickle.loads(metadata[_SERIES_KEY]))
+    elif _COLUMNS_KEY in metadata:
+        result.columns = pickle.loads(metadata[_COLUMNS_KEY])
+    return result
+
+
+class DiskCache:
+    """Persistent cache of registered method results in a local directory.
+
+    Unlike `ResultCache`, results are not tied to the identity of the
+    object: any object with the same content, e.g. the same input data
+    loaded again by a new process, hits the results stored by a previous run.
+
+    Args:
+        directory: The directory storing the results, created if needed.
+            It should only be used by pandas_flavor caches.
+        max_bytes: The maximum total size of the stored results,
+            or None for no limit. The least recently used results are
+            deleted first; results larger than this are not stored.
+        fingerprint: The function computing the fingerprint of the object
+            a method is called on, `content_fingerprint` by default.
+            Its representation must identify the content across processes.
+        mmap: Whether DataFrame and Series results are memory-mapped
+            from the stored files instead of read into memory.
+            Their numeric columns without missing values are then read-only,
+            whether the result was just computed or stored by a previous call.
+    """
+
+    def __init__(
+        self,
+        directory,
+        max_bytes: int | None = None,
+        fingerprint=content_fingerprint,
+        mmap: bool = False,
+    ):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+        self.mmap = mmap
+        self._lock = threading.Lock()
+        self._source_hashes = {}
+        self._hits = self._misses = self._evictions = self._uncacheable = 0
+
+    def _entries(self) -> list:
+        """List the stored results.
+
+        Returns:
+            list: The `os.DirEntry` of each stored result.
+        """
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith((_ARROW_SUFFIX, _PICKLE_SUFFIX))
+        ]
+
+    def clear(self):
+        """Delete all stored results and reset the statistics."""
+        with self._lock:
+            for entry in self._entries():
+                os.remove(entry.path)
+            self._hits = self._misses = self._evictions = self._uncacheable = 0
+
+    def stats(self) -> dict:
+        """Return the cache statistics.
+
+        Returns:
+            dict: The number of hits, misses, evictions and uncacheable calls
+            of this cache object, the number of stored results
+            and their total size in bytes.
+        """
+        entries = self._entries()
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "uncacheable": self._uncacheable,
+                "entries": len(entries),
+                "bytes": sum(entry.stat().st_size for entry in entries),
+            }
+
+    def __len__(self):
+        """Return the number of stored results.
+
+        Returns:
+            int: The number of stored results.
+        """
+        return len(self._entries())
+
+    def _key(self, method, method_signature, obj, args, kwargs):
+        """Compute the cache key of a call.
+
+        Args:
+            method: The registered method.
+            method_signature: The `MethodSignature` of the method.
+            obj: The object the method is called on.
+            args: The arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            str: The key, or None if the call cannot be cached.
+        """
+        source = self._source_hashes.get(method)
+        if source is None:
+            source = self._source_hashes[method] = source_hash(method)
+        try:
+            arguments = method_signature.normalize((obj, *args), kwargs)
+            arguments = tuple(
+                (name, _stable(_freeze(value)))
+                for name, value in list(arguments.items())[1:]
+            )
+            token = repr(
+                (
+                    method.__module__,
+                    method.__qualname__,
+                    source,
+                    self.fingerprint(obj),
+                    arguments,
+                )
+            )
+        except TypeError:
+            return None
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _load(self, key: str):
+        """Load a stored result.
+
+        Args:
+            key: The key of the call.
+
+        Returns:
+            tuple: Whether the result was found, and the result.
+        """
+        path = os.path.join(self.directory, key)
+        for suffix in (_ARROW_SUFFIX, _PICKLE_SUFFIX):
+            try:
+                if suffix == _ARROW_SUFFIX:
+                    result = _read_arrow(path + suffix, self.mmap)
+                else:
+                    with open(path + suffix, "rb") as file:
+                        result = pickle.load(file)
+            except FileNotFoundError:
+                continue
+            except Exception as error:
+                # e.g. truncated by a crash or a full disk: computed again
+                warnings.warn(f"unreadable result ignored in {self.directory}: {error}")
+                try:
+                    os.remove(path + suffix)
+                except FileNotFoundError:
+                    pass
+                continue
+            try:
+                # the modification time orders the results for eviction
+                os.utime(path + suffix)
+            except FileNotFoundError:
+                # evicted meanwhile
+                pass
+            return True, result
+        return False, None
+
+    def _store(self, key: str, result):
+        """Store a result, deleting the least recently used ones if needed.
+
+        The result is written to a temporary file first, so that
+        concurrent readers never see a partially written result.
+
+        Args:
+            key: The key of the call.
+            result: The result of the call.
+
+        Returns:
+            str: The path of the stored result, or None if it was not stored.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        suffix = _PICKLE_SUFFIX
+        try:
+            if isinstance(result, (pd.DataFrame, pd.Series)):
+                try:
+                    _write_arrow(tmp_path, result)
+                    suffix = _ARROW_SUFFIX
+                except Exception:
+                    # e.g. columns of mixed Python objects
+                    pass
+            if suffix == _PICKLE_SUFFIX:
+                with open(tmp_path, "wb") as file:
+                    pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmp_path)
+            if self.max_bytes is not None and size > self.max_bytes:
+                os.remove(tmp_path)
+                return None
+            path = os.path.join(self.directory, key + suffix)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            warnings.warn(f"result not stored in {self.directory}: {error}")
+            return None
+        if self.max_bytes is not None:
+            self._evict()
+        return path
+
+    def _evict(self):
+        """Delete the least recently used results over `max_bytes`."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            with self._lock:
+                self._evictions += 1
+
+    def wrap(self, method, method_signature):
+        """Wrap a registered method so that its results are stored on disk.
+
+        Args:
+            method: The registered method.
+            method_signature: The signature of the method, or the
+                `RegisteredMethod`, whose signature is then computed
+                on the first call.
+
+        Returns:
+            callable: The caching function.
+        """
+        get_signature = _signature_getter(method_signature)
+
+        @wraps(method)
+        def cached_method(obj, *args, **kwargs):
+            """Call the method, or load its stored result.
+
+            Args:
+                obj: The object the method is called on.
+                *args: The arguments to pass to the method.
+                **kwargs: The keyword arguments to pass to the method.
+
+            Returns:
+                The result of the method.
+            """
+            key = self._key(method, get_signature(), obj, args, kwargs)
+            if key is None:
+                with self._lock:
+                    self._uncacheable += 1
+                return method(obj, *args, **kwargs)
+
+            found, result = self._load(key)
+            with self._lock:
+                if found:
+                    self._hits += 1
+                else:
+                    self._misses += 1
+            if not found:
+                result = method(obj, *args, **kwargs)
+                path = self._store(key, result)
+                if self.mmap and path is not None and path.endswith(_ARROW_SUFFIX):
+                    # read-only like the results of later calls
+                    try:
+                        result = _read_arrow(path, mmap=True)
+                    except FileNotFoundError:
+                        # evicted meanwhile
+                        pass
+            return result
+
+        return cached_method
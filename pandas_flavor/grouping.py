@@ -0,0 +1,268 @@
+"""Reusing the grouping of a DataFrame across groupby calls.
+
+Every `df.groupby("k")` factorizes the key columns again, even when the
+same DataFrame was grouped by the same keys just before. `df.pf.groupby`
+returns groupby objects sharing the grouping computed the first time,
+so a feature-engineering job calling dozens of registered groupby methods
+on the same keys factorizes them once:
+
+    grp = df.pf.groupby("customer_id")
+    grp.recency()
+    df.pf.groupby("customer_id").frequency()  # reuses the codes of the keys
+
+Groupings are kept in a `GroupingCache`, keyed on the identity of the
+DataFrame, the keys and the grouping options. A grouping is dropped when
+its DataFrame is garbage collected, and recomputed when the key columns
+or the index of the DataFrame are modified or replaced.
+Without Copy-on-Write (pandas < 3), key columns can be modified in place,
+so the groupings are also validated against a digest of their values.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+import pandas as pd
+from pandas.core.groupby.generic import DataFrameGroupBy
+from pandas.core.groupby.grouper import get_grouper
+
+from .mutation import copy_on_write_enabled
+
+
+def _same_values(a, b) -> bool:
+    """Whether two arrays of a column are the same data.
+
+    NumPy-backed columns return a new view of their block on every access,
+    so views of the same memory with the same layout are the same data.
+
+    Args:
+        a: The values of the column when the grouping was computed.
+        b: The current values of the column.
+
+    Returns:
+        bool: True if the column holds the same data.
+    """
+    if a is b:
+        return True
+    return (
+        isinstance(a, np.ndarray)
+        and isinstance(b, np.ndarray)
+        and a.__array_interface__["data"] == b.__array_interface__["data"]
+        and a.shape == b.shape
+        and a.strides == b.strides
+        and a.dtype == b.dtype
+    )
+
+
+def _key_digest(df: pd.DataFrame, labels: list) -> str | None:
+    """Return a digest of the values of the key columns, without Copy-on-Write.
+
+    Args:
+        df: The DataFrame.
+        labels: The key columns.
+
+    Returns:
+        str: The digest, or None with Copy-on-Write, under which
+        the arrays of the key columns identify their values.
+    """
+    if copy_on_write_enabled():
+        return None
+    hashes = pd.util.hash_pandas_object(df[labels], index=False)
+    return hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16).hexdigest()
+
+
+def _key_columns(df: pd.DataFrame, by) -> list | None:
+    """Return the columns a DataFrame is grouped by.
+
+    Args:
+        df: The DataFrame.
+        by: The grouping keys.
+
+    Returns:
+        list: The column labels, or None if the keys are not all
+        unique column labels (e.g. arrays or index levels).
+    """
+    labels = by if isinstance(by, list) else [by]
+    columns = df.columns
+    for label in labels:
+        if (
+            not isinstance(label, Hashable)
+            or (isinstance(label, tuple) and not isinstance(columns, pd.MultiIndex))
+            or label not in columns
+            or not columns.is_unique
+        ):
+            return None
+    return labels
+
+
+class GroupingCache:
+    """Cache of DataFrame groupings, reused by `df.pf.groupby`.
+
+    A grouping holds the factorized keys (codes, group index, indices
+    of each group), computed on the first aggregation and reused by the
+    groupby objects created from it. Only the key columns are referenced,
+    not the DataFrame.
+
+    Args:
+        maxsize: The maximum number of groupings.
+            The least recently used ones are evicted first.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._uncacheable = 0
+
+    def __len__(self):
+        """Return the number of cached groupings.
+
+        Returns:
+            int: The number of groupings.
+        """
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all groupings and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._uncacheable = 0
+
+    def stats(self) -> dict:
+        """Return the cache statistics.
+
+        Returns:
+            dict: The number of hits, misses, evictions, uncacheable calls
+            and cached groupings.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "uncacheable": self._uncacheable,
+                "entries": len(self._entries),
+            }
+
+    def _remove(self, key):
+        """Remove a grouping, if still present.
+
+        Args:
+            key: The key of the grouping.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _lookup(self, key, df: pd.DataFrame, labels: list):
+        """Return a cached grouping, if still valid for the DataFrame.
+
+        With Copy-on-Write, the key columns referenced by the grouping
+        cannot be modified in place: modifying them in the DataFrame
+        gives it new arrays, which invalidates the grouping.
+        Without it, the digest of their values must match too.
+
+        Args:
+            key: The key of the grouping.
+            df: The DataFrame.
+            labels: The key columns.
+
+        Returns:
+            tuple: The grouper and the exclusions, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        ref, index, values, digest, grouper, exclusions = entry
+        if (
+            ref() is df
+            and df.index is index
+            and all(
+                _same_values(cached, df[label]._values)
+                for cached, label in zip(values, labels)
+            )
+            and digest == _key_digest(df, labels)
+        ):
+            return grouper, exclusions
+        return None
+
+    def groupby(
+        self,
+        df: pd.DataFrame,
+        by,
+        *,
+        sort: bool = True,
+        dropna: bool = True,
+        observed: bool = True,
+        as_index: bool = True,
+        group_keys: bool = True,
+    ) -> DataFrameGroupBy:
+        """Group a DataFrame, reusing the grouping of a previous call.
+
+        Args:
+            df: The DataFrame.
+            by: A column label or a list of column labels.
+                Other keys (arrays, index levels, `pd.Grouper`) are passed
+                to `df.groupby` without caching.
+            sort: See `DataFrame.groupby`.
+            dropna: See `DataFrame.groupby`.
+            observed: See `DataFrame.groupby`.
+            as_index: See `DataFrame.groupby`.
+            group_keys: See `DataFrame.groupby`.
+
+        Returns:
+            DataFrameGroupBy: The groupby object.
+        """
+        options = {
+            "sort": sort,
+            "dropna": dropna,
+            "observed": observed,
+            "as_index": as_index,
+            "group_keys": group_keys,
+        }
+        labels = _key_columns(df, by)
+        if labels is None:
+            with self._lock:
+                self._uncacheable += 1
+            return df.groupby(by, **options)
+
+        key = (id(df), tuple(labels), isinstance(by, list), sort, dropna, observed)
+        cached = self._lookup(key, df, labels)
+        if cached is None:
+            # only the key columns are referenced by the grouper
+            grouper, exclusions, _ = get_grouper(
+                df[labels], by, sort=sort, observed=observed, dropna=dropna
+            )
+            ref = weakref.ref(df, lambda _, key=key: self._remove(key))
+            values = tuple(df[label]._values for label in labels)
+            digest = _key_digest(df, labels)
+            with self._lock:
+                self._misses += 1
+                self._entries[key] = (
+                    ref,
+                    df.index,
+                    values,
+                    digest,
+                    grouper,
+                    exclusions,
+                )
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        else:
+            grouper, exclusions = cached
+            with self._lock:
+                self._hits += 1
+        return DataFrameGroupBy(
+            df, keys=by, grouper=grouper, exclusions=exclusions, **options
+        )
+
+
+default_grouping_cache = GroupingCache()
@@ -0,0 +1,542 @@
+"""Lazy chains of registered methods.
+
+A lazy chain records registered method calls into a plan instead of
+executing them. The plan is optimized and executed only on `collect()`:
+
+    result = (
+        df.pf.lazy()
+        .clean_names()
+        .remove_empty()
+        .filter_on("x > 0")
+        .select_columns(["x", "y"])
+        .collect()
+    )
+
+The optimizer relies on the `selects` and `pushdown` options
+the methods were registered with (see `register_dataframe_method`):
+
+- column selections and row filters are moved ahead of the methods
+  that declare them safe to push down, so that expensive steps
+  process less data;
+- consecutive copies are collapsed into one;
+- copies made unneeded by the `mutation` the methods declare are dropped:
+  copies right before "inplace" methods, which are called on a copy
+  of their input anyway, and copies right after "returns_new" methods
+  (or "returns_view" ones, with Copy-on-Write);
+- adjacent `elementwise` Series methods are fused into a single pass
+  (see `FusedStep`).
+
+Lazy chains of Series methods are started with `s.pf.lazy()`.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from .binding import MethodSignature
+from .mutation import copy_on_write_enabled
+from .register import (
+    find_registered_method,
+    get_method_call_ctx_factory,
+    handle_pandas_extension_call,
+)
+
+_COPY = "copy"
+
+# dtype kinds of the Series fused steps are not deduplicated for:
+# numbers and datetimes, which have few repeated values
+_NUMERIC_KINDS = "biufcmM"
+
+# the classes of the objects the steps of lazy chains and streams apply to
+_PANDAS_CLASSES = (pd.DataFrame, pd.Series)
+
+
+def _find_step_method(cls: type, name: str):
+    """Find the registered method a step calls on an object of class `cls`.
+
+    Methods registered for another pandas class only are found too,
+    for results whose class the previous step does not annotate.
+
+    Args:
+        cls: The class of the input of the step.
+        name: The name of the method.
+
+    Returns:
+        The registered method, or None if no such method is registered.
+    """
+    registered = find_registered_method(cls, name)
+    for other in _PANDAS_CLASSES:
+        if registered is not None:
+            break
+        registered = find_registered_method(other, name)
+    return registered
+
+
+def _result_class(registered) -> type:
+    """Return the class of the results of a step, from its return annotation.
+
+    Args:
+        registered: The registered method called by the step.
+
+    Returns:
+        type: The annotated DataFrame or Series class,
+        or the class the method is registered for otherwise.
+    """
+    annotation = registered.method_signature.return_annotation
+    if isinstance(annotation, str):
+        # postponed annotations, e.g. "pd.Series"
+        name = annotation.rsplit(".", 1)[-1]
+        for cls in _PANDAS_CLASSES:
+            if cls.__name__ == name:
+                return cls
+    elif isinstance(annotation, type) and issubclass(annotation, _PANDAS_CLASSES):
+        return annotation
+    return registered.cls
+
+
+class PlanStep:
+    """A single step of a lazy plan.
+
+    Args:
+        name: The name of the method to call.
+        args: The positional arguments of the call.
+        kwargs: The keyword arguments of the call.
+        registered: The registered method, or None for a copy.
+    """
+
+    __slots__ = ("name", "args", "kwargs", "registered")
+
+    def __init__(self, name: str, args: tuple, kwargs: dict, registered=None):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.registered = registered
+
+    @property
+    def selects(self) -> str | None:
+        """What the step selects from its input, "columns", "rows" or None."""
+        return None if self.registered is None else self.registered.selects
+
+    @property
+    def mutation(self) -> str | None:
+        """The mutation semantics declared by the method, if any."""
+        return None if self.registered is None else self.registered.mutation
+
+    def allows_pushdown(self, selection: str) -> bool:
+        """Whether `selection` may be moved ahead of this step.
+
+        Args:
+            selection: "columns" or "rows".
+
+        Returns:
+            bool: True if the selection gives the same result before the step.
+        """
+        if self.registered is None:
+            # selecting from a copy is the same as copying the selection
+            return True
+        return selection in self.registered.pushdown
+
+    def execute(self, obj):
+        """Execute the step.
+
+        Registered methods are called the regular way, so tracing
+        with `method_call_ctx_factory` applies to each step.
+
+        Args:
+            obj: The input of the step.
+
+        Returns:
+            The output of the step.
+        """
+        if self.registered is None:
+            return obj.copy()
+        return getattr(obj, self.name)(*self.args, **self.kwargs)
+
+    def __repr__(self):
+        """Return the representation of the step.
+
+        Returns:
+            str: The step as a method call.
+        """
+        params = [repr(arg) for arg in self.args]
+        params += [f"{key}={value!r}" for key, value in self.kwargs.items()]
+        return f"{self.name}({', '.join(params)})"
+
+
+class FusedStep(PlanStep):
+    """Adjacent elementwise steps of a lazy plan, executed in a single pass.
+
+    - For Series of strings, categories and other non-numeric values,
+      the steps are applied to the distinct values of the Series only,
+      and the results are expanded to the whole Series at once.
+    - For numeric Series, a chain of vectorized methods (registered with
+      `vectorize=True`) is applied as one composed scalar function,
+      unless numba compiles them.
+    - Other chains are executed step by step.
+
+    The first two allocate no full-size intermediate result.
+    Applying the steps to the distinct values assumes that they are
+    deterministic and that their arguments are not per-element arrays.
+
+    Args:
+        steps: The elementwise steps, in execution order.
+    """
+
+    __slots__ = ("steps", "_method", "_signature")
+
+    def __init__(self, steps):
+        super().__init__("fused", (), {})
+        self.steps = tuple(steps)
+        self._method = self._composed_method()
+        self._signature = (
+            None
+            if self._method is None
+            else MethodSignature.from_callable(self._method)
+        )
+
+    def allows_pushdown(self, selection: str) -> bool:
+        """Whether `selection` may be moved ahead of all the steps.
+
+        Args:
+            selection: "columns" or "rows".
+
+        Returns:
+            bool: True if every step allows it.
+        """
+        return all(step.allows_pushdown(selection) for step in self.steps)
+
+    def _composed_method(self):
+        """Compose the scalar functions of vectorized steps.
+
+        Returns:
+            callable: The Series method applying the composed function,
+            named after the steps, or None if some step is not vectorized
+            or is compiled with numba, or if only some steps are instrumented.
+        """
+        if len({step.registered.instrumented for step in self.steps}) > 1:
+            return None
+        calls = []
+        for step in self.steps:
+            ufunc = step.registered.ufunc
+            if ufunc is None or ufunc._numba is not None:
+                return None
+            calls.append((ufunc.func, step.args, step.kwargs))
+
+        def fused(x):
+            """Apply the scalar functions of the steps in turn.
+
+            Args:
+                x: An element.
+
+            Returns:
+                The result of the last function.
+            """
+            for func, args, kwargs in calls:
+                x = func(x, *args, **kwargs)
+            return x
+
+        def fused_method(s):
+            """Apply the scalar functions of the steps to every element.
+
+            Args:
+                s: The Series.
+
+            Returns:
+                The results.
+            """
+            return s.apply(fused)
+
+        fused_method.__name__ = "+".join(step.name for step in self.steps)
+        return fused_method
+
+    def execute(self, obj):
+        """Execute the steps.
+
+        Args:
+            obj: The Series the steps apply to.
+
+        Returns:
+            The output of the last step.
+        """
+        if obj.dtype.kind not in _NUMERIC_KINDS:
+            # each step is traced as a call on the distinct values
+            codes, uniques = pd.factorize(obj, use_na_sentinel=False)
+            result = pd.Series(uniques, name=obj.name)
+            for step in self.steps:
+                result = step.execute(result)
+            # taking from the Series keeps the dtype of the last step
+            return result.take(codes).set_axis(obj.index)
+        method = self._method
+        if method is None:
+            for step in self.steps:
+                obj = step.execute(obj)
+            return obj
+        if (
+            not self.steps[0].registered.instrumented
+            or get_method_call_ctx_factory() is None
+        ):
+            return method(obj)
+        # traced as a single call of the fused steps
+        return handle_pandas_extension_call(method, self._signature, obj, (), {})
+
+    def __repr__(self):
+        """Return the representation of the step.
+
+        Returns:
+            str: The fused steps.
+        """
+        return f"fused({', '.join(repr(step) for step in self.steps)})"
+
+
+def _push_down_selections(plan: list) -> list:
+    """Move selection steps ahead of the steps that allow it.
+
+    The relative order of the selections is kept.
+
+    Args:
+        plan: The steps of the plan.
+
+    Returns:
+        list: The reordered steps.
+    """
+    plan = list(plan)
+    for i, step in enumerate(plan):
+        if step.selects is None:
+            continue
+        j = i
+        while (
+            j > 0
+            and plan[j - 1].selects is None
+            and plan[j - 1].allows_pushdown(step.selects)
+        ):
+            plan[j] = plan[j - 1]
+            j -= 1
+        plan[j] = step
+    return plan
+
+
+def _drop_redundant_copies(plan: list) -> list:
+    """Collapse consecutive copies into one.
+
+    Args:
+        plan: The steps of the plan.
+
+    Returns:
+        list: The steps without redundant copies.
+    """
+    optimized = []
+    for step in plan:
+        if step.registered is None and optimized and optimized[-1].registered is None:
+            continue
+        optimized.append(step)
+    return optimized
+
+
+def _drop_unneeded_copies(plan: list) -> list:
+    """Drop the copies made unneeded by the declared mutation semantics.
+
+    Args:
+        plan: The steps of the plan.
+
+    Returns:
+        list: The steps without unneeded copies.
+    """
+    fresh_results = {"returns_new"}
+    if copy_on_write_enabled():
+        fresh_results.add("returns_view")
+    optimized = []
+    for i, step in enumerate(plan):
+        if step.registered is None:
+            before = optimized[-1] if optimized else None
+            after = plan[i + 1] if i + 1 < len(plan) else None
+            if (before is not None and before.mutation in fresh_results) or (
+                after is not None and after.mutation == "inplace"
+            ):
+                continue
+        optimized.append(step)
+    return optimized
+
+
+def _fusable(step) -> bool:
+    """Whether a step can be fused with adjacent elementwise steps.
+
+    Fused steps bypass the wrappers of cached methods
+    and of methods declaring their mutation semantics.
+
+    Args:
+        step: A step of the plan.
+
+    Returns:
+        bool: True for elementwise methods without such wrappers.
+    """
+    registered = step.registered
+    return (
+        registered is not None
+        and registered.elementwise
+        and registered.cache is None
+        and registered.mutation is None
+    )
+
+
+def _fuse_elementwise_steps(plan: list) -> list:
+    """Fuse runs of adjacent elementwise steps.
+
+    Fused steps are not registered methods: this pass must run last.
+
+    Args:
+        plan: The steps of the plan.
+
+    Returns:
+        list: The steps, with runs of elementwise steps fused.
+    """
+    optimized = []
+    run = []
+    for step in [*plan, None]:
+        if step is not None and _fusable(step):
+            run.append(step)
+            continue
+        if len(run) > 1:
+            optimized.append(FusedStep(run))
+        else:
+            optimized.extend(run)
+        run = []
+        if step is not None:
+            optimized.append(step)
+    return optimized
+
+
+_OPTIMIZER_PASSES = (
+    _push_down_selections,
+    _drop_redundant_copies,
+    _drop_unneeded_copies,
+    _fuse_elementwise_steps,
+)
+
+
+class LazyFrame:
+    """A pandas object with a plan of registered method calls to apply to it.
+
+    Calling a registered method on a LazyFrame returns a new LazyFrame
+    with the call appended to the plan. Use `df.pf.lazy()` to create one.
+    Each method is looked up for the class of the result of the previous
+    step, as told by its return annotation (e.g. a DataFrame method
+    annotated `-> pd.Series` is followed by Series methods).
+
+    Args:
+        obj: The DataFrame or Series the plan applies to.
+        plan: The steps recorded so far.
+        cls: The class of the result of the plan, the class of obj by default.
+    """
+
+    def __init__(self, obj, plan: tuple = (), cls: type | None = None):
+        self._obj = obj
+        self._plan = tuple(plan)
+        self._cls = type(obj) if cls is None else cls
+
+    def _append(self, step: PlanStep, cls: type) -> LazyFrame:
+        """Return a LazyFrame with `step` appended to the plan.
+
+        Args:
+            step: The step to append.
+            cls: The class of the result of the step.
+
+        Returns:
+            LazyFrame: The new lazy frame.
+        """
+        return LazyFrame(self._obj, self._plan + (step,), cls)
+
+    def __getattr__(self, name: str):
+        """Return a function recording a call to the registered method `name`.
+
+        Args:
+            name: The name of the registered method.
+
+        Raises:
+            AttributeError: if no method is registered under `name`.
+
+        Returns:
+            callable: The recording function.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        registered = _find_step_method(self._cls, name)
+        if registered is None:
+            raise AttributeError(
+                f"{name!r} is not a method registered with pandas_flavor "
+                f"for {self._cls.__name__}"
+            )
+        cls = _result_class(registered)
+
+        def record(*args, **kwargs):
+            """Record the method call.
+
+            Args:
+                *args: The arguments to pass to the registered method.
+                **kwargs: The keyword arguments to pass to the registered method.
+
+            Returns:
+                LazyFrame: The lazy frame with the call appended to the plan.
+            """
+            return self._append(PlanStep(name, args, kwargs, registered), cls)
+
+        return record
+
+    def copy(self) -> LazyFrame:
+        """Record a copy.
+
+        Returns:
+            LazyFrame: The lazy frame with the copy appended to the plan.
+        """
+        return self._append(PlanStep(_COPY, (), {}), self._cls)
+
+    @property
+    def plan(self) -> tuple:
+        """The steps recorded so far, unoptimized."""
+        return self._plan
+
+    def optimized_plan(self) -> tuple:
+        """Return the plan after optimization.
+
+        Returns:
+            tuple: The optimized steps.
+        """
+        plan = list(self._plan)
+        for optimizer_pass in _OPTIMIZER_PASSES:
+            plan = optimizer_pass(plan)
+        return tuple(plan)
+
+    def explain(self, optimize: bool = True) -> str:
+        """Describe the plan.
+
+        Args:
+            optimize: Describe the optimized plan.
+
+        Returns:
+            str: One line per step.
+        """
+        plan = self.optimized_plan() if optimize else self._plan
+        return "\n".join(repr(step) for step in plan)
+
+    def collect(self, optimize: bool = True):
+        """Execute the plan.
+
+        Args:
+            optimize: Optimize the plan before executing it.
+
+        Returns:
+            The result of the last step.
+        """
+        plan = self.optimized_plan() if optimize else self._plan
+        obj = self._obj
+        for step in plan:
+            obj = step.execute(obj)
+        return obj
+
+    def __repr__(self):
+        """Return the representation of the lazy frame.
+
+        Returns:
+            str: The type of the object and the recorded plan.
+        """
+        steps = "".join(f"\n  .{step!r}" for step in self._plan)
+        return f"<LazyFrame {type(self._obj).__name__}{steps}>"
@@ -0,0 +1,301 @@
+"""Memory accounting of registered method calls.
+
+`MemoryTracker` is a `method_call_ctx_factory` recording, for every call
+of a registered method, the memory used by its input and output,
+the peak memory allocated during the call and the growth of the peak
+resident set size of the process, to find which step of a pipeline
+blows up memory:
+
+    tracker = pf.MemoryTracker(peak=True)
+    with tracker:
+        run_pipeline(df)
+    print(tracker.report())
+
+Calls whose output is much larger than their input are flagged
+with a `MemoryGrowthWarning`, or passed to a custom hook.
+"""
+
+from __future__ import annotations
+
+import collections
+import sys
+import threading
+import warnings
+from math import nan
+
+import pandas as pd
+from pandas.core.groupby import GroupBy
+
+from .profiling import _start_memory, _stop_memory
+from .register import _find_stack_level
+from .tracing import MethodCallFactory, _memory_usage
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_FIELDS = (
+    "method",
+    "in_bytes",
+    "out_bytes",
+    "growth",
+    "peak_bytes",
+    "rss_growth_bytes",
+    "error",
+)
+
+
+class MemoryGrowthWarning(UserWarning):
+    """Warning issued for registered method calls growing memory too much."""
+
+
+def _max_rss() -> int:
+    """Return the peak resident set size of the process.
+
+    Returns:
+        int: The peak RSS in bytes, or -1 if unknown.
+    """
+    if resource is None:
+        return -1
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _object_memory(obj, deep: bool) -> int:
+    """Return the memory used by a method input or output.
+
+    GroupBy objects report the memory of the grouped object.
+
+    Args:
+        obj: The object to inspect.
+        deep: Whether to introspect object dtypes.
+
+    Returns:
+        int: The number of bytes, or -1 if unknown.
+    """
+    if isinstance(obj, GroupBy):
+        obj = obj.obj
+    return _memory_usage(obj, deep)
+
+
+class _MeasuredCall:
+    """Method call context measuring the memory of a single call.
+
+    Args:
+        tracker: The tracker to record the call into.
+        method_name: The name of the called method.
+    """
+
+    __slots__ = (
+        "_tracker",
+        "_method_name",
+        "_in_bytes",
+        "_out_bytes",
+        "_memory_start",
+        "_rss_start",
+    )
+
+    def __init__(self, tracker: MemoryTracker, method_name: str):
+        self._tracker = tracker
+        self._method_name = method_name
+        self._in_bytes = self._out_bytes = -1
+        self._memory_start = None
+        self._rss_start = -1
+
+    def __enter__(self):
+        """Enter the call context.
+
+        Returns:
+            The call context.
+        """
+        return self
+
+    def handle_start_method_call(
+        self, method_name, method_signature, method_args, method_kwargs
+    ):
+        """Measure the input of the call and start the peak measurements.
+
+        Args:
+            method_name: The name of the method.
+            method_signature: The signature of the method.
+            method_args: The arguments of the method, starting with the object.
+            method_kwargs: The keyword arguments of the method.
+
+        Returns:
+            The unmodified arguments and keyword arguments of the method.
+        """
+        self._in_bytes = _object_memory(method_args[0], self._tracker.deep)
+        self._rss_start = _max_rss()
+        if self._tracker.peak:
+            self._memory_start = _start_memory()
+        return method_args, method_kwargs
+
+    def handle_end_method_call(self, ret):
+        """Measure the output of the call.
+
+        Args:
+            ret: The return value of the method.
+        """
+        self._out_bytes = _object_memory(ret, self._tracker.deep)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the peak measurements and record the call into the tracker.
+
+        Args:
+            exc_type: The type of the exception raised by the method, if any.
+            exc_value: The exception raised by the method, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        peak = -1
+        if self._memory_start is not None:
+            peak = _stop_memory(self._memory_start)
+        rss_growth = -1
+        if self._rss_start >= 0:
+            rss_growth = _max_rss() - self._rss_start
+        in_bytes, out_bytes = self._in_bytes, self._out_bytes
+        growth = out_bytes / in_bytes if in_bytes > 0 and out_bytes >= 0 else nan
+        self._tracker._record(
+            (
+                self._method_name,
+                in_bytes,
+                out_bytes,
+                growth,
+                peak,
+                rss_growth,
+                exc_type is not None,
+            )
+        )
+
+
+class MemoryTracker(MethodCallFactory):
+    """Record the memory used by registered method calls.
+
+    For every call the tracker records the memory usage of the input
+    and output objects (as `memory_usage(deep=deep)`), their ratio,
+    the growth of the peak resident set size of the process during the call
+    and, with `peak=True`, the peak memory allocated during the call
+    as measured by `tracemalloc`. Only the last `capacity` calls are kept.
+
+    Calls whose output is more than `growth_threshold` times larger than
+    their input, and at least `min_bytes` large, are flagged: `on_growth`
+    is called with their record, or a `MemoryGrowthWarning` is issued
+    if no hook is given.
+
+    The tracker is a `method_call_ctx_factory`, enabled like `MethodCallTracer`.
+
+    Args:
+        deep: Whether memory usage introspects object dtypes,
+            as in `DataFrame.memory_usage`. This is much more expensive.
+        peak: Whether to measure the peak memory allocated during calls
+            with `tracemalloc`, which slows down allocations while on.
+        growth_threshold: The output to input size ratio above which
+            calls are flagged, or None to flag no call.
+        min_bytes: The minimum output size of flagged calls.
+        on_growth: A function called with the record (a dict)
+            of each flagged call, instead of issuing a warning.
+        capacity: The maximum number of call records kept.
+    """
+
+    def __init__(
+        self,
+        deep: bool = False,
+        peak: bool = False,
+        growth_threshold: float | None = 10.0,
+        min_bytes: int = 1 << 20,
+        on_growth=None,
+        capacity: int = 65536,
+    ):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.deep = deep
+        self.peak = peak
+        self.growth_threshold = growth_threshold
+        self.min_bytes = min_bytes
+        self.on_growth = on_growth
+        self._records = collections.deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def __call__(self, method_name: str, args, kwargs) -> _MeasuredCall:
+        """Create the context measuring a single method call.
+
+        Args:
+            method_name: The name of the called method.
+            args: The arguments of the method call.
+            kwargs: The keyword arguments of the method call.
+
+        Returns:
+            The method call context.
+        """
+        return _MeasuredCall(self, method_name)
+
+    def _record(self, values: tuple):
+        """Keep a call record and flag it if its output grew too much.
+
+        Args:
+            values: The values of the record, in `_FIELDS` order.
+        """
+        with self._lock:
+            self._records.append(values)
+        growth, out_bytes = values[3], values[2]
+        if (
+            self.growth_threshold is not None
+            and growth > self.growth_threshold
+            and out_bytes >= self.min_bytes
+        ):
+            record = dict(zip(_FIELDS, values))
+            if self.on_growth is not None:
+                self.on_growth(record)
+            else:
+                warnings.warn(
+                    f"{record['method']} returned {out_bytes} bytes "
+                    f"from {record['in_bytes']} bytes of input ({growth:.1f}x)",
+                    MemoryGrowthWarning,
+                    stacklevel=_find_stack_level(),
+                )
+
+    def clear(self):
+        """Drop all call records."""
+        with self._lock:
+            self._records.clear()
+
+    def records(self) -> pd.DataFrame:
+        """Return the recorded calls, oldest first.
+
+        Returns:
+            A DataFrame with one row per call. Sizes are in bytes,
+            -1 when unknown, and growth is the output to input size ratio.
+        """
+        with self._lock:
+            records = list(self._records)
+        return pd.DataFrame(records, columns=list(_FIELDS))
+
+    def report(self) -> pd.DataFrame:
+        """Aggregate the recorded calls per method.
+
+        Returns:
+            A DataFrame indexed by method name with the number of calls,
+            the mean and maximum input and output sizes, the maximum growth,
+            tracemalloc peak and RSS growth, and the number of flagged calls,
+            sorted by maximum peak and output size.
+        """
+        records = self.records()
+        flagged = records["growth"].gt(
+            float("inf") if self.growth_threshold is None else self.growth_threshold
+        ) & records["out_bytes"].ge(self.min_bytes)
+        grouped = records.assign(flagged=flagged).groupby("method")
+        report = pd.DataFrame(
+            {
+                "calls": grouped.size(),
+                "in_mean_bytes": grouped["in_bytes"].mean(),
+                "in_max_bytes": grouped["in_bytes"].max(),
+                "out_mean_bytes": grouped["out_bytes"].mean(),
+                "out_max_bytes": grouped["out_bytes"].max(),
+                "growth_max": grouped["growth"].max(),
+                "peak_max_bytes": grouped["peak_bytes"].max(),
+                "rss_growth_max_bytes": grouped["rss_growth_bytes"].max(),
+                "flagged": grouped["flagged"].sum(),
+            }
+        )
+        return report.sort_values(["peak_max_bytes", "out_max_bytes"], ascending=False)
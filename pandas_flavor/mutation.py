@@ -0,0 +1,112 @@
+"""Declared mutation semantics of registered methods.
+
+DataFrame and Series methods can declare at registration how they treat
+the object they are called on, with `mutation=`:
+
+- "inplace": the method modifies its input (e.g. `df[col] = ...`).
+  pandas_flavor calls it on a shallow copy instead, so the caller's object
+  is left untouched. With Copy-on-Write, only the data the method modifies
+  is actually copied, instead of the whole object as a defensive
+  `df.copy()` would. If the method returns None, the modified copy
+  is returned.
+- "returns_view": the result may share data with the input
+  (e.g. a column selection). With Copy-on-Write this is safe as is;
+  without it, the result is copied so that modifying it cannot modify
+  the input.
+- "returns_new": the result never shares data with the input,
+  nothing needs to be done.
+
+    @pf.register_dataframe_method(mutation="inplace")
+    def add_total(df):
+        df["total"] = df.sum(axis=1)
+
+    totals = df.add_total()  # df is unchanged, no defensive copy needed
+
+Lazy plans use the declarations to drop copies that are not needed
+(see `pandas_flavor.lazy`).
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+
+import pandas as pd
+
+MUTATIONS = ("inplace", "returns_view", "returns_new")
+
+# Copy-on-Write cannot be disabled since pandas 3.0.
+_ALWAYS_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+def copy_on_write_enabled() -> bool:
+    """Whether pandas Copy-on-Write is enabled.
+
+    Returns:
+        bool: True with pandas >= 3.0, or when the `mode.copy_on_write`
+        option is set with earlier versions.
+    """
+    if _ALWAYS_COPY_ON_WRITE:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def make_mutation_method(method, mutation: str):
+    """Wrap a registered method to enforce its declared mutation semantics.
+
+    Args:
+        method: The registered method.
+        mutation: "inplace", "returns_view" or "returns_new".
+
+    Returns:
+        callable: The function to call instead of the method.
+
+    Raises:
+        ValueError: if the mutation is unknown.
+    """
+    if mutation not in MUTATIONS:
+        raise ValueError(f"mutation must be one of {MUTATIONS}, got {mutation!r}")
+    if mutation == "returns_new":
+        return method
+
+    if mutation == "inplace":
+
+        @wraps(method)
+        def inplace_method(obj, *args, **kwargs):
+            """Call the method on a copy of obj.
+
+            Args:
+                obj: The object the method is called on.
+                *args: The arguments to pass to the registered method.
+                **kwargs: The keyword arguments to pass to the registered method.
+
+            Returns:
+                The result of the method, or the modified copy if it is None.
+            """
+            # with Copy-on-Write, a shallow copy only copies the data
+            # the method writes to
+            obj = obj.copy(deep=not copy_on_write_enabled())
+            result = method(obj, *args, **kwargs)
+            return obj if result is None else result
+
+        return inplace_method
+
+    @wraps(method)
+    def view_method(obj, *args, **kwargs):
+        """Call the method, copying its result unless Copy-on-Write is enabled.
+
+        Args:
+            obj: The object the method is called on.
+            *args: The arguments to pass to the registered method.
+            **kwargs: The keyword arguments to pass to the registered method.
+
+        Returns:
+            The result of the method.
+        """
+        result = method(obj, *args, **kwargs)
+        if isinstance(result, (pd.DataFrame, pd.Series)) and (
+            not copy_on_write_enabled()
+        ):
+            result = result.copy()
+        return result
+
+    return view_method
@@ -0,0 +1,653 @@
+"""OpenTelemetry-compatible spans of registered method calls.
+
+`SpanTracer` is a `method_call_ctx_factory` turning every call of a
+registered method into a span, with the method name, the number of rows,
+columns and bytes of the input and output and the duration of the call
+as attributes:
+
+    tracer = pf.SpanTracer(exporter)
+    with tracer:
+        run_pipeline(df)
+
+Finished spans are queued and exported in batches by a background thread,
+so the calling thread never waits for the exporter. An exporter is any
+object with an `export(spans)` method, e.g. `InMemorySpanExporter`,
+or `OTelSDKExporter` wrapping an exporter of the OpenTelemetry SDK
+(which is only imported by it). `to_otlp` converts spans to the OTLP
+JSON encoding, as accepted by the `/v1/traces` endpoint of collectors.
+
+Spans of registered methods called by other registered methods are their
+children. The outermost spans are the children of the active
+OpenTelemetry span, if opentelemetry-api is installed, or of the remote
+parent set with `remote_parent` (e.g. the `TRACEPARENT` of a job).
+"""
+
+from __future__ import annotations
+
+import atexit
+import collections
+import contextlib
+import contextvars
+import random
+import threading
+import time
+
+from .__version__ import __version__
+from .memory import _object_memory
+from .tracing import MethodCallFactory, _shape
+
+# SpanKind.INTERNAL and the status codes of the OTLP encoding
+_KIND_INTERNAL = 1
+_STATUS_UNSET = 0
+_STATUS_ERROR = 2
+
+# (trace_id, span_id) of the span of the registered method being called,
+# or of the remote parent of the outermost calls
+_current_span = contextvars.ContextVar("pandas_flavor_span", default=None)
+
+# the running tracers, flushed at exit
+_tracers = set()
+
+# the opentelemetry.trace module, False if opentelemetry-api is not installed
+_otel_trace = None
+
+
+def _random_id(bits: int) -> int:
+    """Generate a random trace or span id.
+
+    Args:
+        bits: The number of bits of the id.
+
+    Returns:
+        int: A non-zero id.
+    """
+    return random.getrandbits(bits) or 1
+
+
+def _otel_parent():
+    """Return the ids of the active OpenTelemetry span.
+
+    Returns:
+        tuple: The trace id and span id of the active span, or None
+        if there is none or opentelemetry-api is not installed.
+    """
+    global _otel_trace
+    if _otel_trace is None:
+        try:
+            from opentelemetry import trace as _otel_trace
+        except ImportError:
+            _otel_trace = False
+    if not _otel_trace:
+        return None
+    context = _otel_trace.get_current_span().get_span_context()
+    if not context.is_valid:
+        return None
+    return context.trace_id, context.span_id
+
+
+@contextlib.contextmanager
+def remote_parent(traceparent: str):
+    """Make the spans of the outermost calls children of a remote span.
+
+    Args:
+        traceparent: The parent span as a W3C `traceparent` header,
+            e.g. `00-<32 hex digits trace id>-<16 hex digits span id>-01`.
+
+    Yields:
+        None.
+
+    Raises:
+        ValueError: if `traceparent` is not a valid `traceparent` header.
+    """
+    try:
+        _, trace_id, span_id, _ = traceparent.strip().split("-")
+        ids = int(trace_id, 16), int(span_id, 16)
+    except ValueError:
+        ids = None
+    if ids is None or len(trace_id) != 32 or len(span_id) != 16 or 0 in ids:
+        raise ValueError(f"invalid traceparent: {traceparent!r}")
+    token = _current_span.set(ids)
+    try:
+        yield
+    finally:
+        _current_span.reset(token)
+
+
+class Span:
+    """A finished span of a registered method call.
+
+    Ids are integers, as in OpenTelemetry: 128 bits for trace ids,
+    64 bits for span ids. Times are nanoseconds since the epoch.
+
+    Args:
+        name: The name of the method.
+        trace_id: The id of the trace.
+        span_id: The id of the span.
+        parent_span_id: The id of the parent span, or None for root spans.
+        start_time: The start time of the call.
+        end_time: The end time of the call.
+        attributes: The attributes of the span.
+        error: The error raised by the call, as `"<type>: <message>"`,
+            or None.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "start_time",
+        "end_time",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: int,
+        span_id: int,
+        parent_span_id: int | None,
+        start_time: int,
+        end_time: int,
+        attributes: dict,
+        error: str | None = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_span_id = parent_span_id
+        self.start_time = start_time
+        self.end_time = end_time
+        self.attributes = attributes
+        self.error = error
+
+    def __repr__(self) -> str:
+        """Represent the span.
+
+        Returns:
+            str: The name and ids of the span.
+        """
+        parent = f"{self.parent_span_id:016x}" if self.parent_span_id else None
+        return (
+            f"Span({self.name!r}, trace_id={self.trace_id:032x}, "
+            f"span_id={self.span_id:016x}, parent_span_id={parent})"
+        )
+
+    def to_otlp(self) -> dict:
+        """Encode the span in the OTLP JSON encoding.
+
+        Returns:
+            dict: The span.
+        """
+        span = {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "name": self.name,
+            "kind": _KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": _STATUS_UNSET},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = f"{self.parent_span_id:016x}"
+        if self.error is not None:
+            span["status"] = {"code": _STATUS_ERROR, "message": self.error}
+        return span
+
+
+def _otlp_value(value) -> dict:
+    """Encode an attribute value in the OTLP JSON encoding.
+
+    Args:
+        value: A string, boolean, integer or float.
+
+    Returns:
+        dict: The value.
+    """
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64-bit integers are strings in the JSON encoding
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans, service_name: str = "pandas_flavor") -> dict:
+    """Encode spans as an OTLP `ExportTraceServiceRequest`, in JSON.
+
+    Args:
+        spans: The spans to encode.
+        service_name: The `service.name` of the resource of the spans.
+
+    Returns:
+        dict: The request, to be serialized with `json.dumps`.
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": _otlp_value(service_name)}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "pandas_flavor", "version": __version__},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class InMemorySpanExporter:
+    """Exporter keeping the exported spans in a list, e.g. for tests."""
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: list):
+        """Keep spans.
+
+        Args:
+            spans: The spans to keep.
+        """
+        with self._lock:
+            self.spans.extend(spans)
+
+    def get_finished_spans(self) -> list:
+        """Return the exported spans.
+
+        Returns:
+            list: The spans, in the order they were exported.
+        """
+        with self._lock:
+            return list(self.spans)
+
+    def clear(self):
+        """Forget the exported spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class OTelSDKExporter:
+    """Export spans with an exporter of the OpenTelemetry SDK.
+
+    Spans are converted to `opentelemetry.sdk.trace.ReadableSpan`,
+    keeping their ids, e.g. to send them to a collector with the
+    OTLP exporter of the SDK:
+
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        tracer = pf.SpanTracer(OTelSDKExporter(OTLPSpanExporter()))
+
+    Args:
+        exporter: An `opentelemetry.sdk.trace.export.SpanExporter`.
+        resource: The `Resource` of the spans, by default the SDK default
+            resource.
+    """
+
+    def __init__(self, exporter, resource=None):
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+        self.exporter = exporter
+        self.resource = Resource.create() if resource is None else resource
+        self._scope = InstrumentationScope("pandas_flavor", __version__)
+
+    def _readable_span(self, span: Span):
+        """Convert a span to an SDK span.
+
+        Args:
+            span: The span.
+
+        Returns:
+            ReadableSpan: The SDK span.
+        """
+        from opentelemetry.sdk.trace import ReadableSpan
+        from opentelemetry.trace import SpanContext, Status, StatusCode, TraceFlags
+
+        flags = TraceFlags(TraceFlags.SAMPLED)
+        parent = None
+        if span.parent_span_id:
+            parent = SpanContext(span.trace_id, span.parent_span_id, False, flags)
+        status = Status()
+        if span.error is not None:
+            status = Status(StatusCode.ERROR, span.error)
+        return ReadableSpan(
+            span.name,
+            context=SpanContext(span.trace_id, span.span_id, False, flags),
+            parent=parent,
+            resource=self.resource,
+            attributes=span.attributes,
+            status=status,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            instrumentation_scope=self._scope,
+        )
+
+    def export(self, spans: list):
+        """Export spans with the SDK exporter.
+
+        Args:
+            spans: The spans to export.
+
+        Returns:
+            The `SpanExportResult` of the SDK exporter.
+        """
+        return self.exporter.export([self._readable_span(span) for span in spans])
+
+    def shutdown(self):
+        """Shut down the SDK exporter."""
+        self.exporter.shutdown()
+
+
+class _SpanCall:
+    """Method call context recording the span of a single call.
+
+    Args:
+        tracer: The tracer to record the span into.
+        method_name: The name of the called method.
+    """
+
+    __slots__ = (
+        "_tracer",
+        "_method_name",
+        "_trace_id",
+        "_span_id",
+        "_parent_span_id",
+        "_token",
+        "_start_time",
+        "_start_ns",
+        "_end_ns",
+        "_attributes",
+    )
+
+    def __init__(self, tracer: SpanTracer, method_name: str):
+        self._tracer = tracer
+        self._method_name = method_name
+        self._token = None
+        self._start_ns = self._end_ns = None
+        self._attributes = {"pandas_flavor.method": method_name}
+
+    def __enter__(self):
+        """Open the span, as a child of the current span if any.
+
+        Returns:
+            The call context.
+        """
+        parent = _current_span.get()
+        if parent is None and self._tracer.otel_context:
+            parent = _otel_parent()
+        if parent is None:
+            self._trace_id = _random_id(128)
+            self._parent_span_id = None
+        else:
+            self._trace_id, self._parent_span_id = parent
+        self._span_id = _random_id(64)
+        self._token = _current_span.set((self._trace_id, self._span_id))
+        self._start_time = time.time_ns()
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def _measure(self, obj, prefix: str):
+        """Record the shape and memory of an input or output as attributes.
+
+        Unknown values are not recorded.
+
+        Args:
+            obj: The input or output of the call.
+            prefix: The prefix of the attribute names.
+        """
+        rows, cols = _shape(obj)
+        if rows >= 0:
+            self._attributes[prefix + "rows"] = rows
+            self._attributes[prefix + "columns"] = cols
+        if self._tracer.memory:
+            nbytes = _object_memory(obj, self._tracer.deep)
+            if nbytes >= 0:
+                self._attributes[prefix + "bytes"] = nbytes
+
+    def handle_start_method_call(
+        self, method_name, method_signature, method_args, method_kwargs
+    ):
+        """Record the input of the call and start the clocks.
+
+        Args:
+            method_name: The name of the method.
+            method_signature: The signature of the method.
+            method_args: The arguments of the method, starting with the object.
+            method_kwargs: The keyword arguments of the method.
+
+        Returns:
+            The unmodified arguments and keyword arguments of the method.
+        """
+        self._measure(method_args[0], "pandas_flavor.")
+        self._start_time = time.time_ns()
+        self._start_ns = time.perf_counter_ns()
+        return method_args, method_kwargs
+
+    def handle_end_method_call(self, ret):
+        """Stop the clocks and record the output of the call.
+
+        Args:
+            ret: The return value of the method.
+        """
+        self._end_ns = time.perf_counter_ns()
+        self._measure(ret, "pandas_flavor.out.")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the span and queue it for export.
+
+        Args:
+            exc_type: The type of the exception raised by the method, if any.
+            exc_value: The exception raised by the method, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        if self._token is None:
+            # the span was never opened
+            return
+        if self._end_ns is None:
+            self._end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        duration = self._end_ns - self._start_ns
+        self._attributes["pandas_flavor.duration_ns"] = duration
+        error = None
+        if exc_type is not None:
+            error = f"{exc_type.__name__}: {exc_value}"
+            self._attributes["exception.type"] = exc_type.__name__
+        self._tracer._queue_span(
+            Span(
+                self._method_name,
+                self._trace_id,
+                self._span_id,
+                self._parent_span_id,
+                self._start_time,
+                self._start_time + duration,
+                self._attributes,
+                error,
+            )
+        )
+
+
+class SpanTracer(MethodCallFactory):
+    """Export registered method calls as OpenTelemetry-compatible spans.
+
+    Finished spans are put in a bounded queue, which a background thread
+    exports in batches of up to `max_batch_size` spans, as soon as a batch
+    is full or every `schedule_delay` seconds. When the queue is full,
+    new spans are dropped (and counted) rather than blocking the calls.
+    Spans still queued are exported by `flush()`, `shutdown()` and
+    at exit.
+
+    The tracer is a `method_call_ctx_factory`, enabled like
+    `MethodCallTracer`: with `enable()`/`disable()`, as a context manager,
+    or for the current thread or asyncio task only with `scoped()`.
+
+    Args:
+        exporter: The object exporting the spans, with an `export(spans)`
+            method and optionally a `shutdown()` method.
+        max_queue_size: The maximum number of spans waiting for export.
+        max_batch_size: The maximum number of spans exported at once.
+        schedule_delay: The maximum time in seconds a span waits for export.
+        memory: Whether to record the memory usage of inputs and outputs.
+        deep: Whether memory usage introspects object dtypes,
+            as in `DataFrame.memory_usage`. This is much more expensive.
+        otel_context: Whether the outermost spans are children
+            of the active OpenTelemetry span, if opentelemetry-api
+            is installed.
+    """
+
+    def __init__(
+        self,
+        exporter,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 512,
+        schedule_delay: float = 5.0,
+        memory: bool = True,
+        deep: bool = False,
+        otel_context: bool = True,
+    ):
+        if max_batch_size <= 0 or max_queue_size < max_batch_size:
+            raise ValueError(
+                "max_batch_size must be a positive integer "
+                "no larger than max_queue_size"
+            )
+        self.exporter = exporter
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.schedule_delay = schedule_delay
+        self.memory = memory
+        self.deep = deep
+        self.otel_context = otel_context
+        self._queue = collections.deque()
+        self._queue_lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._shut_down = False
+        self._exported = self._dropped = self._failed = 0
+
+    def __call__(self, method_name: str, args, kwargs) -> _SpanCall:
+        """Create the context recording the span of a single method call.
+
+        Args:
+            method_name: The name of the called method.
+            args: The arguments of the method call.
+            kwargs: The keyword arguments of the method call.
+
+        Returns:
+            The method call context.
+        """
+        return _SpanCall(self, method_name)
+
+    def _queue_span(self, span: Span):
+        """Queue a finished span for export.
+
+        Args:
+            span: The span.
+        """
+        queue = self._queue
+        # shutdown() sets _shut_down under the same lock: a span is either
+        # queued before the last export or dropped
+        with self._queue_lock:
+            if self._shut_down or len(queue) >= self.max_queue_size:
+                self._dropped += 1
+                return
+            queue.append(span)
+            batch_full = len(queue) >= self.max_batch_size
+        if self._thread is None:
+            self._start_thread()
+        if batch_full:
+            self._wake.set()
+
+    def _start_thread(self):
+        """Start the background thread exporting the spans."""
+        with self._thread_lock:
+            if self._thread is None and not self._shut_down:
+                self._thread = threading.Thread(
+                    target=self._run, name="pandas_flavor-span-export", daemon=True
+                )
+                self._thread.start()
+                _tracers.add(self)
+
+    def _run(self):
+        """Export the queued spans until the tracer is shut down."""
+        while not self._shut_down:
+            self._wake.wait(self.schedule_delay)
+            self._wake.clear()
+            self._export_queued()
+
+    def _export_queued(self):
+        """Export the queued spans, in batches."""
+        queue = self._queue
+        with self._export_lock:
+            while queue:
+                batch = []
+                while queue and len(batch) < self.max_batch_size:
+                    batch.append(queue.popleft())
+                try:
+                    self.exporter.export(batch)
+                except Exception:
+                    # the calls must not fail because of the exporter
+                    self._failed += len(batch)
+                else:
+                    self._exported += len(batch)
+
+    def flush(self):
+        """Export the queued spans now, from the calling thread."""
+        self._export_queued()
+
+    def shutdown(self):
+        """Export the queued spans, stop the background thread and
+        shut down the exporter.
+
+        Spans finished afterwards are dropped.
+        """
+        with self._thread_lock:
+            if self._shut_down:
+                return
+            with self._queue_lock:
+                self._shut_down = True
+            thread = self._thread
+        self._wake.set()
+        if thread is not None:
+            thread.join()
+        self._export_queued()
+        _tracers.discard(self)
+        shutdown = getattr(self.exporter, "shutdown", None)
+        if shutdown is not None:
+            shutdown()
+
+    def stats(self) -> dict:
+        """Return the numbers of exported, dropped and failed spans.
+
+        Returns:
+            dict: The numbers of spans exported, dropped because the queue
+            was full (or the tracer shut down), and passed to a failed
+            export, and the number of spans queued.
+        """
+        return {
+            "exported": self._exported,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "queued": len(self._queue),
+        }
+
+
+@atexit.register
+def _shutdown_tracers():
+    """Export the spans queued by the running tracers."""
+    for tracer in list(_tracers):
+        tracer.shutdown()
@@ -0,0 +1,410 @@
+"""Parallel execution of registered groupby methods.
+
+Groupby methods registered with `engine="threads"` or `engine="processes"`
+are not called once on the whole GroupBy object. Instead, the groups are
+split into chunks of contiguous groups with balanced numbers of rows,
+the registered function is called on a GroupBy of each chunk
+in a `concurrent.futures` pool, and the chunk results are concatenated
+in group order:
+
+    @pf.register_dataframe_groupby_method(engine="processes")
+    def per_customer_stats(grp):
+        return grp.apply(expensive_model)
+
+    df.groupby("customer").per_customer_stats()
+
+The registered function must return a DataFrame or Series,
+indexed either by group (as aggregations and `apply` do)
+or by row (as transformations do), and must only depend on the groups
+it is given. With the process engine, the numeric columns of the grouped
+object are transferred to the workers through shared memory, and the
+function, its arguments and its results must be picklable.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import wraps
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+ENGINES = ("threads", "processes")
+
+# The number of chunks per worker, more chunks balance the load better.
+_CHUNKS_PER_WORKER = 2
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(engine: str, max_workers: int):
+    """Return the shared executor for an engine.
+
+    Args:
+        engine: "threads" or "processes".
+        max_workers: The number of workers.
+
+    Returns:
+        The executor.
+    """
+    with _executors_lock:
+        executor = _executors.get((engine, max_workers))
+        if executor is None:
+            executor_cls = (
+                ThreadPoolExecutor if engine == "threads" else ProcessPoolExecutor
+            )
+            executor = _executors[engine, max_workers] = executor_cls(max_workers)
+        return executor
+
+
+@atexit.register
+def _shutdown_executors():
+    """Shut down the shared executors."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _executors.clear()
+
+
+def _chunk_positions(grp, n_chunks: int) -> list:
+    """Split the rows of the grouped object into chunks of whole groups.
+
+    Each chunk holds a run of consecutive groups (in group order)
+    and the chunks hold about the same number of rows.
+    Rows not belonging to any group (e.g. with missing keys) are left out.
+
+    Args:
+        grp: The GroupBy object.
+        n_chunks: The maximum number of chunks.
+
+    Returns:
+        list: The positions of the rows of each non-empty chunk.
+    """
+    codes = grp.ngroup().to_numpy()
+    sizes = np.bincount(codes[codes >= 0], minlength=grp.ngroups)
+    ends = np.cumsum(sizes)
+    targets = ends[-1] * np.arange(1, n_chunks) / n_chunks
+    # the first group of each chunk but the first one
+    bounds = np.unique(np.searchsorted(ends, targets, side="right"))
+    chunk_of_group = np.searchsorted(bounds, np.arange(grp.ngroups), side="right")
+    chunk_of_row = np.where(codes >= 0, chunk_of_group[codes], -1)
+    positions = [np.flatnonzero(chunk_of_row == chunk) for chunk in range(n_chunks)]
+    return [chunk for chunk in positions if len(chunk)]
+
+
+def _groupby_spec(grp):
+    """Describe how to group a chunk of the grouped object.
+
+    Args:
+        grp: The GroupBy object.
+
+    Returns:
+        A tuple with a list holding, for each key, either ("column", label)
+        to group by a column of the chunk or ("values", Series) to group by
+        the per-row key values, and whether grp was grouped by a single key
+        rather than a list of keys.
+        Returns None to group by `grp.level`, or False if the grouping
+        cannot be split in chunks.
+    """
+    if grp.level is not None:
+        return None
+    keys = []
+    for grouping in grp._grouper.groupings:
+        values = grouping.grouping_vector
+        if isinstance(getattr(values, "dtype", None), pd.CategoricalDtype) and (
+            not grp.observed
+        ):
+            # every chunk would report all the categories
+            return False
+        if (
+            grouping.in_axis
+            and isinstance(grp.obj, pd.DataFrame)
+            and grouping.name in grp.obj.columns
+        ):
+            keys.append(("column", grouping.name))
+        else:
+            keys.append(("values", pd.Series(values, name=grouping.name)))
+    return keys, not isinstance(grp.keys, list)
+
+
+def _groupby_kwargs(grp) -> dict:
+    """Return the arguments to group a chunk the same way as grp.
+
+    Args:
+        grp: The GroupBy object.
+
+    Returns:
+        dict: The keyword arguments of `groupby`.
+    """
+    kwargs = {
+        "level": grp.level,
+        "sort": grp.sort,
+        "group_keys": grp.group_keys,
+        "dropna": grp.dropna,
+        "observed": grp.observed,
+    }
+    if isinstance(grp.obj, pd.DataFrame):
+        kwargs["as_index"] = grp.as_index
+    return kwargs
+
+
+def _chunk_keys(keys, positions):
+    """Take the key values of a chunk.
+
+    Args:
+        keys: The grouping keys, as returned by `_groupby_spec`.
+        positions: The positions of the chunk rows.
+
+    Returns:
+        The keys of the chunk, with the per-row values taken at `positions`.
+    """
+    if keys is None:
+        return None
+    keys, single = keys
+    return [
+        (kind, key, None)
+        if kind == "column"
+        else (kind, key.iloc[positions].to_numpy(), key.name)
+        for kind, key in keys
+    ], single
+
+
+def _call_on_chunk(method, obj, keys, groupby_kwargs, selection, args, kwargs):
+    """Group a chunk and call the registered method on it.
+
+    Args:
+        method: The registered method.
+        obj: The chunk of the grouped object.
+        keys: The keys of the chunk, as returned by `_chunk_keys`.
+        groupby_kwargs: The other arguments of `groupby`.
+        selection: The column selection of the GroupBy object, if any.
+        args: The arguments to pass to the registered method.
+        kwargs: The keyword arguments to pass to the registered method.
+
+    Returns:
+        The result of the registered method.
+    """
+    by = None
+    if keys is not None:
+        keys, single = keys
+        by = [
+            key if kind == "column" else pd.Series(key, index=obj.index, name=name)
+            for kind, key, name in keys
+        ]
+        if single:
+            (by,) = by
+    chunk_grp = obj.groupby(by, **groupby_kwargs)
+    if selection is not None:
+        chunk_grp = chunk_grp[selection]
+    return method(chunk_grp, *args, **kwargs)
+
+
+def _share_columns(obj):
+    """Copy the numeric columns of obj into shared memory.
+
+    Args:
+        obj: A DataFrame or Series.
+
+    Returns:
+        tuple: The shared memory blocks and, for each column,
+        the (name, dtype, shape) needed to attach to its block,
+        or None if the column is not shared.
+    """
+    frame = obj.to_frame() if isinstance(obj, pd.Series) else obj
+    blocks, specs = [], []
+    for _, column in frame.items():
+        dtype = column.dtype
+        if not isinstance(dtype, np.dtype) or dtype.kind not in "biufcmM":
+            specs.append(None)
+            continue
+        values = column.to_numpy()
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype, buffer=block.buf)[:] = values
+        blocks.append(block)
+        specs.append((block.name, dtype.str, values.shape))
+    return blocks, specs
+
+
+def _take_chunk(obj, specs, positions) -> dict:
+    """Take the part of a chunk that is not transferred through shared memory.
+
+    Args:
+        obj: The grouped DataFrame or Series.
+        specs: The shared column specs, as returned by `_share_columns`.
+        positions: The positions of the chunk rows.
+
+    Returns:
+        dict: The chunk index, the non-shared columns by position,
+        the column labels, and whether obj is a Series and its name.
+    """
+    is_series = isinstance(obj, pd.Series)
+    frame = obj.to_frame() if is_series else obj
+    return {
+        "index": obj.index[positions],
+        "columns": {
+            i: frame.iloc[positions, i].to_numpy()
+            for i, spec in enumerate(specs)
+            if spec is None
+        },
+        "labels": frame.columns,
+        "series": is_series,
+        "name": obj.name if is_series else None,
+    }
+
+
+def _process_chunk(method, specs, positions, chunk, call):
+    """Rebuild a chunk from shared memory and call the method on it.
+
+    This runs in the worker processes.
+
+    Args:
+        method: The registered method.
+        specs: The shared column specs, as returned by `_share_columns`.
+        positions: The positions of the chunk rows.
+        chunk: The non-shared part of the chunk, see `_take_chunk`.
+        call: The keys, groupby kwargs, selection, args and kwargs,
+            as passed to `_call_on_chunk`.
+
+    Returns:
+        The result of the registered method on the chunk.
+    """
+    data = {}
+    for i, spec in enumerate(specs):
+        if spec is None:
+            data[i] = chunk["columns"][i]
+            continue
+        block_name, dtype, shape = spec
+        block = shared_memory.SharedMemory(name=block_name)
+        try:
+            # fancy indexing copies the chunk rows out of the shared block
+            data[i] = np.ndarray(shape, np.dtype(dtype), buffer=block.buf)[positions]
+        finally:
+            block.close()
+    frame = pd.DataFrame(data, index=chunk["index"])
+    frame.columns = chunk["labels"]
+    obj = frame.iloc[:, 0].rename(chunk["name"]) if chunk["series"] else frame
+    return _call_on_chunk(method, obj, *call)
+
+
+def _combine(results, chunks, grp):
+    """Concatenate the chunk results in group order.
+
+    Args:
+        results: The results of each chunk.
+        chunks: The positions of the rows of each chunk.
+        grp: The GroupBy object.
+
+    Returns:
+        The combined result.
+
+    Raises:
+        TypeError: if a chunk result is neither a DataFrame nor a Series.
+    """
+    for result in results:
+        if not isinstance(result, (pd.DataFrame, pd.Series)):
+            raise TypeError(
+                "groupby methods registered with an engine must return "
+                f"a DataFrame or a Series, got {type(result).__name__}"
+            )
+    obj = grp.obj
+    combined = pd.concat(results)
+    if all(
+        result.index.equals(obj.index[positions])
+        for result, positions in zip(results, chunks)
+    ):
+        # indexed by row: restore the row order of the grouped object
+        combined = combined.iloc[np.argsort(np.concatenate(chunks), kind="stable")]
+    elif not grp.as_index and all(
+        result.index.equals(pd.RangeIndex(len(result))) for result in results
+    ):
+        # one row per group, numbered within each chunk: number them all
+        combined.index = pd.RangeIndex(len(combined))
+    return combined
+
+
+def make_parallel_method(method, engine: str, max_workers: int | None = None):
+    """Wrap a registered groupby method to run over chunks of groups in parallel.
+
+    Args:
+        method: The registered groupby method.
+        engine: "threads" or "processes".
+        max_workers: The number of workers, `os.cpu_count()` by default.
+
+    Returns:
+        callable: The parallel method.
+
+    Raises:
+        ValueError: if the engine is unknown.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    max_workers = max_workers or os.cpu_count() or 1
+
+    @wraps(method)
+    def parallel_method(grp, *args, **kwargs):
+        """Call the method on chunks of groups in parallel.
+
+        Args:
+            grp: The GroupBy object.
+            *args: The arguments to pass to the registered method.
+            **kwargs: The keyword arguments to pass to the registered method.
+
+        Returns:
+            The combined result of the method on each chunk.
+        """
+        keys = _groupby_spec(grp)
+        chunks = (
+            []
+            if keys is False or grp.ngroups == 0
+            else _chunk_positions(grp, max_workers * _CHUNKS_PER_WORKER)
+        )
+        if len(chunks) <= 1:
+            return method(grp, *args, **kwargs)
+
+        obj = grp.obj
+        call = (
+            _groupby_kwargs(grp),
+            None if isinstance(obj, pd.Series) else getattr(grp, "_selection", None),
+            args,
+            kwargs,
+        )
+        executor = _get_executor(engine, max_workers)
+        if engine == "threads":
+            futures = [
+                executor.submit(
+                    _call_on_chunk,
+                    method,
+                    obj.take(positions),
+                    _chunk_keys(keys, positions),
+                    *call,
+                )
+                for positions in chunks
+            ]
+            return _combine([future.result() for future in futures], chunks, grp)
+
+        blocks, specs = _share_columns(obj)
+        try:
+            futures = [
+                executor.submit(
+                    _process_chunk,
+                    method,
+                    specs,
+                    positions,
+                    _take_chunk(obj, specs, positions),
+                    (_chunk_keys(keys, positions), *call),
+                )
+                for positions in chunks
+            ]
+            results = [future.result() for future in futures]
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return _combine(results, chunks, grp)
+
+    return parallel_method
@@ -0,0 +1,328 @@
+"""Sampling profiler for registered method calls.
+
+Tracing every call (see `pandas_flavor.tracing`) costs too much
+on the hottest paths of a production service. The sampling profiler
+only instruments one call in N of each method, and lets the other calls
+run through the untraced path of the `method_call_ctx_factory` protocol:
+
+    profiler = pf.SamplingProfiler(every=100, rates={"rare_method": 1})
+    with profiler:
+        serve_requests()
+    print(profiler.report())
+
+The report estimates the total time of each method from its sampled
+calls and its total number of calls. Sampled calls can also be profiled
+with `cProfile` (`profile=True`), and their peak memory allocation
+measured with `tracemalloc` (`memory=True`).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import itertools
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+import pandas as pd
+
+from .tracing import MethodCallFactory
+
+# The context of the calls that are not sampled, entering to None:
+# the method is called without any further instrumentation.
+_NOT_SAMPLED = nullcontext()
+
+# cProfile cannot run nested profilers in the same thread.
+_profiling = threading.local()
+
+# tracemalloc is process-wide: it is started by the first sampled call
+# measuring memory and stopped by the last one, unless it was already on.
+_memory_lock = threading.Lock()
+_memory_started = False
+# The measurements in progress. tracemalloc has a single peak, reset at the
+# start of each measurement: the peak reached so far is first folded into
+# the measurements in progress, so that nested and concurrent calls do not
+# lose each other's peaks.
+_memory_windows = []
+
+
+class _MemoryWindow:
+    """The memory allocated during a sampled call.
+
+    Args:
+        start: The traced memory in use at the start of the call.
+    """
+
+    __slots__ = ("start", "peak")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.peak = start
+
+
+def _start_memory() -> _MemoryWindow:
+    """Start measuring the memory allocated by a sampled call.
+
+    Returns:
+        _MemoryWindow: The measurement, to pass to `_stop_memory`.
+    """
+    global _memory_started
+    with _memory_lock:
+        if not _memory_windows and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _memory_started = True
+        current, peak = tracemalloc.get_traced_memory()
+        for window in _memory_windows:
+            window.peak = max(window.peak, peak)
+        tracemalloc.reset_peak()
+        window = _MemoryWindow(current)
+        _memory_windows.append(window)
+        return window
+
+
+def _stop_memory(window: _MemoryWindow) -> int:
+    """Stop measuring the memory allocated by a sampled call.
+
+    Args:
+        window: The measurement returned by `_start_memory`.
+
+    Returns:
+        int: The peak memory allocated during the call, in bytes.
+    """
+    global _memory_started
+    with _memory_lock:
+        # the peak was last reset when this call or a later one started
+        peak = max(window.peak, tracemalloc.get_traced_memory()[1])
+        _memory_windows.remove(window)
+        if not _memory_windows and _memory_started:
+            tracemalloc.stop()
+            _memory_started = False
+        return max(peak - window.start, 0)
+
+
+class _SampledCall:
+    """Method call context measuring a single sampled call.
+
+    Args:
+        profiler: The profiler to record the call into.
+        method_name: The name of the called method.
+    """
+
+    __slots__ = (
+        "_profiler",
+        "_method_name",
+        "_start_ns",
+        "_cpu_start_ns",
+        "_memory_start",
+        "_profile",
+    )
+
+    def __init__(self, profiler: SamplingProfiler, method_name: str):
+        self._profiler = profiler
+        self._method_name = method_name
+        self._memory_start = None
+        self._profile = None
+
+    def __enter__(self):
+        """Start the measurements.
+
+        Returns:
+            None, so that the method is called without further handling.
+        """
+        if self._profiler.memory:
+            self._memory_start = _start_memory()
+        if self._profiler.profile and not getattr(_profiling, "active", False):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # another profiling tool is active
+                pass
+            else:
+                self._profile = profile
+                _profiling.active = True
+        self._cpu_start_ns = time.thread_time_ns()
+        self._start_ns = time.perf_counter_ns()
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the measurements and record the call into the profiler.
+
+        Args:
+            exc_type: The type of the exception raised by the method, if any.
+            exc_value: The exception raised by the method, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        wall_ns = time.perf_counter_ns() - self._start_ns
+        cpu_ns = time.thread_time_ns() - self._cpu_start_ns
+        if self._profile is not None:
+            self._profile.disable()
+            _profiling.active = False
+        peak = -1 if self._memory_start is None else _stop_memory(self._memory_start)
+        self._profiler._record(
+            self._method_name,
+            wall_ns,
+            cpu_ns,
+            peak,
+            exc_type is not None,
+            self._profile,
+        )
+
+
+class SamplingProfiler(MethodCallFactory):
+    """Measure one call in N of each registered method.
+
+    The profiler is a `method_call_ctx_factory`, enabled like
+    `MethodCallTracer`. The first call of each method is always sampled.
+
+    Args:
+        every: Sample one call in `every` of each method.
+        rates: Per-method overrides of `every`, by method name.
+        profile: Whether to run sampled calls under `cProfile`.
+            Calls of registered methods nested in a profiled call
+            are part of its profile, rather than profiled on their own.
+        memory: Whether to measure the peak memory allocated by sampled calls
+            with `tracemalloc`. tracemalloc is only on during sampled calls,
+            unless it was already started. Allocations made by other threads
+            at the same time are included.
+    """
+
+    def __init__(
+        self,
+        every: int = 100,
+        rates: dict | None = None,
+        profile: bool = False,
+        memory: bool = False,
+    ):
+        rates = dict(rates or {})
+        if every <= 0 or any(rate <= 0 for rate in rates.values()):
+            raise ValueError("sampling rates must be positive integers")
+        self.every = every
+        self.rates = rates
+        self.profile = profile
+        self.memory = memory
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __call__(self, method_name: str, args, kwargs):
+        """Create the context of a single method call.
+
+        Args:
+            method_name: The name of the called method.
+            args: The arguments of the method call.
+            kwargs: The keyword arguments of the method call.
+
+        Returns:
+            The method call context, measuring the call if it is sampled.
+        """
+        counter = self._counters.get(method_name)
+        if counter is None:
+            counter = self._counters.setdefault(method_name, itertools.count())
+        # next() on itertools.count is atomic, so concurrent calls
+        # are sampled at the requested rate
+        index = next(counter)
+        self._calls[method_name] = index + 1
+        if index % self.rates.get(method_name, self.every):
+            return _NOT_SAMPLED
+        return _SampledCall(self, method_name)
+
+    def _record(self, method_name, wall_ns, cpu_ns, peak, error, profile):
+        """Aggregate a sampled call.
+
+        Args:
+            method_name: The name of the called method.
+            wall_ns: The wall time of the call.
+            cpu_ns: The CPU time of the call.
+            peak: The peak memory allocated during the call, or -1.
+            error: Whether the method raised an exception.
+            profile: The `cProfile.Profile` of the call, or None.
+        """
+        with self._lock:
+            stats = self._samples.setdefault(method_name, [0, 0, 0, 0, -1, 0])
+            stats[0] += 1
+            stats[1] += wall_ns
+            stats[2] += cpu_ns
+            stats[3] += max(peak, 0)
+            stats[4] = max(stats[4], peak)
+            stats[5] += error
+            if profile is not None:
+                if method_name in self._profiles:
+                    self._profiles[method_name].add(profile)
+                else:
+                    self._profiles[method_name] = pstats.Stats(profile)
+
+    def clear(self):
+        """Drop all measurements and restart the call counts."""
+        with self._lock:
+            self._counters = {}
+            self._calls = {}
+            # method name -> [samples, wall_ns, cpu_ns, peak sum, peak max, errors]
+            self._samples = {}
+            self._profiles = {}
+
+    def calls(self, method_name: str) -> int:
+        """Return the number of calls of a method seen by the profiler.
+
+        Args:
+            method_name: The name of the method.
+
+        Returns:
+            int: The number of sampled and unsampled calls.
+        """
+        return self._calls.get(method_name, 0)
+
+    def profile_stats(self, method_name: str) -> pstats.Stats | None:
+        """Return the merged `cProfile` statistics of the sampled calls.
+
+        Args:
+            method_name: The name of the method.
+
+        Returns:
+            The statistics, or None if no call of the method was profiled.
+        """
+        return self._profiles.get(method_name)
+
+    def report(self) -> pd.DataFrame:
+        """Aggregate the sampled calls per method.
+
+        Returns:
+            A DataFrame indexed by method name with the number of calls
+            and of sampled calls, the mean wall and CPU time of the sampled
+            calls and the estimated total wall time of all calls,
+            in milliseconds, the mean and maximum peak memory of the sampled
+            calls in bytes (-1 when not measured) and the number of sampled
+            calls that raised, sorted by estimated total time.
+        """
+        with self._lock:
+            samples = dict(self._samples)
+        rows = {}
+        for method_name, (n, wall, cpu, peak, peak_max, errors) in samples.items():
+            calls = self.calls(method_name)
+            rows[method_name] = {
+                "calls": calls,
+                "samples": n,
+                "mean_ms": wall / n / 1e6,
+                "cpu_mean_ms": cpu / n / 1e6,
+                "est_total_ms": wall / n * calls / 1e6,
+                "peak_mean_bytes": peak / n if self.memory else -1,
+                "peak_max_bytes": peak_max,
+                "errors": errors,
+            }
+        report = pd.DataFrame.from_dict(
+            rows,
+            orient="index",
+            columns=[
+                "calls",
+                "samples",
+                "mean_ms",
+                "cpu_mean_ms",
+                "est_total_ms",
+                "peak_mean_bytes",
+                "peak_max_bytes",
+                "errors",
+            ],
+        )
+        report.index.name = "method"
+        return report.sort_values("est_total_ms", ascending=False)
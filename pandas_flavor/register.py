@@ -2,19 +2,101 @@
 
 from __future__ import annotations
 
-import inspect
+import os
+import sys
 import warnings
-from functools import wraps
-
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial, wraps
+from time import perf_counter_ns
+from types import FunctionType
+
+import pandas
+from pandas import DataFrame, Series
 from pandas.api.extensions import (
     register_dataframe_accessor,
     register_series_accessor,
 )
 from pandas.core.groupby.generic import DataFrameGroupBy, SeriesGroupBy
-from pandas.util._exceptions import find_stack_level
+
+from .binding import MethodSignature
+
+# warnings point at the first frame outside of these packages
+_LIBRARY_DIRS = tuple(
+    os.path.dirname(path) + os.sep for path in (__file__, pandas.__file__)
+)
+
+
+def _find_stack_level() -> int:
+    """Find the first stack frame outside of pandas_flavor and pandas.
+
+    Like `pandas.util._exceptions.find_stack_level`, which only skips
+    the frames of pandas, so that the warnings of registered method calls
+    (which may be made by pandas, e.g. in `DataFrame.pipe`) and of
+    registrations point at user code.
+
+    Returns:
+        int: The `stacklevel` of `warnings.warn` pointing to user code.
+    """
+    frame = sys._getframe()
+    level = 0
+    while frame is not None and frame.f_code.co_filename.startswith(_LIBRARY_DIRS):
+        frame = frame.f_back
+        level += 1
+    return level
+
 
 method_call_ctx_factory = None
 
+# Overrides the global method_call_ctx_factory in the current context only,
+# see call_context. Unset by default, so that the global applies.
+_scoped_method_call_ctx_factory = ContextVar("method_call_ctx_factory")
+
+# Whether methods registered from now on are instrumented,
+# see set_instrumentation
+_instrument_new_methods = True
+
+
+def get_method_call_ctx_factory():
+    """Return the method call context factory in effect.
+
+    This is the factory set with `call_context` in the current thread
+    or asyncio task, if any, and the global `method_call_ctx_factory`
+    otherwise.
+
+    Returns:
+        The factory, or None if registered method calls are not traced.
+    """
+    return _scoped_method_call_ctx_factory.get(method_call_ctx_factory)
+
+
+@contextmanager
+def call_context(factory):
+    """Use `factory` as the method call context factory within a block.
+
+    Unlike setting the global `method_call_ctx_factory`, the factory only
+    applies to registered method calls made from the current thread
+    or asyncio task (and the tasks it starts), which makes it possible
+    to trace a single request of a multi-threaded or asynchronous service:
+
+        with pf.call_context(tracer):
+            df.my_method()
+
+    Passing None disables tracing within the block
+    even if the global `method_call_ctx_factory` is set.
+
+    Args:
+        factory: The method call context factory, or None.
+
+    Yields:
+        The factory.
+    """
+    token = _scoped_method_call_ctx_factory.set(factory)
+    try:
+        yield factory
+    finally:
+        _scoped_method_call_ctx_factory.reset(token)
+
 
 def handle_pandas_extension_call(method, method_signature, obj, args, kwargs):
     """Handle pandas extension call.
@@ -24,7 +106,8 @@ def handle_pandas_extension_call(method, method_signature, obj, args, kwargs):
     The pandas extension mechanism passes args and kwargs
     of the original method call as it is applied to obj.
 
-    Our implementation uses the global variable `method_call_ctx_factory`.
+    Our implementation uses the global variable `method_call_ctx_factory`,
+    unless it is overridden for the current context with `call_context`.
 
     `method_call_ctx_factory` can be either None or an abstract class.
 
@@ -70,7 +153,8 @@ def handle_pandas_extension_call(method, method_signature, obj, args, kwargs):
     Args:
         method (callable): method object as registered by decorator
             register_dataframe_method (or register_series_method)
-        method_signature: signature of method as returned by inspect.signature
+        method_signature: signature of method, a `MethodSignature`
+            binding arguments faster than `inspect.Signature`
         obj: Dataframe or Series
         args: The arguments to pass to the registered method.
         kwargs: The keyword arguments to pass to the registered method.
@@ -79,19 +163,21 @@ def handle_pandas_extension_call(method, method_signature, obj, args, kwargs):
         object`: The result of calling of the method.
     """  # noqa: E501
 
-    global method_call_ctx_factory
-    with method_call_ctx_factory(method.__name__, args, kwargs) as method_call_ctx:
+    factory = get_method_call_ctx_factory()
+    with factory(method.__name__, args, kwargs) as method_call_ctx:
         if method_call_ctx is None:  # nullcontext __enter__ returns None
             ret = method(obj, *args, **kwargs)
         else:
-            all_args = tuple([obj] + list(args))
+            all_args = (obj, *args)
             (
                 new_args,
                 new_kwargs,
             ) = method_call_ctx.handle_start_method_call(
                 method.__name__, method_signature, all_args, kwargs
             )
-            args = new_args[1:]
+            # contexts usually return the arguments unchanged
+            if new_args is not all_args:
+                args = new_args[1:]
             kwargs = new_kwargs
 
             ret = method(obj, *args, **kwargs)
@@ -101,136 +187,723 @@ def handle_pandas_extension_call(method, method_signature, obj, args, kwargs):
         return ret
 
 
-def register_dataframe_method(method):
-    """Register a function as a method attached to the Pandas DataFrame.
+_LAZY_SELECTIONS = ("columns", "rows")
 
-    Example:
 
-        @register_dataframe_method
-        def print_column(df, col):
-            '''Print the dataframe column given'''
-            print(df[col])
+class RegisteredMethod:
+    """A function registered as a method of a pandas class.
 
-    Args:
-        method (callable): callable to register as a dataframe method.
+    Keeps the options the method was registered with,
+    so that other parts of pandas_flavor (e.g. lazy plans) can look them up.
 
-    Returns:
-        callable: The original method.
+    Args:
+        method (callable): The registered function.
+        method_signature: The `MethodSignature` of method,
+            or None to compute it the first time it is needed.
+        cls: The class the method is attached to.
+        direct: Whether the method was registered directly on the class
+            instead of going through an accessor.
+        selects: What the method selects from its input in lazy plans,
+            "columns", "rows" or None.
+        pushdown: The kinds of selections that may be moved ahead of the
+            method in lazy plans, a subset of ("columns", "rows").
+        cache: The `ResultCache` memoizing the method results, or None.
+        engine: The engine running groupby methods over chunks of groups
+            in parallel, "threads", "processes" or None.
+        max_workers: The number of workers of the engine.
+        chunkwise: Whether the method can be applied to each chunk of
+            a DataFrame separately, see `pandas_flavor.streaming`.
+        combine: The function combining the results of an aggregating method
+            on two chunks into one, or None.
+        mutation: How the method treats the object it is called on,
+            "inplace", "returns_view", "returns_new" or None if undeclared,
+            see `pandas_flavor.mutation`.
+        ufunc: The `VectorizedFunction` applying the method elementwise,
+            for scalar functions registered with `vectorize=True`, or None.
+        elementwise: Whether each element of the result of the method
+            only depends on the same element of its input,
+            see `pandas_flavor.lazy`. Implied by `ufunc`.
+        agg: The reduction a groupby method amounts to, or a function
+            of the call arguments returning it, see `pandas_flavor.aggregate`.
     """
 
-    method_signature = inspect.signature(method)
+    def __init__(
+        self,
+        method,
+        method_signature,
+        cls: type,
+        direct: bool = False,
+        selects: str | None = None,
+        pushdown=(),
+        cache=None,
+        engine: str | None = None,
+        max_workers: int | None = None,
+        chunkwise: bool = False,
+        combine=None,
+        mutation: str | None = None,
+        ufunc=None,
+        elementwise: bool = False,
+        agg=None,
+    ):
+        if selects is not None and selects not in _LAZY_SELECTIONS:
+            raise ValueError(
+                f"selects must be one of {_LAZY_SELECTIONS} or None, got {selects!r}"
+            )
+        pushdown = frozenset(pushdown)
+        if not pushdown <= set(_LAZY_SELECTIONS):
+            raise ValueError(
+                f"pushdown must be a subset of {_LAZY_SELECTIONS}, "
+                f"got {sorted(pushdown)!r}"
+            )
+        if mutation is not None:
+            from .mutation import MUTATIONS
 
-    def inner(*args, **kwargs):
-        """Inner function to register the method.
+            if mutation not in MUTATIONS:
+                raise ValueError(
+                    f"mutation must be one of {MUTATIONS} or None, got {mutation!r}"
+                )
+            if mutation == "inplace" and cache is not None:
+                raise ValueError("methods modifying their input cannot be cached")
+        self.method = method
+        self._method_signature = method_signature
+        self.cls = cls
+        self.direct = direct
+        self.selects = selects
+        self.pushdown = pushdown
+        self.cache = cache
+        self.engine = engine
+        self.max_workers = max_workers
+        self.chunkwise = chunkwise
+        self.combine = combine
+        self.mutation = mutation
+        self.ufunc = ufunc
+        self.elementwise = elementwise or ufunc is not None
+        self.agg = agg
+        # backend -> implementation, see pandas_flavor.backends
+        self.impls = {}
+        self.instrumented = _instrument_new_methods
+        # swaps the installed call implementation, set on installation
+        self._install = None
+
+    @property
+    def name(self) -> str:
+        """The name the method is registered under."""
+        return self.method.__name__
+
+    @property
+    def method_signature(self) -> MethodSignature:
+        """The signature of the method.
+
+        Computing a signature costs more than the rest of the registration,
+        so it is only computed on the first traced (or cached) call.
+        """
+        if self._method_signature is None:
+            self._method_signature = MethodSignature.from_callable(self.method)
+        return self._method_signature
+
+    def set_instrumented(self, instrumented: bool):
+        """Install the instrumented or the raw call implementation.
 
-        This function is called when the user
-        decorates a function with register_dataframe_method.
+        Instrumented calls go through the method call context factory
+        in effect, if any. Raw calls go straight to the method,
+        and are never traced.
 
         Args:
-            *args: The arguments to pass to the registered method.
-            **kwargs: The keyword arguments to pass to the registered method.
+            instrumented: Whether to instrument the calls of the method.
+        """
+        if self._install is not None:
+            self._install(instrumented)
+        self.instrumented = instrumented
+
+    def register_impl(self, backend: str, impl=None):
+        """Register the implementation of the method for another backend.
+
+        The implementation is called by `pandas_flavor.backends.call`
+        on objects of that backend, with the same arguments:
+
+            @my_method.register_impl("polars")
+            def _(df, column):
+                return df.filter(pl.col(column) > 0)
+
+        Args:
+            backend: "pyarrow" or "polars".
+            impl (callable): The implementation, taking an object
+                of the backend instead of a pandas object.
 
         Returns:
-            method: The original method.
+            callable: The implementation.
+
+        Raises:
+            ValueError: if the backend is unknown.
         """
+        from .backends import BACKENDS
+
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        if impl is None:
+            return partial(self.register_impl, backend)
+        self.impls[backend] = impl
+        return impl
+
+    def __repr__(self):
+        """Return the representation of the registered method.
+
+        Returns:
+            str: The representation.
+        """
+        return f"<RegisteredMethod {self.cls.__name__}.{self.name}>"
+
 
-        class AccessorMethod(object):
-            """DataFrame Accessor method class.
+# (class, method name) -> RegisteredMethod
+_registered_methods = {}
+
+
+def find_registered_method(obj, name: str) -> RegisteredMethod | None:
+    """Find the method registered under `name` for the type of `obj`.
+
+    Args:
+        obj: The object the method would be called on, or its class.
+        name: The name of the method.
+
+    Returns:
+        The registered method, or None if no such method is registered.
+    """
+    obj_cls = obj if isinstance(obj, type) else type(obj)
+    for cls in obj_cls.__mro__:
+        registered = _registered_methods.get((cls, name))
+        if registered is not None:
+            return registered
+    return None
+
+
+def set_instrumentation(enabled: bool, methods=None):
+    """Instrument the registered methods, or make their calls raw.
+
+    Instrumented calls look up the method call context factory in effect
+    and go through it when it is set. Raw calls skip the lookup:
+    accessor methods call the registered function directly, and direct
+    methods are the registered function itself, bound like any method.
+    Raw calls are never traced, whatever factory is set.
+
+        pf.set_instrumentation(False)  # production: no tracing overhead
+        pf.set_instrumentation(True, methods=["clean_names"])
+
+    Args:
+        enabled: Whether to instrument the methods.
+        methods: The names of the methods to switch, for all the classes
+            they are registered for. None for all the registered methods
+            and the methods registered from now on.
+    """
+    global _instrument_new_methods
+    if methods is None:
+        _instrument_new_methods = enabled
+        targets = list(_registered_methods.values())
+    else:
+        names = {methods} if isinstance(methods, str) else set(methods)
+        targets = [
+            registered
+            for registered in _registered_methods.values()
+            if registered.name in names
+        ]
+    for registered in targets:
+        registered.set_instrumented(enabled)
+
+
+def registered_methods() -> DataFrame:
+    """List the registered methods.
+
+    Returns:
+        DataFrame: One row per method, with the name of the class
+        it is registered for, its name, its registration
+        ("accessor" or "direct") and whether it is instrumented.
+    """
+    return DataFrame(
+        [
+            (
+                registered.cls.__name__,
+                registered.name,
+                "direct" if registered.direct else "accessor",
+                registered.instrumented,
+            )
+            for registered in _registered_methods.values()
+        ],
+        columns=["class", "name", "registration", "instrumented"],
+    )
+
+
+def _make_accessor_method(method, registered: RegisteredMethod):
+    """Make the accessor class mimicking the registered method.
+
+    The `__call__` of the class is swapped between an instrumented and
+    a raw implementation by `registered.set_instrumented`.
+
+    Args:
+        method (callable): method object as registered by decorator.
+        registered: The registered method, holding the method signature
+            passed to method call contexts.
+
+    Returns:
+        The accessor class.
+    """
+
+    class AccessorMethod(object):
+        """Accessor method class.
+
+        Args:
+            pandas_obj: The pandas object the method is called on.
+        """
+
+        __doc__ = method.__doc__
+
+        def __init__(self, pandas_obj):
+            self._obj = pandas_obj
+
+        @wraps(method)
+        def __call__(self, *args, **kwargs):
+            """Call the accessor method.
 
             Args:
-                pandas_obj (pandas.DataFrame): The pandas DataFrame object.
+                *args: The arguments to pass to the registered method.
+                **kwargs: The keyword arguments to pass
+                    to the registered method.
+
+            Returns:
+                object: The result of calling of the method.
             """
+            if _scoped_method_call_ctx_factory.get(method_call_ctx_factory) is None:
+                return method(self._obj, *args, **kwargs)
 
-            def __init__(self, pandas_obj):
-                self._obj = pandas_obj
+            return handle_pandas_extension_call(
+                method, registered.method_signature, self._obj, args, kwargs
+            )
 
-            @wraps(method)
-            def __call__(self, *args, **kwargs):
-                """Call the accessor method.
+    instrumented_call = AccessorMethod.__call__
 
-                Args:
-                    *args: The arguments to pass to the registered method.
-                    **kwargs: The keyword arguments to pass
-                        to the registered method.
+    @wraps(method)
+    def raw_call(self, *args, **kwargs):
+        """Call the accessor method, untraced.
 
-                Returns:
-                    object: The result of calling of the method.
-                """
-                global method_call_ctx_factory
-                if method_call_ctx_factory is None:
-                    return method(self._obj, *args, **kwargs)
+        Args:
+            *args: The arguments to pass to the registered method.
+            **kwargs: The keyword arguments to pass to the registered method.
 
-                return handle_pandas_extension_call(
-                    method, method_signature, self._obj, args, kwargs
-                )
+        Returns:
+            object: The result of calling of the method.
+        """
+        return method(self._obj, *args, **kwargs)
 
-        register_dataframe_accessor(method.__name__)(AccessorMethod)
+    def install(instrumented: bool):
+        """Swap the call implementation of the accessor.
 
-        return method
+        Args:
+            instrumented: Whether to install the instrumented implementation.
+        """
+        AccessorMethod.__call__ = instrumented_call if instrumented else raw_call
 
-    return inner()
+    registered._install = install
+    install(registered.instrumented)
+    return AccessorMethod
 
 
-def register_series_method(method):
-    """Register a function as a method attached to the Pandas Series.
+def _make_direct_method(method, registered: RegisteredMethod):
+    """Make a plain function that dispatches to the registered method.
+
+    Unlike the accessor-based registration, the returned function is
+    set directly on the target class, so that Python binds it like any
+    other method and no per-object accessor instance is created.
+
+    When the method is not instrumented, the method itself is returned
+    (wrapped only if it is not a plain function, which would not bind),
+    so that calls have no overhead at all. `registered.set_instrumented`
+    sets the other function on the class.
 
     Args:
-        method (callable): callable to register as a series method.
+        method (callable): method object as registered by decorator.
+        registered: The registered method, holding the method signature
+            passed to method call contexts.
 
     Returns:
-        callable: The original method.
+        callable: The function to set on the target class.
     """
 
-    method_signature = inspect.signature(method)
-
-    def inner(*args, **kwargs):
-        """Inner function to register the method.
+    @wraps(method)
+    def direct_method(obj, *args, **kwargs):
+        """Call the registered method.
 
         Args:
+            obj: The object the method is called on.
             *args: The arguments to pass to the registered method.
             **kwargs: The keyword arguments to pass to the registered method.
 
         Returns:
-            method: The original method.
+            object: The result of calling of the method.
         """
+        if _scoped_method_call_ctx_factory.get(method_call_ctx_factory) is None:
+            return method(obj, *args, **kwargs)
 
-        class AccessorMethod(object):
-            """Series Accessor method class.
+        return handle_pandas_extension_call(
+            method, registered.method_signature, obj, args, kwargs
+        )
+
+    raw_method = method
+    if not isinstance(method, FunctionType):
+
+        @wraps(method)
+        def raw_method(obj, *args, **kwargs):
+            """Call the registered method, untraced.
 
             Args:
-                pandas_obj (pandas.Series): The pandas Series object.
+                obj: The object the method is called on.
+                *args: The arguments to pass to the registered method.
+                **kwargs: The keyword arguments to pass to the registered method.
+
+            Returns:
+                object: The result of calling of the method.
             """
+            return method(obj, *args, **kwargs)
 
-            __doc__ = method.__doc__
+    def install(instrumented: bool):
+        """Set the instrumented or the raw function on the class.
 
-            def __init__(self, pandas_obj):
-                self._obj = pandas_obj
+        Args:
+            instrumented: Whether to set the instrumented function.
+        """
+        setattr(
+            registered.cls,
+            registered.name,
+            direct_method if instrumented else raw_method,
+        )
 
-            @wraps(method)
-            def __call__(self, *args, **kwargs):
-                """Call the accessor method.
+    registered._install = install
+    return direct_method if registered.instrumented else raw_method
 
-                Args:
-                    *args: The arguments to pass to the registered method.
-                    **kwargs: The keyword arguments to pass
-                        to the registered method.
 
-                Returns:
-                    object: The result of calling of the method.
-                """
-                global method_call_ctx_factory
-                if method_call_ctx_factory is None:
-                    return method(self._obj, *args, **kwargs)
+def _register_direct_method(name: str, cls: type, method, registered):
+    """Register a function as a plain method of `cls`.
 
-                return handle_pandas_extension_call(
-                    method, method_signature, self._obj, args, kwargs
-                )
+    A warning is issued if this name conflicts with a preexisting attribute,
+    the same way pandas does for accessors.
 
-        register_series_accessor(method.__name__)(AccessorMethod)
+    Args:
+        name: Name under which the method should be registered.
+        cls: The class to attach the method to.
+        method (callable): method object as registered by decorator.
+        registered: The registered method.
+    """
+    if hasattr(cls, name):
+        warnings.warn(
+            f"registration of method {repr(method)} under name "
+            f"{repr(name)} for type {repr(cls)} "
+            "is overriding a preexisting "
+            f"attribute with the same name.",
+            UserWarning,
+            stacklevel=_find_stack_level(),
+        )
+    setattr(cls, name, _make_direct_method(method, registered))
+
+
+def _prepare_method(
+    method,
+    cls: type,
+    pure: bool = False,
+    vectorize: bool = False,
+    jit: bool | None = None,
+    **options,
+):
+    """Create the registry entry and the implementation of a method.
 
-        return method
+    Args:
+        method (callable): callable to register as a method.
+        cls: The class to attach the method to.
+        pure: Whether to memoize the method results in the default cache,
+            unless a cache is given in the options.
+        vectorize: Whether the method is a scalar function
+            to apply to every element of the object.
+        jit: Whether to compile vectorized methods with numba,
+            see `pandas_flavor.vectorize.VectorizedFunction`.
+        **options: The registration options, see `RegisteredMethod`.
+
+    Returns:
+        tuple: The `RegisteredMethod` and the function to call,
+        which wraps the method with its cache and engine, if any.
+
+    Raises:
+        ValueError: if `jit` is given without `vectorize=True`.
+    """
+    if pure and options.get("cache") is None:
+        from .cache import default_cache
+
+        options["cache"] = default_cache
+    if vectorize:
+        from .vectorize import VectorizedFunction
+
+        options["ufunc"] = VectorizedFunction(method, jit)
+    elif jit is not None:
+        raise ValueError("jit only applies to methods registered with vectorize=True")
+    registered = RegisteredMethod(method, None, cls, **options)
+    if cls is DataFrame or cls is Series:
+        try:
+            # `@my_method.register_impl("polars")`
+            method.register_impl = registered.register_impl
+        except AttributeError:
+            # e.g. builtins
+            pass
+    impl = method
+    if registered.ufunc is not None:
+        from .vectorize import make_vectorized_method
+
+        impl = make_vectorized_method(registered.ufunc)
+    if registered.mutation is not None:
+        from .mutation import make_mutation_method
+
+        impl = make_mutation_method(impl, registered.mutation)
+    if registered.cache is not None:
+        # the signature is computed on the first call
+        impl = registered.cache.wrap(impl, registered)
+    if registered.engine is not None:
+        from .parallel import make_parallel_method
+
+        impl = make_parallel_method(impl, registered.engine, registered.max_workers)
+    return registered, impl
+
+
+def _register_method(method, cls: type, register_accessor, **options):
+    """Register a function as a method of `cls`.
+
+    Args:
+        method (callable): callable to register as a method.
+        cls: The class to attach the method to.
+        register_accessor: The accessor registration function for `cls`,
+            used unless the method is registered directly.
+        **options: The registration options, see `_prepare_method`.
+
+    Returns:
+        callable: The original method.
+    """
+    registered, impl = _prepare_method(method, cls, **options)
+    if registered.direct:
+        _register_direct_method(method.__name__, cls, impl, registered)
+    else:
+        register_accessor(method.__name__)(_make_accessor_method(impl, registered))
+    _registered_methods[cls, method.__name__] = registered
+    return method
+
+
+def register_dataframe_method(
+    method=None,
+    *,
+    direct: bool = False,
+    selects: str | None = None,
+    pushdown=(),
+    pure: bool = False,
+    cache=None,
+    chunkwise: bool = False,
+    combine=None,
+    mutation: str | None = None,
+):
+    """Register a function as a method attached to the Pandas DataFrame.
+
+    Example:
+
+        @register_dataframe_method
+        def print_column(df, col):
+            '''Print the dataframe column given'''
+            print(df[col])
+
+    By default the method is installed through a pandas accessor,
+    which creates an accessor object the first time the method is looked up
+    on each DataFrame. With `direct=True` the method is instead set
+    on the DataFrame class itself and binds like a plain function,
+    which avoids the per-object allocation on hot paths:
+
+        @register_dataframe_method(direct=True)
+        def print_column(df, col):
+            print(df[col])
+
+    `selects` and `pushdown` describe the method to the optimizer
+    of lazy plans (see `pandas_flavor.lazy`). A method that selects columns
+    or filters rows declares `selects="columns"` or `selects="rows"`.
+    A method that gives the same result whether such a selection is applied
+    before or after it declares the selections in `pushdown`,
+    e.g. `pushdown=("rows",)` for a method computing each row independently.
+
+    A method whose result only depends on its arguments and the content
+    of the DataFrame can declare `pure=True` to have its results memoized
+    (see `pandas_flavor.cache`).
+
+    A method that can be applied to each chunk of a DataFrame separately
+    (e.g. row-wise methods) declares `chunkwise=True`, and a method aggregating
+    its input declares how to combine the results of two chunks with `combine`.
+    Such methods can be applied to DataFrames read in chunks
+    (see `pandas_flavor.streaming`).
+
+    A method modifying the DataFrame it is called on declares
+    `mutation="inplace"`, and is then called on a Copy-on-Write copy of it,
+    so that callers need no defensive copy (see `pandas_flavor.mutation`).
 
-    return inner()
+    Implementations for pyarrow and Polars data can be added with
+    `print_column.register_impl("polars")`, see `pandas_flavor.backends`.
+
+    Args:
+        method (callable): callable to register as a dataframe method.
+        direct: If True, register the method directly on the DataFrame class
+            instead of going through a pandas accessor.
+        selects: "columns" or "rows" if the method is a column selection
+            or a row filter.
+        pushdown: The selections ("columns", "rows") that may be moved ahead
+            of the method in lazy plans.
+        pure: If True, memoize the method results in the default
+            `ResultCache`.
+        cache: The `ResultCache` to memoize the method results in.
+            Implies `pure=True`.
+        chunkwise: If True, the method can be applied to each chunk
+            of a DataFrame separately and the results concatenated.
+        combine: A function `combine(result1, result2)` combining the results
+            of the method on two chunks, for aggregating methods.
+        mutation: "inplace" if the method modifies the DataFrame,
+            "returns_view" if its result may share data with the DataFrame,
+            "returns_new" if it never does.
+
+    Returns:
+        callable: The original method.
+    """
+    if method is None:
+        return partial(
+            register_dataframe_method,
+            direct=direct,
+            selects=selects,
+            pushdown=pushdown,
+            pure=pure,
+            cache=cache,
+            chunkwise=chunkwise,
+            combine=combine,
+            mutation=mutation,
+        )
+
+    return _register_method(
+        method,
+        DataFrame,
+        register_dataframe_accessor,
+        direct=direct,
+        selects=selects,
+        pushdown=pushdown,
+        pure=pure,
+        cache=cache,
+        chunkwise=chunkwise,
+        combine=combine,
+        mutation=mutation,
+    )
+
+
+def register_series_method(
+    method=None,
+    *,
+    direct: bool = False,
+    pure: bool = False,
+    cache=None,
+    mutation: str | None = None,
+    vectorize: bool = False,
+    jit: bool | None = None,
+    elementwise: bool = False,
+):
+    """Register a function as a method attached to the Pandas Series.
+
+    With `vectorize=True` the function is a scalar function,
+    called as `method(x, *args, **kwargs)` for every element `x`
+    of the Series, and compiled into a ufunc applied to all of its values
+    at once (see `pandas_flavor.vectorize`).
+
+    A method returning a Series whose elements each only depend on the same
+    element of its input (e.g. `s.str.strip()`) declares `elementwise=True`,
+    and adjacent elementwise methods of lazy chains are fused into
+    a single pass (see `pandas_flavor.lazy`).
+
+    Args:
+        method (callable): callable to register as a series method.
+        direct: If True, register the method directly on the Series class
+            instead of going through a pandas accessor.
+            See `register_dataframe_method` for details.
+        pure: If True, memoize the method results in the default
+            `ResultCache`.
+        cache: The `ResultCache` to memoize the method results in.
+            Implies `pure=True`.
+        mutation: "inplace", "returns_view" or "returns_new",
+            see `register_dataframe_method` for details.
+        vectorize: If True, the method is a scalar function
+            applied to every element of the Series.
+        jit: Whether to compile the vectorized function with numba:
+            True to require numba, False to never use it,
+            None (default) to use it when it is installed.
+        elementwise: If True, the method computes each element
+            of the Series independently of the others.
+            Implied by `vectorize=True`.
+
+    Returns:
+        callable: The original method.
+    """
+    if method is None:
+        return partial(
+            register_series_method,
+            direct=direct,
+            pure=pure,
+            cache=cache,
+            mutation=mutation,
+            vectorize=vectorize,
+            jit=jit,
+            elementwise=elementwise,
+        )
+
+    return _register_method(
+        method,
+        Series,
+        register_series_accessor,
+        direct=direct,
+        pure=pure,
+        cache=cache,
+        mutation=mutation,
+        vectorize=vectorize,
+        jit=jit,
+        elementwise=elementwise,
+    )
+
+
+def register_series_ufunc(
+    method=None,
+    *,
+    direct: bool = False,
+    pure: bool = False,
+    cache=None,
+    jit: bool | None = None,
+):
+    """Register a scalar function as an elementwise method of the Pandas Series.
+
+    Example:
+
+        @register_series_ufunc
+        def clip_score(x, low=0.0, high=1.0):
+            return min(max(x, low), high)
+
+        s.clip_score(high=0.5)
+
+    This is `register_series_method(vectorize=True)`.
+
+    Args:
+        method (callable): scalar function to register as a series method.
+        direct: If True, register the method directly on the Series class
+            instead of going through a pandas accessor.
+        pure: If True, memoize the method results in the default
+            `ResultCache`.
+        cache: The `ResultCache` to memoize the method results in.
+        jit: Whether to compile the function with numba:
+            True to require numba, False to never use it,
+            None (default) to use it when it is installed.
+
+    Returns:
+        callable: The original function.
+    """
+    return register_series_method(
+        method, direct=direct, pure=pure, cache=cache, vectorize=True, jit=jit
+    )
 
 
 # variant of pandas' accessor
@@ -321,7 +994,7 @@ def _register_accessor(name: str, cls: DataFrameGroupBy | SeriesGroupBy):
                 "is overriding a preexisting "
                 f"attribute with the same name.",
                 UserWarning,
-                stacklevel=find_stack_level(),
+                stacklevel=_find_stack_level(),
             )
         setattr(cls, name, CachedAccessor(name, accessor))
         if not hasattr(cls, "_accessors"):
@@ -356,7 +1029,14 @@ def register_series_groupby_accessor(name: str):
     return _register_accessor(name, SeriesGroupBy)
 
 
-def register_dataframe_groupby_method(method):
+def register_dataframe_groupby_method(
+    method=None,
+    *,
+    direct: bool = False,
+    engine: str | None = None,
+    max_workers: int | None = None,
+    agg=None,
+):
     """Register a function as a method attached to the pandas DataFrameGroupBy.
 
     Example:
@@ -370,65 +1050,51 @@ def register_dataframe_groupby_method(method):
     Args:
         method: Function to be registered as a method
             on the DataFrameGroupBy object.
+        direct: If True, register the method directly on the DataFrameGroupBy class
+            instead of going through an accessor.
+            See `register_dataframe_method` for details.
+        engine: If "threads" or "processes", split the groups into chunks
+            and call the method on each chunk in parallel in a thread
+            or process pool, see `pandas_flavor.parallel`.
+        max_workers: The number of workers of the engine,
+            the number of CPUs by default.
+        agg: For methods returning a single reduction of a column,
+            the `(column, reduction)` they amount to, e.g. `("x", "sum")`,
+            or a function of the call arguments returning it.
+            Such methods are batched by `grp.pf.multi`,
+            see `pandas_flavor.aggregate`.
 
     Returns:
         callable: The original method.
     """
-    method_signature = inspect.signature(method)
-
-    def inner(*args: tuple, **kwargs: dict):
-        """Inner function to register the method.
-
-        This function is called when the user
-        decorates a function with register_dataframe_groupby_method.
-
-        Args:
-            *args: The arguments to pass to the registered method.
-            **kwargs: The keyword arguments to pass to the registered method.
-
-        Returns:
-            method: The original method.
-        """
-
-        class AccessorMethod(object):
-            """DataFrameGroupBy Accessor method class.
-
-            Args:
-                obj: The pandas DataFrameGroupBy object.
-            """
-
-            __doc__ = method.__doc__
-
-            def __init__(self, obj):
-                self._obj = obj
-
-            @wraps(method)
-            def __call__(self, *args, **kwargs):
-                """Call the accessor method.
-
-                Args:
-                    *args: The arguments to pass to the registered method.
-                    **kwargs: The keyword arguments to pass
-                        to the registered method.
-
-                Returns:
-                    object: The result of calling of the method.
-                """
-                global method_call_ctx_factory
-                if method_call_ctx_factory is None:
-                    return method(self._obj, *args, **kwargs)
-
-                return handle_pandas_extension_call(
-                    method, method_signature, self._obj, args, kwargs
-                )
-
-        register_dataframe_groupby_accessor(method.__name__)(AccessorMethod)
-        return method
-
-    return inner()
-
-
-def register_series_groupby_method(method):
+    if method is None:
+        return partial(
+            register_dataframe_groupby_method,
+            direct=direct,
+            engine=engine,
+            max_workers=max_workers,
+            agg=agg,
+        )
+
+    return _register_method(
+        method,
+        DataFrameGroupBy,
+        register_dataframe_groupby_accessor,
+        direct=direct,
+        engine=engine,
+        max_workers=max_workers,
+        agg=agg,
+    )
+
+
+def register_series_groupby_method(
+    method=None,
+    *,
+    direct: bool = False,
+    engine: str | None = None,
+    max_workers: int | None = None,
+    agg=None,
+):
     """Register a function as a method attached to the pandas SeriesGroupBy.
 
     Example:
@@ -442,59 +1108,248 @@ def register_series_groupby_method(method):
     Args:
         method: Function to be registered as a method
             on the SeriesGroupBy object.
+        direct: If True, register the method directly on the SeriesGroupBy class
+            instead of going through an accessor.
+            See `register_dataframe_method` for details.
+        engine: If "threads" or "processes", split the groups into chunks
+            and call the method on each chunk in parallel in a thread
+            or process pool, see `pandas_flavor.parallel`.
+        max_workers: The number of workers of the engine,
+            the number of CPUs by default.
+        agg: For methods returning a single reduction of the Series,
+            the name of the reduction they amount to, e.g. `"sum"`,
+            or a function of the call arguments returning it.
+            Such methods are batched by `grp.pf.multi`,
+            see `pandas_flavor.aggregate`.
 
     Returns:
         callable: The original method.
     """
-    method_signature = inspect.signature(method)
+    if method is None:
+        return partial(
+            register_series_groupby_method,
+            direct=direct,
+            engine=engine,
+            max_workers=max_workers,
+            agg=agg,
+        )
+
+    return _register_method(
+        method,
+        SeriesGroupBy,
+        register_series_groupby_accessor,
+        direct=direct,
+        engine=engine,
+        max_workers=max_workers,
+        agg=agg,
+    )
+
+
+# batch target -> (class, registration options accepted for it)
+_BATCH_TARGETS = {
+    "dataframe": (
+        DataFrame,
+        {
+            "direct",
+            "selects",
+            "pushdown",
+            "pure",
+            "cache",
+            "chunkwise",
+            "combine",
+            "mutation",
+        },
+    ),
+    "series": (
+        Series,
+        {"direct", "pure", "cache", "mutation", "vectorize", "jit", "elementwise"},
+    ),
+    "dataframe_groupby": (
+        DataFrameGroupBy,
+        {"direct", "engine", "max_workers", "agg"},
+    ),
+    "series_groupby": (SeriesGroupBy, {"direct", "engine", "max_workers", "agg"}),
+}
+
+
+class RegistrationBatch:
+    """Register many functions as methods at once.
+
+    Functions are added to the batch with the same options as the
+    `register_*_method` functions, and attached to the pandas classes
+    in one pass by `install()`:
+
+        batch = pf.RegistrationBatch()
+
+        @batch.add
+        def clean_names(df):
+            ...
+
+        @batch.add(target="series", pure=True)
+        def normalize(s):
+            ...
+
+        batch.install()
+
+    or, installing the methods at the end of the block:
+
+        with pf.RegistrationBatch() as batch:
+            batch.add(clean_names)
+            batch.add(normalize, target="series")
+
+    Installing sets the accessors on the classes directly instead of going
+    through the pandas registration decorators, and reports the methods
+    overriding preexisting attributes in a single warning.
+    As with individual registration, method signatures
+    are only computed on the first traced call.
+
+    Attributes:
+        install_time: The total time spent adding and installing
+            the methods of the batch, in seconds.
+    """
+
+    def __init__(self):
+        self._pending = []
+        self._installed = []
+        self._elapsed_ns = 0
+
+    @property
+    def install_time(self) -> float:
+        """The time spent adding and installing the methods, in seconds."""
+        return self._elapsed_ns / 1e9
+
+    @property
+    def registered(self) -> tuple:
+        """The `RegisteredMethod` entries installed so far."""
+        return tuple(self._installed)
+
+    def __len__(self):
+        """Return the number of methods added to the batch.
+
+        Returns:
+            int: The number of pending and installed methods.
+        """
+        return len(self._pending) + len(self._installed)
 
-    def inner(*args: tuple, **kwargs: dict):
-        """Inner function to register the method.
+    def add(self, method=None, *, target: str = "dataframe", **options):
+        """Add a function to the batch.
 
-        This function is called when the user
-        decorates a function with register_series_groupby_method.
+        Can be used as a decorator, with or without options.
 
         Args:
-            *args: The arguments to pass to the registered method.
-            **kwargs: The keyword arguments to pass to the registered method.
+            method (callable): callable to register as a method.
+            target: The class to attach the method to, "dataframe", "series",
+                "dataframe_groupby" or "series_groupby".
+            **options: The registration options accepted by the
+                `register_*_method` function of the target.
 
         Returns:
-            method: The original method.
+            callable: The original method.
+
+        Raises:
+            ValueError: if the target is unknown.
+            TypeError: if an option is not accepted for the target.
         """
+        if method is None:
+            return partial(self.add, target=target, **options)
 
-        class AccessorMethod(object):
-            """SeriesGroupBy Accessor method class.
+        start = perf_counter_ns()
+        if target not in _BATCH_TARGETS:
+            raise ValueError(
+                f"target must be one of {tuple(_BATCH_TARGETS)}, got {target!r}"
+            )
+        cls, accepted = _BATCH_TARGETS[target]
+        unknown = sorted(set(options) - accepted)
+        if unknown:
+            raise TypeError(f"unexpected options for {target} methods: {unknown}")
+        self._pending.append(_prepare_method(method, cls, **options))
+        self._elapsed_ns += perf_counter_ns() - start
+        return method
 
-            Args:
-                obj: The pandas SeriesGroupBy object.
-            """
+    def install(self) -> float:
+        """Attach the methods added since the last install to their classes.
 
-            __doc__ = method.__doc__
+        Returns:
+            float: The total registration time of the batch, in seconds.
+        """
+        start = perf_counter_ns()
+        pending, self._pending = self._pending, []
+        conflicts = [
+            registered
+            for registered, _ in pending
+            if hasattr(registered.cls, registered.name)
+        ]
+        if conflicts:
+            names = ", ".join(
+                f"{registered.cls.__name__}.{registered.name}"
+                for registered in conflicts
+            )
+            warnings.warn(
+                f"registration of methods {names} is overriding "
+                "preexisting attributes with the same names.",
+                UserWarning,
+                stacklevel=_find_stack_level(),
+            )
+        for registered, impl in pending:
+            cls, name = registered.cls, registered.name
+            if registered.direct:
+                setattr(cls, name, _make_direct_method(impl, registered))
+            else:
+                accessor = _make_accessor_method(impl, registered)
+                setattr(cls, name, CachedAccessor(name, accessor))
+                if not hasattr(cls, "_accessors"):
+                    cls._accessors = set()
+                cls._accessors.add(name)
+            _registered_methods[cls, name] = registered
+            self._installed.append(registered)
+        self._elapsed_ns += perf_counter_ns() - start
+        return self.install_time
+
+    def __enter__(self):
+        """Return the batch.
 
-            def __init__(self, obj):
-                self._obj = obj
+        Returns:
+            RegistrationBatch: The batch.
+        """
+        return self
 
-            @wraps(method)
-            def __call__(self, *args, **kwargs):
-                """Call the accessor method.
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Install the added methods, unless the block raised.
 
-                Args:
-                    *args: The arguments to pass to the registered method.
-                    **kwargs: The keyword arguments to pass
-                        to the registered method.
+        Args:
+            exc_type: The type of the exception raised in the block, if any.
+            exc_value: The exception raised in the block, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        if exc_type is None:
+            self.install()
 
-                Returns:
-                    object: The result of calling of the method.
-                """
-                global method_call_ctx_factory
-                if method_call_ctx_factory is None:
-                    return method(self._obj, *args, **kwargs)
 
-                return handle_pandas_extension_call(
-                    method, method_signature, self._obj, args, kwargs
-                )
+def register_many(methods, *, target: str = "dataframe", **options):
+    """Register several functions as methods with the same options.
+
+    Example:
+
+        batch = pf.register_many([clean_names, remove_empty], direct=True)
+        print(f"registered {len(batch)} methods in {batch.install_time:.3f}s")
+
+    Args:
+        methods: The callables to register.
+        target: The class to attach the methods to, "dataframe", "series",
+            "dataframe_groupby" or "series_groupby".
+        **options: The registration options accepted by the
+            `register_*_method` function of the target.
+
+    Returns:
+        RegistrationBatch: The installed batch.
+    """
+    batch = RegistrationBatch()
+    for method in methods:
+        batch.add(method, target=target, **options)
+    batch.install()
+    return batch
 
-        register_series_groupby_accessor(method.__name__)(AccessorMethod)
-        return method
 
-    return inner()
+# Registers the `pf` namespace of pandas objects. Imported last, since it
+# depends on this module; any use of pandas_flavor with pandas goes through here.
+from . import accessors  # noqa: E402, F401
@@ -0,0 +1,176 @@
+"""Chunked execution of registered DataFrame methods.
+
+`stream` applies chains of registered methods to DataFrames read in chunks,
+e.g. with `pd.read_csv(..., chunksize=...)`, one chunk at a time,
+so that data larger than memory can be processed with the same methods:
+
+    @pf.register_dataframe_method(chunkwise=True)
+    def clean(df):
+        ...
+
+    @pf.register_dataframe_method(combine=lambda a, b: a.add(b, fill_value=0))
+    def count_by(df, column):
+        return df[column].value_counts()
+
+    chunks = pd.read_csv("big.csv", chunksize=1_000_000)
+    counts = pf.stream(chunks).clean().count_by("country").collect()
+
+Methods registered with `chunkwise=True` are applied to each chunk.
+A method registered with `combine` aggregates the chunks:
+its results on each chunk are combined as they are produced,
+and the methods recorded after it are applied once to the combined result.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from .lazy import PlanStep, _find_step_method, _result_class
+
+
+class ChunkStream:
+    """A stream of DataFrame chunks with the registered methods to apply to them.
+
+    Calling a registered method on a ChunkStream returns a new ChunkStream
+    with the call appended to its plan. Nothing is computed until the stream
+    is iterated over or collected. Use `stream(chunks)` to create one.
+    If `chunks` is an iterator, such as a pandas reader,
+    the stream can only be consumed once. Like in lazy chains,
+    each method is looked up for the class of the result of the previous step.
+
+    Args:
+        chunks: An iterable of DataFrames.
+        plan: The steps recorded so far.
+        cls: The class of the result of the plan.
+    """
+
+    def __init__(self, chunks, plan: tuple = (), cls: type = pd.DataFrame):
+        self._chunks = chunks
+        self._plan = tuple(plan)
+        self._cls = cls
+
+    @property
+    def _aggregation(self) -> int | None:
+        """The position of the first aggregating step in the plan, if any."""
+        for i, step in enumerate(self._plan):
+            if step.registered.combine is not None:
+                return i
+        return None
+
+    def __getattr__(self, name: str):
+        """Return a function recording a call to the registered method `name`.
+
+        Args:
+            name: The name of the registered method.
+
+        Raises:
+            AttributeError: if no method is registered under `name`.
+            ValueError: if the method cannot be applied to chunks.
+
+        Returns:
+            callable: The recording function.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        registered = _find_step_method(self._cls, name)
+        if registered is None:
+            raise AttributeError(
+                f"{name!r} is not a method registered with pandas_flavor "
+                f"for {self._cls.__name__}"
+            )
+        cls = _result_class(registered)
+        if (
+            self._aggregation is None
+            and not registered.chunkwise
+            and registered.combine is None
+        ):
+            raise ValueError(
+                f"{name!r} cannot be applied to chunks: register it with "
+                "chunkwise=True or with a combine function"
+            )
+
+        def record(*args, **kwargs):
+            """Record the method call.
+
+            Args:
+                *args: The arguments to pass to the registered method.
+                **kwargs: The keyword arguments to pass to the registered method.
+
+            Returns:
+                ChunkStream: The stream with the call appended to the plan.
+            """
+            step = PlanStep(name, args, kwargs, registered)
+            return ChunkStream(self._chunks, self._plan + (step,), cls)
+
+        return record
+
+    @property
+    def plan(self) -> tuple:
+        """The steps recorded so far."""
+        return self._plan
+
+    def __iter__(self):
+        """Apply the plan to each chunk.
+
+        Raises:
+            TypeError: if the plan aggregates the chunks.
+
+        Yields:
+            The processed chunks.
+        """
+        if self._aggregation is not None:
+            raise TypeError("the stream aggregates its chunks, use collect()")
+        for chunk in self._chunks:
+            for step in self._plan:
+                chunk = step.execute(chunk)
+            yield chunk
+
+    def collect(self):
+        """Apply the plan to all the chunks and return the result.
+
+        Returns:
+            The concatenation of the processed chunks or, if the plan
+            aggregates the chunks, the combined (and further processed) result.
+
+        Raises:
+            ValueError: if the plan aggregates the chunks and there are none.
+        """
+        aggregation = self._aggregation
+        if aggregation is None:
+            chunks = list(self)
+            return pd.concat(chunks) if chunks else pd.DataFrame()
+
+        per_chunk = self._plan[: aggregation + 1]
+        combine = per_chunk[-1].registered.combine
+        result = None
+        for chunk in self._chunks:
+            for step in per_chunk:
+                chunk = step.execute(chunk)
+            result = chunk if result is None else combine(result, chunk)
+        if result is None:
+            raise ValueError("cannot aggregate an empty stream")
+        for step in self._plan[aggregation + 1 :]:
+            result = step.execute(result)
+        return result
+
+    def __repr__(self):
+        """Return the representation of the stream.
+
+        Returns:
+            str: The recorded plan.
+        """
+        steps = "".join(f"\n  .{step!r}" for step in self._plan)
+        return f"<ChunkStream{steps}>"
+
+
+def stream(chunks) -> ChunkStream:
+    """Start a chain of registered method calls over DataFrame chunks.
+
+    Args:
+        chunks: An iterable of DataFrames,
+            e.g. the reader returned by `pd.read_csv(..., chunksize=...)`.
+
+    Returns:
+        ChunkStream: A stream with an empty plan.
+    """
+    return ChunkStream(chunks)
@@ -0,0 +1,468 @@
+"""Low-overhead tracing of registered method calls.
+
+The tracer plugs into the `method_call_ctx_factory` protocol
+(see `pandas_flavor.register.handle_pandas_extension_call`)
+and records every call into a preallocated ring buffer,
+so that its memory footprint stays bounded no matter how long it is enabled.
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from . import register
+
+_FIELDS = (
+    "wall_ns",
+    "cpu_ns",
+    "in_rows",
+    "in_cols",
+    "out_rows",
+    "out_cols",
+    "in_bytes",
+    "out_bytes",
+    "in_chunks",
+    "in_chunk_bytes",
+    "out_chunks",
+    "lazy",
+)
+
+# the values of the xarray fields for other objects:
+# dims, number of chunks, bytes of the largest chunk, lazy
+_NOT_XARRAY = (None, -1, -1, False)
+
+# type -> whether it is an XArray DataArray or Dataset
+_xarray_types = {}
+
+
+def _shape(obj) -> tuple[int, int]:
+    """Return the number of rows and columns of obj.
+
+    GroupBy objects report the shape of the grouped object.
+    Unknown dimensions are reported as -1.
+
+    Args:
+        obj: The object to inspect.
+
+    Returns:
+        tuple: The number of rows and columns.
+    """
+    shape = getattr(obj, "shape", None)
+    if shape is None:
+        shape = getattr(getattr(obj, "obj", None), "shape", None)
+    if shape is None:
+        return -1, -1
+    if len(shape) == 1:
+        return shape[0], 1
+    return shape[0], shape[1]
+
+
+def _memory_usage(obj, deep: bool = False) -> int:
+    """Return the memory used by obj in bytes.
+
+    Args:
+        obj: The object to inspect.
+        deep: Whether to introspect object dtypes for their actual
+            memory consumption, as in `DataFrame.memory_usage`.
+
+    Returns:
+        int: The number of bytes, or -1 if unknown.
+    """
+    if isinstance(obj, pd.DataFrame):
+        if deep:
+            return int(obj.memory_usage(index=True, deep=True).sum())
+        # the same total as memory_usage(index=True), which builds
+        # a Series of the memory of every column and costs ~1 ms
+        nbytes = obj.index.memory_usage()
+        dtypes = obj.dtypes.tolist()
+        if all(isinstance(dtype, np.dtype) for dtype in dtypes):
+            return int(nbytes + len(obj) * sum(dtype.itemsize for dtype in dtypes))
+        return int(nbytes + sum(column.array.nbytes for _, column in obj.items()))
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=deep))
+    return int(getattr(obj, "nbytes", -1))
+
+
+def _xarray_metadata(obj) -> tuple:
+    """Return the metadata of an XArray object.
+
+    Only reads attributes of the object: dask-backed data is not computed,
+    and xarray is not imported if it was not already.
+
+    Args:
+        obj: The object to inspect.
+
+    Returns:
+        tuple: The dimensions of the object, the number of dask chunks
+        of its variables, the number of bytes of its largest chunk
+        (0 for objects that are not chunked) and whether the object is lazy,
+        or `_NOT_XARRAY` if it is not an XArray object.
+    """
+    obj_type = type(obj)
+    is_xarray = _xarray_types.get(obj_type)
+    if is_xarray is None:
+        xr = sys.modules.get("xarray")
+        is_xarray = xr is not None and issubclass(obj_type, (xr.DataArray, xr.Dataset))
+        _xarray_types[obj_type] = is_xarray
+    if not is_xarray:
+        return _NOT_XARRAY
+    if hasattr(obj, "data_vars"):
+        variables = tuple(obj.data_vars.values())
+    else:
+        variables = (obj.variable,)
+    chunks = chunk_bytes = 0
+    for variable in variables:
+        data = variable.data
+        # dask arrays, without importing dask
+        n_chunks = getattr(data, "npartitions", None)
+        if n_chunks is not None:
+            chunks += n_chunks
+            chunk_bytes = max(
+                chunk_bytes,
+                int(np.prod(data.chunksize)) * data.dtype.itemsize,
+            )
+    return tuple(obj.sizes), chunks, chunk_bytes, chunks > 0
+
+
+class _TracedCall:
+    """Method call context recording a single call into a MethodCallTracer.
+
+    Args:
+        tracer: The tracer to record the call into.
+        method_name: The name of the called method.
+    """
+
+    __slots__ = (
+        "_tracer",
+        "_method_name",
+        "_start_ns",
+        "_cpu_start_ns",
+        "_end_ns",
+        "_cpu_end_ns",
+        "_in_shape",
+        "_out_shape",
+        "_in_bytes",
+        "_out_bytes",
+        "_in_xarray",
+        "_out_xarray",
+    )
+
+    def __init__(self, tracer: MethodCallTracer, method_name: str):
+        self._tracer = tracer
+        self._method_name = method_name
+        self._start_ns = self._cpu_start_ns = None
+        self._end_ns = None
+        self._in_shape = self._out_shape = (-1, -1)
+        self._in_bytes = self._out_bytes = -1
+        self._in_xarray = self._out_xarray = _NOT_XARRAY
+
+    def __enter__(self):
+        """Enter the call context.
+
+        Returns:
+            The call context.
+        """
+        return self
+
+    def handle_start_method_call(
+        self, method_name, method_signature, method_args, method_kwargs
+    ):
+        """Record the input of the call and start the clocks.
+
+        Args:
+            method_name: The name of the method.
+            method_signature: The signature of the method.
+            method_args: The arguments of the method, starting with the object.
+            method_kwargs: The keyword arguments of the method.
+
+        Returns:
+            The unmodified arguments and keyword arguments of the method.
+        """
+        obj = method_args[0]
+        self._in_shape = _shape(obj)
+        self._in_xarray = _xarray_metadata(obj)
+        if self._tracer.memory or self._in_xarray is not _NOT_XARRAY:
+            # nbytes of XArray objects is metadata
+            self._in_bytes = _memory_usage(obj, self._tracer.deep)
+        self._cpu_start_ns = time.thread_time_ns()
+        self._start_ns = time.perf_counter_ns()
+        return method_args, method_kwargs
+
+    def handle_end_method_call(self, ret):
+        """Stop the clocks and record the output of the call.
+
+        Args:
+            ret: The return value of the method.
+        """
+        self._end_ns = time.perf_counter_ns()
+        self._cpu_end_ns = time.thread_time_ns()
+        self._out_shape = _shape(ret)
+        self._out_xarray = _xarray_metadata(ret)
+        if self._tracer.memory or self._out_xarray is not _NOT_XARRAY:
+            self._out_bytes = _memory_usage(ret, self._tracer.deep)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write the call record into the tracer's ring buffer.
+
+        Args:
+            exc_type: The type of the exception raised by the method, if any.
+            exc_value: The exception raised by the method, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        if self._end_ns is None:
+            self._end_ns = time.perf_counter_ns()
+            self._cpu_end_ns = time.thread_time_ns()
+        if self._start_ns is None:
+            # the call failed before handle_start_method_call started the clocks
+            self._start_ns = self._end_ns
+            self._cpu_start_ns = self._cpu_end_ns
+        in_dims, in_chunks, in_chunk_bytes, _ = self._in_xarray
+        _, out_chunks, _, out_lazy = self._out_xarray
+        self._tracer._record(
+            self._method_name,
+            exc_type is not None,
+            (
+                self._end_ns - self._start_ns,
+                self._cpu_end_ns - self._cpu_start_ns,
+                *self._in_shape,
+                *self._out_shape,
+                self._in_bytes,
+                self._out_bytes,
+                in_chunks,
+                in_chunk_bytes,
+                out_chunks,
+                out_lazy,
+            ),
+            in_dims,
+        )
+
+
+class MethodCallFactory:
+    """Base class of the built-in method call context factories.
+
+    Subclasses implement `__call__(method_name, args, kwargs)`,
+    returning the context of a single call.
+    A factory can be enabled for the whole process with `enable()`/`disable()`
+    or as a context manager, or for the current thread or asyncio task only
+    with `scoped()`.
+    """
+
+    _previous_factory = None
+
+    def enable(self):
+        """Install the factory as the global `method_call_ctx_factory`.
+
+        Returns:
+            The factory.
+        """
+        self._previous_factory = register.method_call_ctx_factory
+        register.method_call_ctx_factory = self
+        return self
+
+    def disable(self):
+        """Restore the `method_call_ctx_factory` replaced by `enable()`."""
+        if register.method_call_ctx_factory is self:
+            register.method_call_ctx_factory = self._previous_factory
+        self._previous_factory = None
+
+    def scoped(self):
+        """Enable the factory for the current thread or asyncio task only.
+
+        Returns:
+            A context manager, see `pandas_flavor.call_context`.
+        """
+        return register.call_context(self)
+
+    def __enter__(self):
+        """Enable the factory.
+
+        Returns:
+            The factory.
+        """
+        return self.enable()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disable the factory.
+
+        Args:
+            exc_type: The type of the exception, if any.
+            exc_value: The exception, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        self.disable()
+
+
+class MethodCallTracer(MethodCallFactory):
+    """Record registered method calls into a preallocated ring buffer.
+
+    For every call the tracer records the method name,
+    the wall and CPU time (via `time.perf_counter_ns`
+    and `time.thread_time_ns`), the shapes of the input and output objects
+    and, optionally, their memory usage.
+    For XArray objects the tracer also records the dimensions of the input,
+    the number of dask chunks of the input and output, the size of the
+    largest input chunk, whether the output is lazy and, always,
+    their `nbytes`. All of it is read from metadata, without computing.
+    Once `capacity` calls have been recorded the oldest records
+    are overwritten.
+
+    The tracer is a `method_call_ctx_factory`. It can be enabled
+    with `enable()`/`disable()` or used as a context manager:
+
+        tracer = MethodCallTracer()
+        with tracer:
+            df.my_method().another_method()
+        print(tracer.summary())
+
+    Both enable the tracer for the whole process. Use `with tracer.scoped():`
+    to trace only the calls made from the current thread or asyncio task.
+
+    Args:
+        capacity: The maximum number of call records kept.
+        memory: Whether to record the memory usage of inputs and outputs.
+        deep: Whether memory usage introspects object dtypes,
+            as in `DataFrame.memory_usage`. This is much more expensive.
+    """
+
+    def __init__(self, capacity: int = 65536, memory: bool = False, deep=False):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self.memory = memory
+        self.deep = deep
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __call__(self, method_name: str, args, kwargs) -> _TracedCall:
+        """Create the context tracing a single method call.
+
+        Args:
+            method_name: The name of the called method.
+            args: The arguments of the method call.
+            kwargs: The keyword arguments of the method call.
+
+        Returns:
+            The method call context.
+        """
+        return _TracedCall(self, method_name)
+
+    def _record(
+        self,
+        method_name: str,
+        error: bool,
+        values: tuple,
+        dims: tuple | None = None,
+    ):
+        """Write a call record into the ring buffer.
+
+        Args:
+            method_name: The name of the called method.
+            error: Whether the method raised an exception.
+            values: The values of the numeric fields, in `_FIELDS` order.
+            dims: The dimensions of an XArray input, or None.
+        """
+        # next() on itertools.count is atomic, so concurrent calls
+        # never write to the same slot.
+        index = next(self._counter)
+        slot = index % self.capacity
+        self._names[slot] = method_name
+        self._errors[slot] = error
+        self._dims[slot] = dims
+        self._values[slot] = values
+        with self._lock:
+            if index >= self._recorded:
+                self._recorded = index + 1
+
+    def clear(self):
+        """Drop all call records."""
+        self._names = [None] * self.capacity
+        self._errors = np.zeros(self.capacity, dtype=bool)
+        self._dims = [None] * self.capacity
+        self._values = np.zeros((self.capacity, len(_FIELDS)), dtype=np.int64)
+        self._counter = itertools.count()
+        self._recorded = 0
+
+    @property
+    def dropped(self) -> int:
+        """The number of call records overwritten since the last `clear()`."""
+        return max(self._recorded - self.capacity, 0)
+
+    def records(self) -> pd.DataFrame:
+        """Return the recorded calls, oldest first.
+
+        Returns:
+            A DataFrame with one row per call. Unknown sizes and the chunk
+            fields of objects other than XArray objects are -1, and dims
+            is None for them.
+        """
+        if self._recorded <= self.capacity:
+            order = np.arange(self._recorded)
+        else:
+            start = self._recorded % self.capacity
+            order = np.roll(np.arange(self.capacity), -start)
+        records = pd.DataFrame(self._values[order], columns=list(_FIELDS))
+        records.insert(0, "method", [self._names[i] for i in order])
+        records["error"] = self._errors[order]
+        records["dims"] = [self._dims[i] for i in order]
+        records["lazy"] = records["lazy"].astype(bool)
+        return records
+
+    def summary(self) -> pd.DataFrame:
+        """Aggregate the recorded calls per method.
+
+        Returns:
+            A DataFrame indexed by method name with the call count,
+            the total, median (p50) and 99th percentile (p99) wall time
+            and the total CPU time, all times in milliseconds.
+        """
+        records = self.records()
+        wall_ms = records["wall_ns"] / 1e6
+        grouped = wall_ms.groupby(records["method"])
+        summary = pd.DataFrame(
+            {
+                "count": grouped.count(),
+                "total_ms": grouped.sum(),
+                "p50_ms": grouped.quantile(0.5),
+                "p99_ms": grouped.quantile(0.99),
+                "cpu_ms": (records["cpu_ns"] / 1e6).groupby(records["method"]).sum(),
+                "errors": records["error"].groupby(records["method"]).sum(),
+            }
+        )
+        summary.index.name = "method"
+        return summary.sort_values("total_ms", ascending=False)
+
+    def to_json(self, path=None, summary: bool = False):
+        """Export the call records as JSON.
+
+        Args:
+            path: File path or buffer to write to.
+                If None, the JSON string is returned.
+            summary: Export the per-method summary instead of the records.
+
+        Returns:
+            The JSON string if `path` is None, otherwise None.
+        """
+        if summary:
+            return self.summary().reset_index().to_json(path, orient="records")
+        return self.records().to_json(path, orient="records")
+
+    def to_csv(self, path=None, summary: bool = False):
+        """Export the call records as CSV.
+
+        Args:
+            path: File path or buffer to write to.
+                If None, the CSV string is returned.
+            summary: Export the per-method summary instead of the records.
+
+        Returns:
+            The CSV string if `path` is None, otherwise None.
+        """
+        if summary:
+            return self.summary().to_csv(path)
+        return self.records().to_csv(path, index=False)
@@ -0,0 +1,257 @@
+"""Series methods applying a scalar function to whole columns.
+
+A Series method whose body is `s.apply(scalar_function)` calls
+the function from Python once per element. Registering the scalar
+function itself with `register_series_ufunc` (or
+`register_series_method(vectorize=True)`) applies it to the underlying
+array at once instead:
+
+    @pf.register_series_ufunc
+    def clip_score(x, low=0.0, high=1.0):
+        return min(max(x, low), high)
+
+    s.clip_score(high=0.5)
+
+The function is compiled into a NumPy ufunc, with `numba.vectorize`
+when numba is installed and the values are numeric, and `np.frompyfunc`
+otherwise. Kernels are cached per dtype of the values and number of
+arguments, so each is only compiled once; keyword arguments are bound
+to their positional parameters first. Without numba, numeric Series
+fall back to `Series.apply`; for non-numeric Series (strings,
+categories, objects) the function is only called once per distinct value.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import partial, wraps
+
+import numpy as np
+import pandas as pd
+
+from .binding import MethodSignature
+
+# numba compiles numeric kernels only
+_JIT_KINDS = "biuf"
+
+
+def _numba():
+    """Return the numba module, if installed.
+
+    Returns:
+        The numba module, or None.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba
+
+
+def _infer_array(values: np.ndarray):
+    """Convert the results of a kernel to the array of their inferred dtype.
+
+    Args:
+        values: The results of a kernel.
+
+    Returns:
+        The array of results, with a specific dtype if one fits them.
+    """
+    if values.dtype != object:
+        return values
+    return pd.Series(values, copy=False).infer_objects().array
+
+
+class VectorizedFunction:
+    """A scalar function applied elementwise to arrays.
+
+    Args:
+        func: The scalar function, called as `func(x, *args, **kwargs)`.
+        jit: Whether to compile the function with numba:
+            True to require numba, False to never use it,
+            None to use it when it is installed.
+
+    Raises:
+        ImportError: if `jit=True` and numba is not installed.
+    """
+
+    def __init__(self, func, jit: bool | None = None):
+        numba = _numba() if jit is not False else None
+        if jit and numba is None:
+            raise ImportError("jit=True requires numba")
+        self.func = func
+        self.jit = jit
+        self._numba = numba
+        # (dtype, number of extra arguments) -> (kernel, compiled with numba)
+        self._kernels = {}
+        self._lock = threading.Lock()
+        # computed on the first call with keyword arguments,
+        # False if the function has no signature
+        self._signature = None
+
+    def _positional(self, args: tuple, kwargs: dict) -> tuple | None:
+        """Bind keyword arguments to the positional parameters of the function.
+
+        Defaults are applied, so that calls passing the same parameters
+        positionally or by keyword use the same kernels.
+
+        Args:
+            args: Extra positional arguments of the function.
+            kwargs: Extra keyword arguments of the function.
+
+        Returns:
+            tuple: All the extra arguments, positionally, or None if some
+            cannot be passed positionally (e.g. keyword-only parameters).
+        """
+        signature = self._signature
+        if signature is None:
+            try:
+                signature = MethodSignature.from_callable(self.func)
+            except (TypeError, ValueError):
+                # e.g. some builtins
+                signature = False
+            self._signature = signature
+        if signature is False:
+            return None
+        # raises TypeError for invalid arguments, like calling the function
+        bound = signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        if bound.kwargs:
+            return None
+        return bound.args[1:]
+
+    def kernel(self, dtype: np.dtype, nargs: int = 0):
+        """Return the kernel applying the function to values of a dtype.
+
+        Args:
+            dtype: The dtype of the values.
+            nargs: The number of extra positional arguments.
+
+        Returns:
+            The ufunc, from the cache if already compiled.
+        """
+        key = (dtype, nargs)
+        entry = self._kernels.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._kernels.get(key)
+                if entry is None:
+                    entry = self._kernels[key] = self._compile(dtype, nargs)
+        return entry[0]
+
+    def _compile(self, dtype: np.dtype, nargs: int) -> tuple:
+        """Compile a kernel.
+
+        Args:
+            dtype: The dtype of the values.
+            nargs: The number of extra positional arguments.
+
+        Returns:
+            tuple: The ufunc and whether it was compiled with numba.
+        """
+        if self._numba is not None and dtype.kind in _JIT_KINDS:
+            # compiled for the argument types of its first call
+            return self._numba.vectorize(self.func), True
+        return np.frompyfunc(self.func, 1 + nargs, 1), False
+
+    def _fall_back(self, dtype: np.dtype, nargs: int):
+        """Replace a numba kernel that failed to compile by a NumPy one.
+
+        Args:
+            dtype: The dtype of the values.
+            nargs: The number of extra positional arguments.
+
+        Returns:
+            The NumPy ufunc.
+        """
+        kernel = np.frompyfunc(self.func, 1 + nargs, 1)
+        with self._lock:
+            self._kernels[dtype, nargs] = (kernel, False)
+        return kernel
+
+    def __call__(self, values, *args, **kwargs) -> np.ndarray:
+        """Apply the function to every element of values.
+
+        Args:
+            values: The array of values.
+            *args: Extra arguments of the function, broadcast with values.
+            **kwargs: Extra keyword arguments of the function.
+
+        Returns:
+            np.ndarray: The results, of object dtype when computed by
+            a NumPy kernel.
+        """
+        values = np.asarray(values)
+        if kwargs:
+            # keyword arguments cannot be passed to ufuncs
+            positional = self._positional(args, kwargs)
+            if positional is None:
+                func = partial(self.func, **kwargs)
+                return np.frompyfunc(func, 1 + len(args), 1)(values, *args)
+            args = positional
+        kernel = self.kernel(values.dtype, len(args))
+        if self._kernels[values.dtype, len(args)][1]:
+            try:
+                return kernel(values, *args)
+            except self._numba.core.errors.NumbaError:
+                if self.jit:
+                    raise
+                kernel = self._fall_back(values.dtype, len(args))
+        return kernel(values, *args)
+
+    def apply(self, s: pd.Series, *args, **kwargs) -> pd.Series:
+        """Apply the function to every element of a Series.
+
+        Args:
+            s: The Series.
+            *args: Extra arguments of the function.
+            **kwargs: Extra keyword arguments of the function.
+
+        Returns:
+            pd.Series: The results, with the index and name of s.
+        """
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # maps the categories only, keeping the result categorical
+            return s.map(lambda x: self.func(x, *args, **kwargs))
+        if s.dtype.kind in _JIT_KINDS:
+            if self._numba is None:
+                # a NumPy kernel calls the function from Python like
+                # Series.apply does, which converts the results faster
+                return s.apply(self.func, args=args, **kwargs)
+        elif all(np.ndim(arg) == 0 for arg in args):
+            # the function is called from Python for these dtypes:
+            # call it once per distinct value only
+            codes, uniques = pd.factorize(s, use_na_sentinel=False)
+            values = _infer_array(
+                self(np.asarray(uniques, dtype=object), *args, **kwargs)
+            )
+            return pd.Series(values.take(codes), index=s.index, name=s.name)
+        values = _infer_array(self(s.to_numpy(), *args, **kwargs))
+        return pd.Series(values, index=s.index, name=s.name, copy=False)
+
+
+def make_vectorized_method(ufunc: VectorizedFunction):
+    """Make the Series method applying a vectorized function.
+
+    Args:
+        ufunc: The vectorized function.
+
+    Returns:
+        callable: The Series method.
+    """
+
+    @wraps(ufunc.func)
+    def vectorized_method(s, *args, **kwargs):
+        """Apply the scalar function to every element of the Series.
+
+        Args:
+            s: The Series.
+            *args: Extra arguments of the function.
+            **kwargs: Extra keyword arguments of the function.
+
+        Returns:
+            pd.Series: The results.
+        """
+        return ufunc.apply(s, *args, **kwargs)
+
+    return vectorized_method
@@ -1,21 +1,55 @@
-"""XArray support for pandas_flavor."""
+"""XArray support for pandas_flavor.
 
-from functools import wraps
+Methods are called on the whole DataArray or Dataset by default.
+A method registered with `blockwise=` is instead mapped over the chunks
+of dask-backed objects, so that calling it stays lazy and the chunks
+are computed in parallel by the dask scheduler:
 
+- `blockwise="map_blocks"`: the method takes and returns xarray objects,
+  and is applied to each block with `xarray.map_blocks`.
+- `blockwise="apply_ufunc"`: the method takes and returns NumPy arrays
+  of the same shape, and is applied to each chunk of each variable
+  with `xarray.apply_ufunc(..., dask="parallelized")`.
+
+Objects that are not chunked are passed to the method at once.
+
+Calls go through the same `method_call_ctx_factory` hook as pandas methods
+(see `pandas_flavor.register.handle_pandas_extension_call`), so that
+tracers see the xarray steps of mixed pipelines.
+"""
+
+from __future__ import annotations
+
+from functools import partial, wraps
+
+import xarray as xr
 from xarray import register_dataarray_accessor, register_dataset_accessor
 
+from .register import (
+    RegisteredMethod,
+    _registered_methods,
+    get_method_call_ctx_factory,
+    handle_pandas_extension_call,
+)
+
+_BLOCKWISE_MODES = ("map_blocks", "apply_ufunc")
 
-def make_accessor_wrapper(method):
+
+def make_accessor_wrapper(method, registered: RegisteredMethod | None = None):
     """
     Makes an XArray-compatible accessor to wrap a method to be added to an
     xr.DataArray, xr.Dataset, or both.
 
     Args:
         method: A method which takes an XArray object and needed parameters.
+        registered: The registered method, holding the method signature
+            passed to method call contexts. Created if not given.
 
     Returns:
         The result of calling ``method``.
     """
+    if registered is None:
+        registered = RegisteredMethod(method, None, object)
 
     class XRAccessor:
         """XArray accessor for a method.
@@ -39,37 +73,158 @@ def make_accessor_wrapper(method):
                 The result of calling ``method``.
             """
 
-            return method(self._xr_obj, *args, **kwargs)
+            if get_method_call_ctx_factory() is None:
+                return method(self._xr_obj, *args, **kwargs)
+
+            return handle_pandas_extension_call(
+                method, registered.method_signature, self._xr_obj, args, kwargs
+            )
+
+    instrumented_call = XRAccessor.__call__
+
+    @wraps(method)
+    def raw_call(self, *args, **kwargs):
+        """Call the method, untraced.
+
+        Args:
+            *args: Positional arguments to pass to the method.
+            **kwargs: Keyword arguments to pass to the method.
+
+        Returns:
+            The result of calling ``method``.
+        """
+        return method(self._xr_obj, *args, **kwargs)
+
+    def install(instrumented: bool):
+        """Swap the call implementation of the accessor.
 
+        Args:
+            instrumented: Whether to install the instrumented implementation.
+        """
+        XRAccessor.__call__ = instrumented_call if instrumented else raw_call
+
+    registered._install = install
+    install(registered.instrumented)
     return XRAccessor
 
 
-def register_xarray_dataarray_method(method: callable):
+def make_blockwise_method(method, blockwise: str):
+    """Make a method mapping a function over the chunks of an XArray object.
+
+    Args:
+        method: The function to map over the chunks.
+        blockwise: "map_blocks" if the function takes an XArray object,
+            "apply_ufunc" if it takes a NumPy array.
+
+    Returns:
+        The method, taking an XArray object and the function parameters.
+
+    Raises:
+        ValueError: if `blockwise` is not a known mode.
+    """
+    if blockwise not in _BLOCKWISE_MODES:
+        raise ValueError(
+            f"blockwise must be one of {_BLOCKWISE_MODES} or None, got {blockwise!r}"
+        )
+
+    if blockwise == "map_blocks":
+
+        @wraps(method)
+        def blockwise_method(xr_obj, *args, **kwargs):
+            """Apply the method to each block of the object.
+
+            Args:
+                xr_obj: The XArray object.
+                *args: Positional arguments to pass to the method.
+                **kwargs: Keyword arguments to pass to the method.
+
+            Returns:
+                The combined results, lazy if the object is chunked.
+            """
+            return xr.map_blocks(method, xr_obj, args=list(args), kwargs=kwargs)
+
+    else:
+
+        @wraps(method)
+        def blockwise_method(xr_obj, *args, **kwargs):
+            """Apply the method to each chunk of the object data.
+
+            Args:
+                xr_obj: The XArray object.
+                *args: Positional arguments to pass to the method.
+                **kwargs: Keyword arguments to pass to the method.
+
+            Returns:
+                The combined results, lazy if the object is chunked.
+            """
+            return xr.apply_ufunc(
+                method, xr_obj, *args, kwargs=kwargs, dask="parallelized"
+            )
+
+    return blockwise_method
+
+
+def _register_method(method, cls: type, register_accessor, blockwise):
+    """Register a function as a method of an XArray class.
+
+    Args:
+        method: A method which takes an XArray object and needed parameters.
+        cls: The XArray class.
+        register_accessor: The accessor registration function for `cls`.
+        blockwise: The blockwise mode of the method, or None.
+    """
+    impl = method if blockwise is None else make_blockwise_method(method, blockwise)
+    registered = RegisteredMethod(method, None, cls)
+    register_accessor(method.__name__)(make_accessor_wrapper(impl, registered))
+    _registered_methods[cls, method.__name__] = registered
+
+
+def register_xarray_dataarray_method(
+    method: callable = None, *, blockwise: str | None = None
+):
     """Register a method on an XArray DataArray object.
 
+    Example:
+
+        @register_xarray_dataarray_method(blockwise="apply_ufunc")
+        def scale(values, factor):
+            return values * factor
+
+        da.chunk({"time": 100}).scale(2.0)  # lazy, computed chunk by chunk
+
     Args:
         method: A method which takes an XArray object and needed parameters.
+        blockwise: "map_blocks" or "apply_ufunc" to map the method over
+            the chunks of dask-backed DataArrays, see `pandas_flavor.xarray`.
 
     Returns:
         The method.
     """
-    accessor_wrapper = make_accessor_wrapper(method)
-    register_dataarray_accessor(method.__name__)(accessor_wrapper)
+    if method is None:
+        return partial(register_xarray_dataarray_method, blockwise=blockwise)
+
+    _register_method(method, xr.DataArray, register_dataarray_accessor, blockwise)
 
     return method
 
 
-def register_xarray_dataset_method(method: callable):
+def register_xarray_dataset_method(
+    method: callable = None, *, blockwise: str | None = None
+):
     """Register a method on an XArray Dataset object.
 
     Args:
         method: A method which takes an XArray object and needed parameters.
+        blockwise: "map_blocks" or "apply_ufunc" to map the method over
+            the chunks of dask-backed Datasets, see `pandas_flavor.xarray`.
+            With "apply_ufunc" the method is applied to each data variable.
 
     Returns:
         The method.
     """
+    if method is None:
+        return partial(register_xarray_dataset_method, blockwise=blockwise)
 
-    accessor_wrapper = make_accessor_wrapper(method)
-    register_dataset_accessor(method.__name__)(accessor_wrapper)
+    _register_method(method, xr.Dataset, register_dataset_accessor, blockwise)
 
     return method
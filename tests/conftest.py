@@ -0,0 +1,101 @@
+"""Shared fixtures of the pandas_flavor tests."""
+
+from contextlib import nullcontext
+
+import pytest
+
+
+class RecordingContext:
+    """Method call context recording the start of the call into its factory.
+
+    Args:
+        factory: The `RecordingFactory` making the context.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def __enter__(self):
+        """Enter the context.
+
+        Returns:
+            The context.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the context.
+
+        Args:
+            exc_type: The type of the exception.
+            exc_value: The value of the exception.
+            traceback: The traceback of the exception.
+        """
+
+    def handle_start_method_call(self, method_name, signature, args, kwargs):
+        """Record the signature and arguments of the call.
+
+        Args:
+            method_name: The name of the method.
+            signature: The signature of the method.
+            args: The arguments of the method, starting with the object.
+            kwargs: The keyword arguments of the method.
+
+        Returns:
+            The unmodified arguments and keyword arguments.
+        """
+        self.factory.starts.append((method_name, signature, args, kwargs))
+        return args, kwargs
+
+    def handle_end_method_call(self, ret):
+        """Handle the end of the method call.
+
+        Args:
+            ret: The return value of the method.
+        """
+
+
+class RecordingFactory:
+    """Method call context factory recording the traced calls.
+
+    Args:
+        start: Whether the calls go through a `RecordingContext`
+            recording their start, rather than a context doing nothing.
+
+    Attributes:
+        names: The names of the traced methods.
+        tags: The `tag` keyword argument of each call, None if not passed.
+        starts: The method name, signature, arguments and keyword arguments
+            passed to `handle_start_method_call`, with `start=True`.
+    """
+
+    def __init__(self, start: bool = False):
+        self.start = start
+        self.names = []
+        self.tags = []
+        self.starts = []
+
+    def __call__(self, method_name, args, kwargs):
+        """Record the call.
+
+        Args:
+            method_name: The name of the method.
+            args: The arguments of the method.
+            kwargs: The keyword arguments of the method.
+
+        Returns:
+            The context of the call.
+        """
+        self.names.append(method_name)
+        self.tags.append(kwargs.get("tag"))
+        return RecordingContext(self) if self.start else nullcontext()
+
+
+@pytest.fixture
+def recording_factory():
+    """Make method call context factories recording the traced calls.
+
+    Returns:
+        type: The `RecordingFactory` class, called to make each factory.
+    """
+    return RecordingFactory
@@ -0,0 +1,110 @@
+"""Tests for batching registered groupby aggregations."""
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_groupby_method(agg=("x", "sum"))
+def agg_total(grp):
+    """Sum the x values of each group.
+
+    Args:
+        grp: A DataFrameGroupBy.
+
+    Returns:
+        The sums.
+    """
+    return grp["x"].sum()
+
+
+@pf.register_dataframe_groupby_method(agg=lambda column: (column, "mean"))
+def agg_average(grp, column):
+    """Average a column per group.
+
+    Args:
+        grp: A DataFrameGroupBy.
+        column: The column to average.
+
+    Returns:
+        The averages.
+    """
+    return grp[column].mean()
+
+
+@pf.register_dataframe_groupby_method
+def agg_spread(grp):
+    """Compute the range of the x values of each group.
+
+    Args:
+        grp: A DataFrameGroupBy.
+
+    Returns:
+        The ranges.
+    """
+    return grp["x"].max() - grp["x"].min()
+
+
+@pf.register_series_groupby_method(agg="max")
+def agg_top(grp):
+    """Return the largest value of each group.
+
+    Args:
+        grp: A SeriesGroupBy.
+
+    Returns:
+        The maxima.
+    """
+    return grp.max()
+
+
+@pytest.fixture
+def grp():
+    """A DataFrame grouped by key.
+
+    Returns:
+        DataFrameGroupBy: The groupby object.
+    """
+    df = pd.DataFrame(
+        {"k": list("abab"), "x": [1.0, 2.0, 3.0, 4.0], "y": [5.0, 6.0, 7.0, 9.0]}
+    )
+    return df.groupby("k")
+
+
+def test_multi_matches_separate_calls(grp):
+    """Test that batched and regular calls give the same results."""
+    result = grp.pf.multi(
+        total="agg_total",
+        mean_x=("agg_average", "x"),
+        mean_y=("agg_average", "y"),
+        spread="agg_spread",
+    )
+    expected = pd.concat(
+        [grp.agg_total(), grp.agg_average("x"), grp.agg_average("y"), grp.agg_spread()],
+        axis=1,
+        keys=["total", "mean_x", "mean_y", "spread"],
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+    pd.testing.assert_frame_equal(
+        grp["y"].pf.multi(top="agg_top"), grp["y"].max().to_frame("top")
+    )
+
+
+def test_reductions_are_traced_as_one_call(grp, recording_factory):
+    """Test that the batched reductions are a single traced call."""
+    factory = recording_factory()
+    with pf.call_context(factory):
+        grp.pf.multi(
+            total="agg_total", mean_y=("agg_average", "y"), spread="agg_spread"
+        )
+    assert factory.names == ["agg_total+agg_average", "agg_spread"]
+
+
+def test_multi_errors(grp):
+    """Test the errors of multi."""
+    with pytest.raises(AttributeError, match="not a method registered"):
+        grp.pf.multi(total="no_such_method")
+    with pytest.raises(ValueError, match="as_index"):
+        grp.obj.groupby("k", as_index=False).pf.multi(total="agg_total")
@@ -0,0 +1,184 @@
+"""Tests for asynchronous calls of registered methods."""
+
+import asyncio
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+RUNNING = []
+RUNNING_LOCK = threading.Lock()
+
+
+@pf.register_dataframe_method
+def async_double(df: pd.DataFrame, delay: float = 0.0) -> pd.DataFrame:
+    """Double the values, after a delay.
+
+    Args:
+        df: A pandas DataFrame.
+        delay: The delay in seconds.
+
+    Returns:
+        The doubled DataFrame.
+    """
+    with RUNNING_LOCK:
+        RUNNING.append(1)
+        peak = len(RUNNING)
+    time.sleep(delay)
+    with RUNNING_LOCK:
+        RUNNING.pop()
+    return (df * 2).assign(peak=peak)
+
+
+@pf.register_series_method
+def async_thread_name(s: pd.Series) -> str:
+    """Return the name of the thread running the method.
+
+    Args:
+        s: A pandas Series.
+
+    Returns:
+        The thread name.
+    """
+    return threading.current_thread().name
+
+
+def test_acall_runs_in_worker_thread():
+    """Test that acall runs the method off the event loop thread."""
+    df = pd.DataFrame({"x": [1, 2]})
+
+    async def main():
+        """Await both methods.
+
+        Returns:
+            tuple: The results.
+        """
+        return await df.pf.acall("async_double"), await df.x.pf.acall(
+            "async_thread_name"
+        )
+
+    doubled, thread_name = asyncio.run(main())
+    assert doubled["x"].tolist() == [2, 4]
+    assert thread_name.startswith("pandas_flavor")
+
+    with pytest.raises(AttributeError, match="not a method registered"):
+        asyncio.run(df.pf.acall("no_such_method"))
+
+
+def test_acall_propagates_call_context(recording_factory):
+    """Test that the scoped factory of each task traces its own calls."""
+    df = pd.DataFrame({"x": [1, 2]})
+    factories = [recording_factory(), recording_factory()]
+
+    async def traced(factory, n):
+        """Await calls within a call context.
+
+        Args:
+            factory: The factory of the task.
+            n: The number of calls.
+        """
+        with pf.call_context(factory):
+            for _ in range(n):
+                await df.pf.acall("async_double")
+
+    async def main():
+        """Run two traced tasks concurrently."""
+        await asyncio.gather(traced(factories[0], 1), traced(factories[1], 2))
+
+    asyncio.run(main())
+    assert factories[0].names == ["async_double"]
+    assert factories[1].names == ["async_double"] * 2
+
+
+def test_runner_limits_concurrency():
+    """Test that no more than max_concurrency calls run at once."""
+    df = pd.DataFrame({"x": [1]})
+    runner = pf.AsyncRunner(max_workers=4, max_concurrency=2)
+
+    async def main():
+        """Start 6 calls at once.
+
+        Returns:
+            list: The results.
+        """
+        return await asyncio.gather(
+            *(runner.call(df, "async_double", delay=0.05) for _ in range(6))
+        )
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        runner.shutdown()
+    assert max(result["peak"].iloc[0] for result in results) <= 2
+
+    with pytest.raises(ValueError):
+        pf.AsyncRunner(max_concurrency=0)
+    with pytest.raises(ValueError):
+        pf.AsyncRunner(engine="cluster")
+
+
+def test_calls_outliving_their_loop(caplog):
+    """Test that calls completing after their event loop closed release quietly."""
+    df = pd.DataFrame({"x": [1]})
+    runner = pf.AsyncRunner(max_workers=1, max_concurrency=1)
+
+    async def main():
+        """Give up on a running call."""
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(runner.call(df, "async_double", delay=0.1), 0.01)
+
+    try:
+        asyncio.run(main())
+    finally:
+        runner.shutdown()
+    assert "exception calling callback" not in caplog.text
+
+
+def test_cancelled_calls_do_not_start(recording_factory):
+    """Test that cancelling a queued call prevents it from running."""
+    df = pd.DataFrame({"x": [1]})
+    factory = recording_factory()
+    runner = pf.AsyncRunner(max_workers=1)
+
+    async def main():
+        """Cancel a call queued behind a running one."""
+        with pf.call_context(factory):
+            running = asyncio.ensure_future(runner.call(df, "async_double", delay=0.1))
+            queued = asyncio.ensure_future(runner.call(df, "async_double"))
+            await asyncio.sleep(0.02)
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+            await running
+
+    try:
+        asyncio.run(main())
+    finally:
+        runner.shutdown()
+    assert factory.names == ["async_double"]
+
+
+def test_process_engine(recording_factory):
+    """Test that the process engine runs and traces the method."""
+    df = pd.DataFrame({"x": [1, 2]})
+    factory = recording_factory()
+    runner = pf.AsyncRunner(max_workers=1, engine="processes")
+
+    async def main():
+        """Await a traced call.
+
+        Returns:
+            The result.
+        """
+        with pf.call_context(factory):
+            return await runner.call(df, "async_double")
+
+    try:
+        result = asyncio.run(main())
+    finally:
+        runner.shutdown()
+    assert result["x"].tolist() == [2, 4]
+    assert factory.names == ["async_double"]
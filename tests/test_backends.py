@@ -0,0 +1,178 @@
+"""Tests for calling registered methods on pyarrow and Polars data."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+pa = pytest.importorskip("pyarrow")
+pl = pytest.importorskip("polars")
+
+CALLS = []
+
+
+@pf.register_dataframe_method
+def backend_positive(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Keep the rows where a column is positive.
+
+    Args:
+        df: A pandas DataFrame.
+        column: The column to test.
+
+    Returns:
+        The filtered DataFrame.
+    """
+    CALLS.append("pandas")
+    return df[df[column] > 0]
+
+
+@backend_positive.register_impl("polars")
+def _positive_polars(df, column: str):
+    """Keep the rows where a column is positive, with Polars.
+
+    Args:
+        df: A Polars DataFrame.
+        column: The column to test.
+
+    Returns:
+        The filtered DataFrame.
+    """
+    CALLS.append("polars")
+    return df.filter(pl.col(column) > 0)
+
+
+@pf.register_dataframe_method
+def backend_totals(df: pd.DataFrame, by: str) -> pd.DataFrame:
+    """Sum the values per key.
+
+    Args:
+        df: A pandas DataFrame.
+        by: The key column.
+
+    Returns:
+        The sums, indexed by key.
+    """
+    return df.groupby(by).sum()
+
+
+@pf.register_series_method
+def backend_double(s: pd.Series) -> pd.Series:
+    """Double the values.
+
+    Args:
+        s: A pandas Series.
+
+    Returns:
+        The doubled Series.
+    """
+    return s * 2
+
+
+@pf.register_series_method
+def backend_counts(s: pd.Series) -> pd.Series:
+    """Count the occurrences of each value.
+
+    Args:
+        s: A pandas Series.
+
+    Returns:
+        The counts, indexed by value.
+    """
+    return s.value_counts()
+
+
+@pf.register_series_method
+def backend_positive_values(s: pd.Series) -> pd.Series:
+    """Keep the positive values.
+
+    Args:
+        s: A pandas Series.
+
+    Returns:
+        The positive values, with their row labels.
+    """
+    return s[s > 0]
+
+
+@pytest.fixture
+def table():
+    """An Arrow table with a numeric and a string column.
+
+    Returns:
+        pa.Table: The table.
+    """
+    return pa.table({"x": [1, -2, 3], "k": ["a", "b", "a"]})
+
+
+def test_dispatch_on_backend(table):
+    """Test that the implementation of the backend is called."""
+    CALLS.clear()
+    result = pf.call(pl.from_arrow(table), "backend_positive", "x")
+    assert isinstance(result, pl.DataFrame)
+    assert result["x"].to_list() == [1, 3]
+    result = pf.call(table.to_pandas(), "backend_positive", column="x")
+    assert isinstance(result, pd.DataFrame)
+    assert CALLS == ["polars", "pandas"]
+
+    with pytest.raises(ValueError):
+        backend_positive.register_impl("spark")
+    with pytest.raises(AttributeError, match="not a method registered"):
+        pf.call(table, "no_such_method")
+    with pytest.raises(TypeError):
+        pf.call(pl.from_arrow(table).lazy(), "backend_positive", "x")
+
+
+def test_pandas_fallback(table):
+    """Test that other backends go through Arrow-backed pandas objects."""
+    CALLS.clear()
+    result = pf.call(table, "backend_positive", "x")
+    assert CALLS == ["pandas"]
+    assert result.equals(pa.table({"x": [1, 3], "k": ["a", "a"]}))
+
+    # named indexes become columns
+    totals = pf.call(pl.from_arrow(table), "backend_totals", "k")
+    assert totals.to_dict(as_series=False) == {"k": ["a", "b"], "x": [4, -2]}
+
+    assert pf.call(table["x"], "backend_double").to_pylist() == [2, -4, 6]
+    doubled = pf.call(pl.Series("x", [1, 2]), "backend_double")
+    assert doubled.name == "x" and doubled.to_list() == [2, 4]
+
+    # named Series indexes become columns, unnamed ones are dropped
+    counts = pf.call(pl.Series("k", ["a", "b", "a"]), "backend_counts")
+    assert counts.to_dict(as_series=False) == {"k": ["a", "b"], "count": [2, 1]}
+    counts = pf.call(pa.chunked_array([["a", "b", "a"]]), "backend_counts")
+    assert counts.to_pylist() == [2, 1]
+
+
+def test_filtered_series_stay_series():
+    """Test that the row labels left by a filter are dropped."""
+    positive = pf.call(pl.Series("x", [1, -1, 2]), "backend_positive_values")
+    assert isinstance(positive, pl.Series)
+    assert positive.name == "x" and positive.to_list() == [1, 2]
+    positive = pf.call(pa.chunked_array([[1, -1, 2]]), "backend_positive_values")
+    assert isinstance(positive, pa.ChunkedArray)
+    assert positive.to_pylist() == [1, 2]
+
+
+def test_fallback_does_not_copy():
+    """Test that the conversions share the Arrow memory of the input."""
+    table = pa.table({"x": np.arange(1000)})
+    df = pf.backends.to_pandas(table, "pyarrow")
+    assert isinstance(df["x"].dtype, pd.ArrowDtype)
+    values = table["x"].chunk(0).to_numpy()
+    assert np.shares_memory(values, df["x"].to_numpy())
+
+    result = pf.backends.from_pandas(df, "pyarrow")
+    assert np.shares_memory(values, result["x"].chunk(0).to_numpy())
+
+
+def test_backend_calls_are_traced(table):
+    """Test that backend implementations are traced under the method name."""
+    tracer = pf.MethodCallTracer()
+    with pf.call_context(tracer):
+        pf.call(pl.from_arrow(table), "backend_positive", "x")
+        pf.call(table, "backend_positive", "x")
+    records = tracer.records()
+    assert records["method"].tolist() == ["backend_positive"] * 2
+    assert records["out_rows"].tolist() == [2, 2]
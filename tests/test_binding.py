@@ -0,0 +1,121 @@
+"""Tests for the fast argument binding of registered methods."""
+
+import inspect
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+from pandas_flavor.binding import MethodSignature
+from pandas_flavor.register import find_registered_method
+
+
+def planned(df, a, b=2, *, c, d=4):
+    """A method bound by the fast path.
+
+    Args:
+        df: The object.
+        a: A required argument.
+        b: An optional argument.
+        c: A required keyword-only argument.
+        d: An optional keyword-only argument.
+    """
+
+
+def unplanned(df, a, /, *args, b=2, **kwargs):
+    """A method bound by inspect.Signature.bind.
+
+    Args:
+        df: The object.
+        a: A positional-only argument.
+        *args: Extra arguments.
+        b: A keyword-only argument.
+        **kwargs: Extra keyword arguments.
+    """
+
+
+CALLS = [
+    ((0, 1), {"c": 3}),
+    ((0, 1, 5), {"c": 3, "d": 6}),
+    ((0,), {"d": 6, "c": 3, "a": 1}),
+    ((0, 1), {"b": 5, "c": 3}),
+    # invalid calls
+    ((0, 1), {}),
+    ((0,), {"c": 3}),
+    ((0, 1, 2, 3), {"c": 3}),
+    ((0, 1), {"a": 1, "c": 3}),
+    ((0, 1), {"c": 3, "e": 5}),
+]
+
+
+def bind_both(signature, args, kwargs):
+    """Bind with MethodSignature and inspect.Signature.
+
+    Args:
+        signature: The inspect signature.
+        args: The positional arguments.
+        kwargs: The keyword arguments.
+
+    Returns:
+        The results (or exception types) of bind, bind with defaults
+        and normalize, and the results of inspect.
+    """
+    fast = MethodSignature.from_callable(signature)
+    results = []
+    for sig in (fast, inspect.signature(signature)):
+        try:
+            bound = sig.bind(*args, **kwargs)
+            arguments = list(bound.arguments.items())
+            bound.apply_defaults()
+            results.append((arguments, list(bound.arguments.items())))
+        except TypeError:
+            results.append(TypeError)
+    try:
+        normalized = list(fast.normalize(args, kwargs).items())
+    except TypeError:
+        normalized = TypeError
+    return results, normalized
+
+
+@pytest.mark.parametrize("method", [planned, unplanned])
+@pytest.mark.parametrize("args, kwargs", CALLS)
+def test_bind_matches_inspect(method, args, kwargs):
+    """Test that the fast path binds exactly like inspect.
+
+    Args:
+        method: The function whose signature is bound.
+        args: The positional arguments.
+        kwargs: The keyword arguments.
+    """
+    (fast, expected), normalized = bind_both(method, args, kwargs)
+    assert fast == expected
+    assert normalized == (TypeError if expected is TypeError else expected[1])
+
+
+def test_traced_call_gets_method_signature(recording_factory):
+    """Test that contexts get the arguments unchanged and a MethodSignature."""
+
+    @pf.register_dataframe_method
+    def binding_traced(df, value, scale=2):
+        """Scale a value.
+
+        Args:
+            df: A pandas DataFrame.
+            value: The value.
+            scale: The scale.
+
+        Returns:
+            The scaled value.
+        """
+        return value * scale
+
+    factory = recording_factory(start=True)
+    df = pd.DataFrame()
+    with pf.call_context(factory):
+        assert df.binding_traced(3) == 6
+    ((_, signature, args, kwargs),) = factory.starts
+    assert args[1:] == (3,) and kwargs == {}
+    normalized = signature.normalize(args, kwargs)
+    assert signature is find_registered_method(df, "binding_traced").method_signature
+    assert isinstance(signature, MethodSignature)
+    assert normalized == {"df": df, "value": 3, "scale": 2}
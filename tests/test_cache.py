@@ -0,0 +1,216 @@
+"""Tests for the memoization of pure registered methods."""
+
+import inspect
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+CALLS = []
+CACHE = pf.ResultCache(maxsize=2)
+
+
+@pf.register_dataframe_method(cache=CACHE)
+def cached_sum(df: pd.DataFrame, columns: list, scale: int = 1) -> pd.Series:
+    """Sum columns, counting the actual calls.
+
+    Args:
+        df: A pandas DataFrame.
+        columns: The columns to sum.
+        scale: A multiplier.
+
+    Returns:
+        The scaled sums.
+    """
+    CALLS.append(columns)
+    return df[columns].sum() * scale
+
+
+@pf.register_series_method(pure=True, direct=True)
+def cached_max(s: pd.Series) -> int:
+    """Return the maximum, counting the actual calls.
+
+    Args:
+        s: A pandas Series.
+
+    Returns:
+        The maximum.
+    """
+    CALLS.append("max")
+    return s.max()
+
+
+@pf.register_dataframe_method(cache=CACHE)
+def cached_first(df: pd.DataFrame) -> int:
+    """Return the first value of column a, counting the actual calls.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The first value.
+    """
+    CALLS.append("first")
+    return df["a"].iloc[0]
+
+
+@pf.register_dataframe_method(cache=CACHE)
+def cached_values(df: pd.DataFrame) -> np.ndarray:
+    """Return the values of column a, counting the actual calls.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The values.
+    """
+    CALLS.append("values")
+    return df["a"].to_numpy(copy=True)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    """Reset the call log and the cache."""
+    CALLS.clear()
+    CACHE.clear()
+
+
+def test_cache_hits_normalized_arguments():
+    """Test that equivalent calls are served from the cache."""
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    first = df.cached_sum(["a", "b"])
+    second = df.cached_sum(columns=["a", "b"], scale=1)
+    pd.testing.assert_series_equal(first, second)
+    assert CALLS == [["a", "b"]]
+    assert CACHE.stats()["hits"] == 1
+    assert CACHE.stats()["misses"] == 1
+    # modifying the returned result does not modify the cached one
+    second["a"] = 100
+    assert df.cached_sum(["a", "b"])["a"] == 3
+
+
+def test_cache_invalidated_by_mutation():
+    """Test that mutating the object invalidates its cached results."""
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    assert df.cached_sum(["a"])["a"] == 3
+    df.loc[0, "a"] = 10
+    assert df.cached_sum(["a"])["a"] == 12
+    df["c"] = 0
+    df.cached_sum(["a"])
+    assert len(CALLS) == 3
+
+
+def test_cache_invalidated_by_reordering():
+    """Test that reordering the rows in place invalidates cached results."""
+    df = pd.DataFrame({"a": [3, 1, 2]})
+    assert df.cached_first() == 3
+    df.sort_values("a", inplace=True)
+    assert df.cached_first() == 1
+    # back in the original order: the first result is valid again
+    df.sort_index(inplace=True)
+    assert df.cached_first() == 3
+    assert len(CALLS) == 2
+
+
+def test_cached_results_are_copies(monkeypatch):
+    """Test that results are deep copies without copy-on-write."""
+    monkeypatch.setattr("pandas_flavor.cache.copy_on_write_enabled", lambda: False)
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    result = df.cached_sum(["a"])
+    (_, cached, _) = next(iter(CACHE._entries.values()))
+    assert not np.shares_memory(result.to_numpy(), cached.to_numpy())
+
+
+def test_cached_arrays_are_copies():
+    """Test that modifying a returned array does not modify the cached one."""
+    df = pd.DataFrame({"a": [1, 2]})
+    df.cached_values()[0] = 100
+    df.cached_values()[1] = 100
+    np.testing.assert_array_equal(df.cached_values(), [1, 2])
+    assert CALLS == ["values"]
+
+
+def test_cache_keyed_on_argument_types():
+    """Test that equal arguments of different types do not share results."""
+    df = pd.DataFrame({"a": [1, 2]})
+    assert df.cached_sum(["a"], 1).dtype == np.int64
+    assert df.cached_sum(["a"], 1.0).dtype == np.float64
+    assert df.cached_sum(["a"], True).dtype == np.int64
+    assert len(CALLS) == 3
+
+
+def test_cache_keyed_on_identity():
+    """Test that equal but distinct objects do not share results."""
+    df = pd.DataFrame({"a": [1, 2]})
+    df.cached_sum(["a"])
+    df.copy().cached_sum(["a"])
+    assert len(CALLS) == 2
+
+
+def test_cache_lru_eviction():
+    """Test that the least recently used results are evicted first."""
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    df.cached_sum(["a"])
+    df.cached_sum(["b"])
+    df.cached_sum(["a"])
+    df.cached_sum(["a", "b"])  # evicts ["b"]
+    df.cached_sum(["a"])
+    assert CALLS == [["a"], ["b"], ["a", "b"]]
+    assert CACHE.stats()["evictions"] == 1
+    assert len(CACHE) == 2
+
+
+def test_cache_max_bytes():
+    """Test that the total size of the cached results is bounded."""
+
+    def head(df, n):
+        """Return the first n rows.
+
+        Args:
+            df: A pandas DataFrame.
+            n: The number of rows.
+
+        Returns:
+            The first n rows.
+        """
+        return df.head(n)
+
+    cache = pf.ResultCache(max_bytes=1000)
+    method = cache.wrap(head, inspect.signature(head))
+    df = pd.DataFrame({"a": range(200)})  # 8 bytes per row
+    method(df, 50)
+    method(df, 60)  # evicts the first result
+    method(df, 200)  # too large to be cached
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 1000
+
+
+def test_cache_entries_dropped_with_object():
+    """Test that results are dropped when the object is garbage collected."""
+    df = pd.DataFrame({"a": [1]})
+    df.cached_sum(["a"])
+    assert len(CACHE) == 1
+    del df
+    assert len(CACHE) == 0
+
+
+def test_pure_default_cache():
+    """Test the default cache used with pure=True."""
+    s = pd.Series([1, 3, 2])
+    assert s.cached_max() == 3
+    assert s.cached_max() == 3
+    assert CALLS == ["max"]
+    assert pf.cache.default_cache.stats()["hits"] >= 1
+
+
+def test_cache_uncacheable_arguments():
+    """Test that calls with unhashable arguments are not cached."""
+    df = pd.DataFrame({"a": [1]})
+    df.cached_sum(["a"], scale=pd.Series([1]))
+    df.cached_sum(["a"], scale=pd.Series([1]))
+    assert len(CALLS) == 2
+    assert CACHE.stats()["uncacheable"] == 2
@@ -0,0 +1,116 @@
+"""Tests for context-scoped method call context factories."""
+
+import asyncio
+import threading
+
+import pandas as pd
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_method
+def ctx_accessor_func(df: pd.DataFrame, tag: str) -> str:
+    """Return the tag.
+
+    Args:
+        df: A pandas DataFrame.
+        tag: The tag to return.
+
+    Returns:
+        The tag.
+    """
+    return tag
+
+
+@pf.register_dataframe_method(direct=True)
+def ctx_direct_func(df: pd.DataFrame, tag: str) -> str:
+    """Return the tag.
+
+    Args:
+        df: A pandas DataFrame.
+        tag: The tag to return.
+
+    Returns:
+        The tag.
+    """
+    return tag
+
+
+def test_call_context_overrides_global(recording_factory):
+    """Test that the scoped factory overrides the global one."""
+    global_factory, scoped_factory = recording_factory(), recording_factory()
+    df = pd.DataFrame()
+    pf.register.method_call_ctx_factory = global_factory
+    try:
+        df.ctx_accessor_func(tag="global")
+        with pf.call_context(scoped_factory):
+            assert pf.register.get_method_call_ctx_factory() is scoped_factory
+            df.ctx_accessor_func(tag="scoped")
+            with pf.call_context(None):
+                df.ctx_direct_func(tag="disabled")
+            df.ctx_direct_func(tag="scoped")
+        df.ctx_direct_func(tag="global")
+    finally:
+        pf.register.method_call_ctx_factory = None
+    assert global_factory.tags == ["global", "global"]
+    assert scoped_factory.tags == ["scoped", "scoped"]
+
+
+def test_call_context_thread_isolation(recording_factory):
+    """Test that concurrent threads only trace their own calls."""
+    n_threads, n_calls = 16, 200
+    factories = [recording_factory() for _ in range(n_threads)]
+    barrier = threading.Barrier(n_threads + 1)
+    df = pd.DataFrame()
+
+    def worker(i):
+        """Call registered methods, tracing them in even threads only.
+
+        Args:
+            i: The index of the thread.
+        """
+        barrier.wait()
+        if i % 2:
+            for _ in range(n_calls):
+                df.ctx_accessor_func(tag=i)
+                df.ctx_direct_func(tag=i)
+            return
+        with pf.call_context(factories[i]):
+            for _ in range(n_calls):
+                df.ctx_accessor_func(tag=i)
+                df.ctx_direct_func(tag=i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+
+    for i, factory in enumerate(factories):
+        assert factory.tags == ([i] * 2 * n_calls if i % 2 == 0 else [])
+
+
+def test_call_context_asyncio_isolation(recording_factory):
+    """Test that concurrent asyncio tasks only trace their own calls."""
+    factories = [recording_factory() for _ in range(4)]
+    df = pd.DataFrame()
+
+    async def job(i):
+        """Call a registered method across awaits.
+
+        Args:
+            i: The index of the job.
+        """
+        with pf.call_context(factories[i]):
+            for _ in range(10):
+                df.ctx_accessor_func(tag=i)
+                await asyncio.sleep(0)
+
+    async def main():
+        """Run the jobs concurrently."""
+        await asyncio.gather(*(job(i) for i in range(4)))
+
+    asyncio.run(main())
+    for i, factory in enumerate(factories):
+        assert factory.tags == [i] * 10
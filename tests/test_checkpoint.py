@@ -0,0 +1,236 @@
+"""Tests for the persistent cache of registered method results."""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+from pandas_flavor.checkpoint import DiskCache
+
+CALLS = []
+
+
+def register_cached(cache):
+    """Register the test methods with a cache, replacing previous ones.
+
+    Args:
+        cache: The DiskCache.
+
+    Returns:
+        tuple: The registered functions.
+    """
+
+    def checkpointed_double(df: pd.DataFrame, columns=None) -> pd.DataFrame:
+        """Double the values, recording the call.
+
+        Args:
+            df: A pandas DataFrame.
+            columns: The columns to keep, all by default.
+
+        Returns:
+            The doubled DataFrame.
+        """
+        CALLS.append("checkpointed_double")
+        return (df if columns is None else df[columns]) * 2
+
+    def checkpointed_summary(s: pd.Series) -> dict:
+        """Summarize a Series, recording the call.
+
+        Args:
+            s: A pandas Series.
+
+        Returns:
+            dict: The minimum and maximum.
+        """
+        CALLS.append("checkpointed_summary")
+        return {"min": s.min(), "max": s.max()}
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "registration of accessor")
+        pf.register_dataframe_method(checkpointed_double, cache=cache)
+        pf.register_series_method(checkpointed_summary, cache=cache)
+    return checkpointed_double, checkpointed_summary
+
+
+@pytest.fixture
+def df():
+    """A DataFrame with numeric and string columns.
+
+    Returns:
+        The DataFrame.
+    """
+    return pd.DataFrame(
+        {"a": np.arange(1000.0), "b": np.arange(1000)},
+        index=pd.RangeIndex(1000, name="row"),
+    )
+
+
+def test_disk_cache_reloads_results(tmp_path, df):
+    """Results are reloaded by other objects and cache instances."""
+    pytest.importorskip("pyarrow")
+    register_cached(DiskCache(tmp_path))
+    CALLS.clear()
+    first = df.checkpointed_double(columns=["a"])
+    # a new process: a new cache on the same directory, a new equal object
+    cache = DiskCache(tmp_path)
+    register_cached(cache)
+    reloaded = df.copy().checkpointed_double(["a"])
+    assert CALLS == ["checkpointed_double"]
+    pd.testing.assert_frame_equal(reloaded, first)
+    assert cache.stats()["hits"] == 1
+    # reloaded results can be modified like computed ones
+    reloaded.loc[0, "a"] = 5.0
+    first.loc[0, "a"] = 5.0
+
+    # other arguments and other content miss
+    df.checkpointed_double()
+    df.assign(a=-df["a"]).checkpointed_double(["a"])
+    assert CALLS == ["checkpointed_double"] * 3
+
+    # Series and other results
+    s = pd.Series([3, 1, 2], name="x")
+    assert s.checkpointed_summary() == s.checkpointed_summary() == {"min": 1, "max": 3}
+    assert CALLS.count("checkpointed_summary") == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 3, 4)
+
+
+def test_disk_cache_stores_series(tmp_path):
+    """Series results keep their name and index."""
+    cache = DiskCache(tmp_path)
+
+    @pf.register_dataframe_method(cache=cache)
+    def checkpointed_column(df: pd.DataFrame, column) -> pd.Series:
+        """Return a column.
+
+        Args:
+            df: A pandas DataFrame.
+            column: The column name.
+
+        Returns:
+            The column.
+        """
+        return df[column]
+
+    df = pd.DataFrame({1: [1.0, 2.0]}, index=["x", "y"])
+    expected = df.checkpointed_column(1)
+    pd.testing.assert_series_equal(df.checkpointed_column(1), expected)
+    assert cache.stats()["hits"] == 1
+
+
+def test_disk_cache_eviction(tmp_path, df):
+    """The least recently used results are deleted over max_bytes."""
+    cache = DiskCache(tmp_path, max_bytes=40_000)
+    register_cached(cache)
+    df.checkpointed_double()
+    size = cache.stats()["bytes"]
+    assert 0 < size <= 40_000
+    for n in range(1, 4):
+        (df + n).checkpointed_double()
+    stats = cache.stats()
+    assert stats["bytes"] <= 40_000
+    assert stats["evictions"] == 4 - stats["entries"]
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disk_cache_keys_arrays_by_content(tmp_path, df):
+    """Large arrays and Series with elided reprs get their own results."""
+    cache = DiskCache(tmp_path)
+
+    @pf.register_dataframe_method(cache=cache)
+    def checkpointed_weighted(df: pd.DataFrame, weights) -> float:
+        """Weigh a value of column a.
+
+        Args:
+            df: A pandas DataFrame.
+            weights: The weights.
+
+        Returns:
+            float: The weighted value.
+        """
+        return float(np.asarray(weights)[len(df)] * df["a"].iloc[1])
+
+    first, second = np.zeros(2000), np.zeros(2000)
+    second[1000] = 100.0
+    assert repr(first) == repr(second)
+    assert df.checkpointed_weighted(first) == 0.0
+    assert df.checkpointed_weighted(second) == 100.0
+    assert df.checkpointed_weighted(pd.Series(first)) == 0.0
+    assert df.checkpointed_weighted(pd.Series(second)) == 100.0
+    assert df.checkpointed_weighted(second.copy()) == 100.0
+    assert cache.stats()["hits"] == 1
+
+    # arguments without a content representation are not cached
+    df.checkpointed_weighted(first.astype(object))
+    df.checkpointed_weighted(memoryview(first))
+    assert cache.stats()["uncacheable"] == 2
+
+
+def test_disk_cache_mmap(tmp_path, df):
+    """Memory-mapped results are read-only, whether computed or reloaded."""
+    pytest.importorskip("pyarrow")
+    register_cached(DiskCache(tmp_path, mmap=True))
+    computed = df.checkpointed_double()
+    reloaded = df.checkpointed_double()
+    pd.testing.assert_frame_equal(reloaded, computed)
+    for result in (computed, reloaded):
+        # numeric columns are views of the file
+        assert not result["a"].to_numpy().flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            result.loc[0, "a"] = 5.0
+
+
+def test_disk_cache_row_order(tmp_path):
+    """Frames with the same rows in another order do not share results."""
+    cache = DiskCache(tmp_path)
+
+    @pf.register_dataframe_method(cache=cache)
+    def checkpointed_first(df: pd.DataFrame):
+        """Return the first value of column a.
+
+        Args:
+            df: A pandas DataFrame.
+
+        Returns:
+            The first value.
+        """
+        return df["a"].iloc[0]
+
+    df = pd.DataFrame({"a": [3, 1, 2]})
+    assert df.checkpointed_first() == 3
+    assert df.sort_values("a").checkpointed_first() == 1
+    df.sort_values("a", inplace=True)
+    assert df.checkpointed_first() == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_disk_cache_restores_columns(tmp_path):
+    """Reloaded results have the column index of the computed ones."""
+    pytest.importorskip("pyarrow")
+    register_cached(DiskCache(tmp_path))
+    for columns in (pd.RangeIndex(2), pd.RangeIndex(1, 5, 2, name="c")):
+        df = pd.DataFrame(np.ones((3, 2)), columns=columns)
+        computed = df.checkpointed_double()
+        reloaded = df.checkpointed_double()
+        pd.testing.assert_frame_equal(reloaded, computed, check_column_type=True)
+        pd.testing.assert_index_equal(reloaded.columns, columns, exact=True)
+
+
+def test_disk_cache_ignores_corrupt_results(tmp_path, df):
+    """Truncated results are computed and stored again."""
+    pytest.importorskip("pyarrow")
+    cache = DiskCache(tmp_path)
+    register_cached(cache)
+    CALLS.clear()
+    expected = df.checkpointed_double()
+    (entry,) = cache._entries()
+    with open(entry.path, "r+b") as file:
+        file.truncate(entry.stat().st_size // 2)
+    with pytest.warns(UserWarning, match="unreadable result"):
+        pd.testing.assert_frame_equal(df.checkpointed_double(), expected)
+    pd.testing.assert_frame_equal(df.checkpointed_double(), expected)
+    assert CALLS == ["checkpointed_double"] * 2
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,114 @@
+"""Tests for the reuse of DataFrame groupings."""
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+from pandas_flavor.grouping import GroupingCache, default_grouping_cache
+
+
+@pf.register_dataframe_groupby_method
+def grouping_total(grp):
+    """Sum the x values of each group.
+
+    Args:
+        grp: A DataFrameGroupBy.
+
+    Returns:
+        The sums.
+    """
+    return grp["x"].sum()
+
+
+@pytest.fixture
+def df():
+    """A DataFrame with two key columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame.
+    """
+    return pd.DataFrame(
+        {"k": ["a", "b", "a", "c"], "j": [1, 1, 2, 2], "x": [1.0, 2.0, 3.0, 4.0]}
+    )
+
+
+def test_groupings_are_reused(df):
+    """Test that groupby objects on the same keys share the grouping."""
+    default_grouping_cache.clear()
+    first = df.pf.groupby("k")
+    pd.testing.assert_series_equal(
+        first.grouping_total(), df.groupby("k").grouping_total()
+    )
+    second = df.pf.groupby("k")
+    assert second._grouper is first._grouper
+    pd.testing.assert_frame_equal(second.sum(), df.groupby("k").sum())
+    pd.testing.assert_frame_equal(
+        df.pf.groupby(["k", "j"], as_index=False).sum(),
+        df.groupby(["k", "j"], as_index=False).sum(),
+    )
+    # other options are other groupings
+    assert df.pf.groupby("k", sort=False)._grouper is not first._grouper
+    assert default_grouping_cache.stats()["hits"] == 1
+
+    # keys that are not column labels are not cached
+    pd.testing.assert_frame_equal(
+        df.pf.groupby(np.array([0, 0, 1, 1])).sum(),
+        df.groupby(np.array([0, 0, 1, 1])).sum(),
+    )
+    assert default_grouping_cache.stats()["uncacheable"] == 1
+
+
+def test_modified_frames_are_regrouped(df):
+    """Test that modifying the keys or the index invalidates the grouping."""
+    cache = GroupingCache()
+    grouper = cache.groupby(df, "k")._grouper
+
+    df.loc[0, "x"] = 10.0
+    grp = cache.groupby(df, "k")
+    assert grp._grouper is grouper
+    assert grp["x"].sum()["a"] == 13.0
+
+    df.loc[0, "k"] = "c"
+    grp = cache.groupby(df, "k")
+    assert grp._grouper is not grouper
+    pd.testing.assert_frame_equal(grp.sum(), df.groupby("k").sum())
+
+    grouper = grp._grouper
+    df.index = [10, 11, 12, 13]
+    grp = cache.groupby(df, "k")
+    assert grp._grouper is not grouper
+    pd.testing.assert_series_equal(
+        grp["x"].transform("sum"), df.groupby("k")["x"].transform("sum")
+    )
+
+
+def test_groupings_are_dropped_with_their_frame():
+    """Test that the groupings of collected DataFrames are dropped."""
+    df = pd.DataFrame({"k": ["a", "b"], "j": [1, 2]})
+    cache = GroupingCache(maxsize=2)
+    cache.groupby(df, "k")
+    cache.groupby(df, "j")
+    cache.groupby(df, ["k", "j"])
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+    del df
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_groupings_follow_in_place_edits_without_copy_on_write(monkeypatch):
+    """Test that key columns edited in place are grouped again."""
+    monkeypatch.setattr("pandas_flavor.grouping.copy_on_write_enabled", lambda: False)
+    cache = GroupingCache()
+    keys = np.array([1, 2, 1, 3])
+    # the frame writes to the array: its key column changes in place
+    df = pd.DataFrame({"k": keys, "x": [1.0, 2.0, 3.0, 4.0]}, copy=False)
+    assert cache.groupby(df, "k").ngroups == 3
+    assert cache.groupby(df, "k").ngroups == 3
+    keys[1] = 1
+    pd.testing.assert_frame_equal(cache.groupby(df, "k").sum(), df.groupby("k").sum())
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
@@ -0,0 +1,101 @@
+"""Tests guarding the import time of pandas_flavor."""
+
+import subprocess
+import sys
+
+import pytest
+
+# `import pandas` alone takes several hundred milliseconds.
+IMPORT_TIME_BUDGET_US = 100_000
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    """Run Python code in a fresh interpreter with -X importtime.
+
+    Args:
+        code: The code to run.
+
+    Returns:
+        The completed process, the import times are in its stderr.
+    """
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def imported_modules(importtime_output: str) -> dict:
+    """Parse the output of -X importtime.
+
+    Args:
+        importtime_output: The stderr of the interpreter.
+
+    Returns:
+        dict: The cumulative import time in microseconds of each module.
+    """
+    modules = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_import_is_lazy():
+    """Test that importing pandas_flavor imports neither pandas nor xarray."""
+    modules = imported_modules(run_python("import pandas_flavor").stderr)
+    assert "pandas_flavor" in modules
+    assert not any(name.split(".")[0] in ("pandas", "xarray") for name in modules)
+    assert modules["pandas_flavor"] < IMPORT_TIME_BUDGET_US
+
+
+def test_pandas_api_does_not_import_xarray():
+    """Test that registering pandas methods does not import xarray."""
+    code = (
+        "import pandas_flavor as pf\n"
+        "@pf.register_dataframe_method\n"
+        "def lazy_import_check(df):\n"
+        "    return df\n"
+        "import pandas as pd\n"
+        "pd.DataFrame().lazy_import_check()\n"
+        "pd.DataFrame().pf.lazy()\n"
+    )
+    modules = imported_modules(run_python(code).stderr)
+    assert "pandas" in modules
+    assert "xarray" not in modules
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["import pandas_flavor\nimport pandas", "import pandas\nimport pandas_flavor"],
+    ids=["before_pandas", "after_pandas"],
+)
+def test_import_registers_accessor(code):
+    """Test that a bare import of pandas_flavor registers the `pf` accessor.
+
+    Args:
+        code: The imports to run.
+    """
+    run_python(
+        f"{code}\n"
+        "assert pandas.__spec__.loader is pandas.__loader__\n"
+        "pandas.DataFrame().pf.lazy()\n"
+    )
+
+
+@pytest.mark.parametrize("name", ["register_xarray_dataarray_method", "stream"])
+def test_lazy_attributes(name):
+    """Test that lazily imported attributes are listed and accessible.
+
+    Args:
+        name: A public name of pandas_flavor.
+    """
+    import pandas_flavor as pf
+
+    assert name in dir(pf)
+    assert callable(getattr(pf, name))
+    with pytest.raises(AttributeError):
+        pf.not_an_attribute
@@ -0,0 +1,98 @@
+"""Tests for switching registered methods between instrumented and raw calls."""
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_method
+def switch_accessor(df: pd.DataFrame, tag: str) -> str:
+    """Return the tag.
+
+    Args:
+        df: A pandas DataFrame.
+        tag: The tag to return.
+
+    Returns:
+        The tag.
+    """
+    return tag
+
+
+@pf.register_series_method(direct=True)
+def switch_direct(s: pd.Series, tag: str) -> str:
+    """Return the tag.
+
+    Args:
+        s: A pandas Series.
+        tag: The tag to return.
+
+    Returns:
+        The tag.
+    """
+    return tag
+
+
+@pytest.fixture(autouse=True)
+def instrumented():
+    """Instrument all the methods again after each test.
+
+    Yields:
+        None.
+    """
+    yield
+    pf.set_instrumentation(True)
+
+
+def test_raw_calls_are_not_traced(recording_factory):
+    """Test that raw methods skip the factory, and switch back."""
+    factory = recording_factory()
+    df = pd.DataFrame()
+    with pf.call_context(factory):
+        df.switch_accessor(tag="traced")
+        pf.set_instrumentation(False)
+        assert df.switch_accessor(tag="raw") == "raw"
+        assert pd.Series().switch_direct(tag="raw") == "raw"
+        pf.set_instrumentation(True)
+        pd.Series().switch_direct(tag="traced again")
+    assert factory.tags == ["traced", "traced again"]
+
+    # raw direct methods are the registered function itself
+    pf.set_instrumentation(False)
+    assert pd.Series.switch_direct is switch_direct
+
+
+def test_switch_some_methods(recording_factory):
+    """Test switching the methods of the given names only."""
+    factory = recording_factory()
+    pf.set_instrumentation(False, methods="switch_direct")
+    with pf.call_context(factory):
+        pd.DataFrame().switch_accessor(tag="accessor")
+        pd.Series().switch_direct(tag="direct")
+    assert factory.tags == ["accessor"]
+
+
+def test_registered_methods_and_new_registrations():
+    """Test listing the methods and their mode."""
+    pf.set_instrumentation(False)
+
+    @pf.register_dataframe_method
+    def switch_late(df):
+        """Return the DataFrame.
+
+        Args:
+            df: A pandas DataFrame.
+
+        Returns:
+            The DataFrame.
+        """
+        return df
+
+    methods = pf.registered_methods().set_index(["class", "name"])
+    assert methods.loc[("Series", "switch_direct"), "registration"] == "direct"
+    assert methods.loc[("DataFrame", "switch_accessor"), "registration"] == "accessor"
+    assert not methods["instrumented"].any()
+
+    pf.set_instrumentation(True)
+    assert pf.registered_methods()["instrumented"].all()
@@ -0,0 +1,298 @@
+"""Tests for lazy chains of registered methods."""
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+CALLS = []
+
+
+@pf.register_dataframe_method(pushdown=("columns", "rows"))
+def lazy_double(df: pd.DataFrame) -> pd.DataFrame:
+    """Double every value, recording the shape of the input.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The doubled DataFrame.
+    """
+    CALLS.append(("lazy_double", df.shape))
+    return df * 2
+
+
+@pf.register_dataframe_method
+def lazy_add_total(df: pd.DataFrame) -> pd.DataFrame:
+    """Add a column with the row totals.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The DataFrame with a total column.
+    """
+    CALLS.append(("lazy_add_total", df.shape))
+    return df.assign(total=df.sum(axis=1))
+
+
+@pf.register_dataframe_method(selects="columns")
+def lazy_select(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Select columns.
+
+    Args:
+        df: A pandas DataFrame.
+        columns: The columns to select.
+
+    Returns:
+        The selected columns.
+    """
+    return df[columns]
+
+
+@pf.register_dataframe_method(selects="rows")
+def lazy_positive(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Keep the rows where `column` is positive.
+
+    Args:
+        df: A pandas DataFrame.
+        column: The column to filter on.
+
+    Returns:
+        The filtered rows.
+    """
+    return df[df[column] > 0]
+
+
+@pf.register_dataframe_method(mutation="inplace")
+def lazy_negate_b(df: pd.DataFrame) -> None:
+    """Negate column b in place.
+
+    Args:
+        df: A pandas DataFrame.
+    """
+    df["b"] = -df["b"]
+
+
+@pf.register_dataframe_method(mutation="returns_new")
+def lazy_squared(df: pd.DataFrame) -> pd.DataFrame:
+    """Square every value.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The squared DataFrame.
+    """
+    return df**2
+
+
+@pytest.fixture
+def df():
+    """A DataFrame with three columns.
+
+    Returns:
+        A pandas DataFrame.
+    """
+    CALLS.clear()
+    return pd.DataFrame({"a": [1, -1, 2, -2], "b": [1, 2, 3, 4], "c": [0, 0, 0, 0]})
+
+
+def test_lazy_records_without_executing(df):
+    """Test that nothing runs before collect."""
+    lazy = df.pf.lazy().lazy_double().lazy_select(["a"])
+    assert isinstance(lazy, pf.LazyFrame)
+    assert CALLS == []
+    assert [step.name for step in lazy.plan] == ["lazy_double", "lazy_select"]
+    with pytest.raises(AttributeError, match="not a method registered"):
+        lazy.not_registered_anywhere()
+
+
+def test_lazy_pushdown(df):
+    """Test that selections are pushed ahead of the steps allowing it."""
+    lazy = (
+        df.pf.lazy()
+        .lazy_add_total()
+        .lazy_double()
+        .lazy_positive("a")
+        .lazy_select(["a", "total"])
+    )
+    assert lazy.explain() == (
+        "lazy_add_total()\nlazy_positive('a')\nlazy_select(['a', 'total'])\n"
+        "lazy_double()"
+    )
+    expected = lazy.collect(optimize=False)
+    CALLS.clear()
+    pd.testing.assert_frame_equal(lazy.collect(), expected)
+    # the expensive step only saw the selected rows and columns
+    assert CALLS == [("lazy_add_total", (4, 3)), ("lazy_double", (2, 2))]
+
+
+def test_lazy_copies(df):
+    """Test that consecutive copies are collapsed."""
+    lazy = df.pf.lazy().copy().copy().lazy_double().copy().lazy_select(["b"])
+    assert lazy.explain() == "lazy_select(['b'])\ncopy()\nlazy_double()\ncopy()"
+    result = lazy.collect()
+    assert result is not df
+    pd.testing.assert_frame_equal(result, df[["b"]] * 2)
+
+
+def test_lazy_drops_copies_made_unneeded_by_mutation(df):
+    """Test that copies around declared steps are dropped."""
+    lazy = df.pf.lazy().copy().lazy_negate_b().lazy_squared().copy().lazy_double()
+    assert lazy.explain() == "lazy_negate_b()\nlazy_squared()\nlazy_double()"
+    pd.testing.assert_frame_equal(lazy.collect(), lazy.collect(optimize=False))
+    assert df["b"].tolist() == [1, 2, 3, 4]
+
+
+def test_register_lazy_options_validation():
+    """Test that invalid lazy options are rejected at registration."""
+    with pytest.raises(ValueError, match="selects"):
+        pf.register_dataframe_method(selects="cells")(lambda df: df)
+    with pytest.raises(ValueError, match="pushdown"):
+        pf.register_dataframe_method(pushdown=("cells",))(lambda df: df)
+
+
+@pf.register_series_method(elementwise=True)
+def lazy_strip(s: pd.Series) -> pd.Series:
+    """Strip whitespace, recording the length of the input.
+
+    Args:
+        s: A pandas Series of strings.
+
+    Returns:
+        The stripped Series.
+    """
+    CALLS.append(("lazy_strip", len(s)))
+    return s.str.strip()
+
+
+@pf.register_series_method(elementwise=True)
+def lazy_lower(s: pd.Series) -> pd.Series:
+    """Lowercase strings.
+
+    Args:
+        s: A pandas Series of strings.
+
+    Returns:
+        The lowercased Series.
+    """
+    return s.str.lower()
+
+
+@pf.register_series_ufunc
+def lazy_increment(x, step=1):
+    """Increment a value.
+
+    Args:
+        x: A number.
+        step: The increment.
+
+    Returns:
+        The incremented number.
+    """
+    return x + step
+
+
+@pf.register_series_ufunc
+def lazy_halve(x):
+    """Halve a value.
+
+    Args:
+        x: A number.
+
+    Returns:
+        The halved number.
+    """
+    return x / 2
+
+
+def test_lazy_fuses_elementwise_steps():
+    """Adjacent elementwise Series methods run as one step."""
+    s = pd.Series([" A", "b ", " A", None, "b "] * 3, name="key")
+    chain = s.pf.lazy().lazy_strip().lazy_lower()
+    assert chain.explain() == "fused(lazy_strip(), lazy_lower())"
+
+    CALLS.clear()
+    pd.testing.assert_series_equal(chain.collect(), s.str.strip().str.lower())
+    # called on the distinct values only
+    assert CALLS == [("lazy_strip", 3)]
+    pd.testing.assert_series_equal(
+        chain.collect(optimize=False), s.str.strip().str.lower()
+    )
+
+    # the dtype of the last step is kept, e.g. object for categorical inputs
+    categories = s.astype("category")
+    chain = categories.pf.lazy().lazy_strip().lazy_lower()
+    expected = categories.lazy_strip().lazy_lower()
+    assert expected.dtype == object
+    pd.testing.assert_series_equal(chain.collect(), expected)
+
+    numbers = pd.Series([1.0, 2.0, 3.0])
+    chain = numbers.pf.lazy().lazy_increment(step=3).lazy_halve()
+    pd.testing.assert_series_equal(chain.collect(), (numbers + 3) / 2)
+    tracer = pf.MethodCallTracer()
+    with tracer:
+        chain.collect()
+    assert list(tracer.records()["method"]) == ["lazy_increment+lazy_halve"]
+
+
+@pf.register_dataframe_method
+def lazy_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a column.
+
+    Args:
+        df: A pandas DataFrame.
+        column: The column to return.
+
+    Returns:
+        The column.
+    """
+    return df[column]
+
+
+@pf.register_series_method(elementwise=True, pure=True)
+def lazy_upper(s: pd.Series) -> pd.Series:
+    """Uppercase strings, with cached results.
+
+    Args:
+        s: A pandas Series of strings.
+
+    Returns:
+        The uppercased Series.
+    """
+    return s.str.upper()
+
+
+def test_lazy_steps_follow_the_result_class():
+    """Series methods can follow DataFrame methods returning Series."""
+    df = pd.DataFrame({"key": [" A", "b ", " A"]})
+    chain = df.pf.lazy().lazy_column("key").lazy_strip().lazy_lower()
+    assert chain.explain() == "lazy_column('key')\nfused(lazy_strip(), lazy_lower())"
+    pd.testing.assert_series_equal(chain.collect(), df["key"].str.strip().str.lower())
+    with pytest.raises(AttributeError, match="for Series"):
+        chain.not_registered_anywhere()
+
+
+def test_lazy_fuses_only_unwrapped_steps():
+    """Cached steps are not fused, uninstrumented ones are not traced."""
+    s = pd.Series([" a", "b "])
+    chain = s.pf.lazy().lazy_strip().lazy_upper().lazy_lower()
+    assert chain.explain() == "lazy_strip()\nlazy_upper()\nlazy_lower()"
+
+    numbers = pd.Series([1.0, 2.0, 3.0])
+    chain = numbers.pf.lazy().lazy_increment().lazy_halve()
+    tracer = pf.MethodCallTracer()
+    try:
+        pf.set_instrumentation(False, methods=["lazy_halve"])
+        with tracer:
+            pd.testing.assert_series_equal(chain.collect(), (numbers + 1) / 2)
+        # not composed: only the instrumented step is traced
+        assert list(tracer.records()["method"]) == ["lazy_increment"]
+        pf.set_instrumentation(False, methods=["lazy_increment"])
+        tracer.clear()
+        with tracer:
+            pd.testing.assert_series_equal(chain.collect(), (numbers + 1) / 2)
+        assert tracer.records().empty
+    finally:
+        pf.set_instrumentation(True, methods=["lazy_increment", "lazy_halve"])
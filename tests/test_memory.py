@@ -0,0 +1,90 @@
+"""Tests for the memory accounting of registered method calls."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_method
+def memory_explode(df: pd.DataFrame, times: int) -> pd.DataFrame:
+    """Repeat every row.
+
+    Args:
+        df: A pandas DataFrame.
+        times: The number of repetitions.
+
+    Returns:
+        The repeated rows.
+    """
+    return df.loc[df.index.repeat(times)]
+
+
+@pf.register_dataframe_groupby_method(direct=True)
+def memory_group_sizes(grp) -> pd.Series:
+    """Return the size of each group.
+
+    Args:
+        grp: A pandas DataFrameGroupBy.
+
+    Returns:
+        The group sizes.
+    """
+    return grp.size()
+
+
+@pytest.fixture
+def df():
+    """A DataFrame of 10,000 floats.
+
+    Returns:
+        A pandas DataFrame.
+    """
+    return pd.DataFrame({"a": np.arange(10_000.0), "b": np.arange(10_000) % 3})
+
+
+def test_memory_records_and_report(df):
+    """Test that input, output and peak memory are recorded per call."""
+    tracker = pf.MemoryTracker(peak=True, growth_threshold=None)
+    with tracker.scoped():
+        df.memory_explode(3)
+        df.groupby("b").memory_group_sizes()
+    records = tracker.records()
+    assert records["method"].tolist() == ["memory_explode", "memory_group_sizes"]
+    explode = records.iloc[0]
+    assert explode["in_bytes"] == df.memory_usage().sum()
+    expected = df.memory_explode(3).memory_usage().sum()
+    assert explode["out_bytes"] == expected
+    assert explode["growth"] == pytest.approx(expected / explode["in_bytes"])
+    assert explode["peak_bytes"] >= explode["out_bytes"] - 1024
+    # the grouped DataFrame is the input of groupby methods
+    assert records.iloc[1]["in_bytes"] == df.memory_usage().sum()
+
+    report = tracker.report()
+    assert report.index[0] == "memory_explode"
+    assert report.loc["memory_explode", "calls"] == 1
+    assert report["flagged"].sum() == 0
+
+
+def test_memory_growth_warning(df):
+    """Test that calls growing memory beyond the threshold are flagged."""
+    tracker = pf.MemoryTracker(growth_threshold=5, min_bytes=0)
+    with tracker.scoped():
+        df.memory_explode(2)
+        with pytest.warns(pf.MemoryGrowthWarning, match="memory_explode") as record:
+            df.memory_explode(10)
+    assert record[0].filename == __file__
+    assert tracker.report().loc["memory_explode", "flagged"] == 1
+
+
+def test_memory_growth_hook(df):
+    """Test that a hook can handle flagged calls instead of warnings."""
+    flagged = []
+    tracker = pf.MemoryTracker(
+        growth_threshold=5, min_bytes=0, on_growth=flagged.append
+    )
+    with tracker.scoped():
+        df.memory_explode(10)
+    assert [record["method"] for record in flagged] == ["memory_explode"]
+    assert flagged[0]["growth"] > 10
@@ -0,0 +1,106 @@
+"""Tests for the declared mutation semantics of registered methods."""
+
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+from pandas_flavor import mutation
+
+
+@pf.register_dataframe_method(mutation="inplace")
+def scale_first_column(df: pd.DataFrame, factor: float = 2.0) -> None:
+    """Scale the first column in place.
+
+    Args:
+        df: A pandas DataFrame.
+        factor: The scaling factor.
+    """
+    df.iloc[:, 0] *= factor
+
+
+@pf.register_dataframe_method
+def scale_first_column_undeclared(df: pd.DataFrame, factor: float = 2.0):
+    """Scale the first column in place, without declaring it.
+
+    Args:
+        df: A pandas DataFrame.
+        factor: The scaling factor.
+
+    Returns:
+        The modified DataFrame.
+    """
+    df.iloc[:, 0] *= factor
+    return df
+
+
+@pf.register_series_method(mutation="returns_view", direct=True)
+def first_values(s: pd.Series, n: int) -> pd.Series:
+    """Return the first values.
+
+    Args:
+        s: A pandas Series.
+        n: The number of values.
+
+    Returns:
+        The first values, sharing data with s.
+    """
+    return s.iloc[:n]
+
+
+def peak_memory(func) -> int:
+    """Measure the peak memory allocated while calling func.
+
+    Args:
+        func: The function to call.
+
+    Returns:
+        The peak of allocated memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_inplace_method_leaves_input_untouched():
+    """Test that inplace methods modify a copy and return it."""
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    result = df.scale_first_column(factor=3)
+    assert df["a"].tolist() == [1.0, 2.0]
+    assert result["a"].tolist() == [3.0, 6.0]
+    assert result is not df
+
+
+def test_inplace_method_copies_only_modified_data():
+    """Test that declaring inplace uses less memory than a defensive copy."""
+    df = pd.DataFrame(np.ones((50_000, 40)), columns=[f"c{i}" for i in range(40)])
+    frame_bytes = df.memory_usage().sum()
+
+    declared = peak_memory(lambda: df.scale_first_column())
+    defensive = peak_memory(lambda: df.copy().scale_first_column_undeclared())
+
+    assert defensive > frame_bytes
+    assert declared < frame_bytes / 4
+    assert (df["c0"] == 1).all()
+
+
+def test_returns_view_copied_without_copy_on_write(monkeypatch):
+    """Test that view results are only copied without Copy-on-Write."""
+    s = pd.Series([1, 2, 3])
+    assert np.shares_memory(s.first_values(2).to_numpy(), s.to_numpy())
+
+    monkeypatch.setattr(mutation, "copy_on_write_enabled", lambda: False)
+    assert not np.shares_memory(s.first_values(2).to_numpy(), s.to_numpy())
+
+
+def test_invalid_mutation():
+    """Test that unknown or inconsistent declarations are rejected."""
+    with pytest.raises(ValueError, match="mutation must be one of"):
+        pf.register_series_method(lambda s: s, mutation="sometimes")
+    with pytest.raises(ValueError, match="cannot be cached"):
+        pf.register_series_method(lambda s: s, mutation="inplace", pure=True)
@@ -0,0 +1,210 @@
+"""Tests for exporting registered method calls as spans."""
+
+import threading
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+from pandas_flavor.otel import InMemorySpanExporter, remote_parent, to_otlp
+
+
+@pf.register_dataframe_method
+def span_inner(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the first row of the DataFrame.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        pd.DataFrame: The first row.
+    """
+    return df.head(1)
+
+
+@pf.register_dataframe_method
+def span_outer(df: pd.DataFrame) -> pd.DataFrame:
+    """Call another registered method.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        pd.DataFrame: The first row.
+    """
+    return df.span_inner()
+
+
+@pf.register_dataframe_method
+def span_fail(df: pd.DataFrame):
+    """Raise an error.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Raises:
+        KeyError: always.
+    """
+    raise KeyError("missing")
+
+
+class BlockingExporter(InMemorySpanExporter):
+    """In-memory exporter waiting for an event before each export."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.threads = set()
+
+    def export(self, spans):
+        """Wait for the release event, then keep the spans.
+
+        Args:
+            spans: The spans to keep.
+        """
+        self.threads.add(threading.get_ident())
+        self.release.wait()
+        super().export(spans)
+
+
+@pytest.fixture
+def df():
+    """A DataFrame with three rows.
+
+    Returns:
+        pd.DataFrame: The DataFrame.
+    """
+    return pd.DataFrame({"x": [1.0, 2.0, 3.0], "y": [4, 5, 6]})
+
+
+def test_spans_nest_and_carry_attributes(df):
+    """Test the attributes and parents of the spans of nested calls."""
+    exporter = InMemorySpanExporter()
+    tracer = pf.SpanTracer(exporter)
+    with tracer.scoped():
+        df.span_outer()
+        with pytest.raises(KeyError):
+            df.span_fail()
+    tracer.shutdown()
+
+    inner, outer, failed = exporter.get_finished_spans()
+    assert (inner.name, outer.name) == ("span_inner", "span_outer")
+    assert inner.trace_id == outer.trace_id != failed.trace_id
+    assert inner.parent_span_id == outer.span_id
+    assert outer.parent_span_id is None
+    assert outer.start_time <= inner.start_time <= inner.end_time <= outer.end_time
+    assert outer.attributes["pandas_flavor.rows"] == 3
+    assert outer.attributes["pandas_flavor.columns"] == 2
+    assert outer.attributes["pandas_flavor.bytes"] == df.memory_usage().sum()
+    assert outer.attributes["pandas_flavor.out.rows"] == 1
+    assert outer.attributes["pandas_flavor.duration_ns"] > 0
+    assert failed.error == "KeyError: 'missing'"
+
+    request = to_otlp([inner, failed])
+    spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert spans[0]["parentSpanId"] == f"{outer.span_id:016x}"
+    assert {"key": "pandas_flavor.rows", "value": {"intValue": "3"}} in (
+        spans[0]["attributes"]
+    )
+    assert spans[1]["status"]["code"] == 2
+
+
+def test_remote_parent(df):
+    """Test nesting the outermost spans under a remote parent."""
+    exporter = InMemorySpanExporter()
+    tracer = pf.SpanTracer(exporter, otel_context=False)
+    traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    with tracer.scoped(), remote_parent(traceparent):
+        df.span_inner()
+    tracer.flush()
+    (span,) = exporter.get_finished_spans()
+    assert span.trace_id == 0x0AF7651916CD43DD8448EB211C80319C
+    assert span.parent_span_id == 0xB7AD6B7169203331
+    tracer.shutdown()
+
+    with pytest.raises(ValueError, match="invalid traceparent"):
+        with remote_parent("00-0af7651916cd43dd-b7ad6b7169203331-01"):
+            pass
+
+
+def test_spans_are_exported_in_the_background(df):
+    """Test that calls do not wait for the exporter, and the queue bounds."""
+    exporter = BlockingExporter()
+    tracer = pf.SpanTracer(exporter, max_queue_size=4, max_batch_size=2)
+    with tracer.scoped():
+        for _ in range(8):
+            df.span_inner()
+        # the first batch is being exported, the queue is full
+        assert exporter.get_finished_spans() == []
+        assert tracer.stats()["dropped"] > 0
+        exporter.release.set()
+    tracer.shutdown()
+
+    stats = tracer.stats()
+    assert stats["exported"] + stats["dropped"] == 8
+    assert stats["queued"] == 0
+    assert len(exporter.get_finished_spans()) == stats["exported"]
+    assert threading.get_ident() not in exporter.threads
+
+
+def test_concurrent_spans_are_counted_once():
+    """Test that spans finished during shutdown are exported or dropped."""
+    exporter = InMemorySpanExporter()
+    tracer = pf.SpanTracer(exporter, max_queue_size=100, max_batch_size=10)
+    start = threading.Barrier(5)
+
+    def finish_spans():
+        """Finish 200 spans."""
+        start.wait()
+        for _ in range(200):
+            with tracer("span_inner", (), {}):
+                pass
+
+    threads = [threading.Thread(target=finish_spans) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    tracer.shutdown()
+    for thread in threads:
+        thread.join()
+
+    stats = tracer.stats()
+    assert stats["exported"] + stats["dropped"] == 800
+    assert stats["queued"] == 0
+    assert len(exporter.get_finished_spans()) == stats["exported"]
+
+
+def test_span_never_opened():
+    """Test that closing a span that was never opened does nothing."""
+    tracer = pf.SpanTracer(InMemorySpanExporter())
+    tracer("span_inner", (), {}).__exit__(None, None, None)
+    tracer.shutdown()
+    assert tracer.stats()["exported"] == tracer.stats()["dropped"] == 0
+
+
+def test_sdk_exporter(df):
+    """Test exporting the spans with an exporter of the OpenTelemetry SDK."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter as SDKInMemorySpanExporter,
+    )
+
+    from pandas_flavor.otel import OTelSDKExporter
+
+    sdk_exporter = SDKInMemorySpanExporter()
+    tracer = pf.SpanTracer(OTelSDKExporter(sdk_exporter))
+    with TracerProvider().get_tracer("job").start_as_current_span("job") as job:
+        with tracer.scoped():
+            df.span_outer()
+    tracer.flush()
+
+    inner, outer = sdk_exporter.get_finished_spans()
+    job_context = job.get_span_context()
+    assert outer.context.trace_id == job_context.trace_id
+    assert outer.parent.span_id == job_context.span_id
+    assert inner.parent.span_id == outer.context.span_id
+    assert outer.attributes["pandas_flavor.rows"] == 3
+    assert outer.instrumentation_scope.name == "pandas_flavor"
+    assert trace.get_current_span() is trace.INVALID_SPAN
@@ -91,3 +91,89 @@ def test_register_ser_groupby_method():
     )
     by = df.groupby([0])
     by.dummy_func()
+
+
+def test_register_direct_methods():
+    """Test the direct registration mode of all pandas registration functions."""
+
+    @pf.register_dataframe_method(direct=True)
+    def direct_df_func(df: pd.DataFrame, n: int = 1) -> int:
+        """Direct DataFrame func.
+
+        Args:
+            df: A pandas DataFrame.
+            n: A multiplier.
+
+        Returns:
+            The number of rows times n.
+        """
+        return len(df) * n
+
+    @pf.register_series_method(direct=True)
+    def direct_ser_func(s: pd.Series) -> int:
+        """Direct Series func.
+
+        Args:
+            s: A pandas Series.
+
+        Returns:
+            The length of the Series.
+        """
+        return len(s)
+
+    @pf.register_dataframe_groupby_method(direct=True)
+    def direct_df_grp_func(by: DataFrameGroupBy) -> int:
+        """Direct DataFrameGroupBy func.
+
+        Args:
+            by: A DataFrameGroupBy object.
+
+        Returns:
+            The number of groups.
+        """
+        return by.ngroups
+
+    @pf.register_series_groupby_method(direct=True)
+    def direct_ser_grp_func(by: SeriesGroupBy) -> int:
+        """Direct SeriesGroupBy func.
+
+        Args:
+            by: A SeriesGroupBy object.
+
+        Returns:
+            The number of groups.
+        """
+        return by.ngroups
+
+    df = pd.DataFrame({"a": [1, 1, 2], "b": [1.0, 2.0, 3.0]})
+    assert df.direct_df_func(n=2) == 6
+    assert df["b"].direct_ser_func() == 3
+    assert df.groupby("a").direct_df_grp_func() == 2
+    assert df.groupby("a")["b"].direct_ser_grp_func() == 2
+    # the method is bound like a plain function, no accessor is pinned
+    assert "direct_df_func" not in vars(df)
+    assert pd.DataFrame.direct_df_func.__doc__.startswith("Direct DataFrame func.")
+
+
+def test_register_direct_method_traced(recording_factory):
+    """Test that directly registered methods honour method_call_ctx_factory."""
+    factory = recording_factory(start=True)
+
+    @pf.register_dataframe_method(direct=True)
+    def direct_traced_func(df: pd.DataFrame) -> pd.DataFrame:
+        """Direct traced func.
+
+        Args:
+            df: A pandas DataFrame.
+
+        Returns:
+            df: A pandas DataFrame.
+        """
+        return df
+
+    pf.register.method_call_ctx_factory = factory
+    try:
+        pd.DataFrame().direct_traced_func()
+    finally:
+        pf.register.method_call_ctx_factory = None
+    assert [start[0] for start in factory.starts] == ["direct_traced_func"]
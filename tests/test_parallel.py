@@ -0,0 +1,147 @@
+"""Tests for the parallel execution of registered groupby methods."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.core.groupby.generic import DataFrameGroupBy, SeriesGroupBy
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_groupby_method(engine="threads", max_workers=3)
+def par_stats(grp: DataFrameGroupBy) -> pd.DataFrame:
+    """Aggregate each group.
+
+    Args:
+        grp: A DataFrameGroupBy object.
+
+    Returns:
+        The per-group sums and sizes.
+    """
+    return grp.agg(["sum", "size"])
+
+
+@pf.register_dataframe_groupby_method(engine="threads", max_workers=3)
+def par_demean(grp: DataFrameGroupBy) -> pd.DataFrame:
+    """Subtract the group means.
+
+    Args:
+        grp: A DataFrameGroupBy object.
+
+    Returns:
+        The demeaned values, indexed like the grouped DataFrame.
+    """
+    return grp.transform(lambda x: x - x.mean())
+
+
+@pf.register_dataframe_groupby_method(engine="processes", max_workers=2)
+def par_apply(grp: DataFrameGroupBy, column: str) -> pd.Series:
+    """Apply a Python function to each group.
+
+    Args:
+        grp: A DataFrameGroupBy object.
+        column: The column to summarize.
+
+    Returns:
+        The summary of each group.
+    """
+    return grp.apply(lambda g: f"{g[column].sum():.1f}/{'|'.join(g['tag'])}")
+
+
+@pf.register_series_groupby_method(engine="processes", max_workers=2)
+def par_series_max(grp: SeriesGroupBy) -> pd.Series:
+    """Return the maximum of each group.
+
+    Args:
+        grp: A SeriesGroupBy object.
+
+    Returns:
+        The per-group maximum.
+    """
+    return grp.max()
+
+
+@pf.register_series_groupby_method(engine="threads", max_workers=2)
+def par_count(grp: SeriesGroupBy) -> int:
+    """Return the number of groups.
+
+    Args:
+        grp: A SeriesGroupBy object.
+
+    Returns:
+        The number of groups.
+    """
+    return grp.ngroups
+
+
+@pytest.fixture
+def df():
+    """A DataFrame with unbalanced groups.
+
+    Returns:
+        A pandas DataFrame.
+    """
+    rng = np.random.default_rng(0)
+    n = 1000
+    return pd.DataFrame(
+        {
+            "k": rng.choice(list("qwertyuiopasdfgh"), n, p=[0.5] + [0.5 / 15] * 15),
+            "x": rng.normal(size=n),
+            "y": rng.integers(0, 10, n),
+            "tag": rng.choice(list("abc"), n),
+        },
+        index=rng.permutation(n),
+    )
+
+
+@pytest.mark.parametrize("as_index", [True, False])
+@pytest.mark.parametrize("sort", [True, False])
+def test_parallel_aggregation(df, sort, as_index):
+    """Test that chunked aggregations match the serial result."""
+    grp = df.groupby("k", sort=sort, as_index=as_index)[["x", "y"]]
+    pd.testing.assert_frame_equal(grp.par_stats(), par_stats(grp))
+
+
+def test_parallel_transform_keeps_row_order(df):
+    """Test that row-indexed results are returned in the original row order."""
+    grp = df.groupby("k")[["x", "y"]]
+    pd.testing.assert_frame_equal(grp.par_demean(), par_demean(grp))
+
+
+def test_parallel_processes(df):
+    """Test the process engine with shared numeric and pickled object columns."""
+    grp = df.groupby(["k", "y"])
+    pd.testing.assert_series_equal(grp.par_apply("x"), par_apply(grp, "x"))
+
+
+def test_parallel_series_groupby(df):
+    """Test series groupby methods grouped by a column or by a level."""
+    grp = df.groupby("k")["x"]
+    pd.testing.assert_series_equal(grp.par_series_max(), par_series_max(grp))
+    by_level = df.set_index("k")["y"].groupby(level="k")
+    pd.testing.assert_series_equal(by_level.par_series_max(), par_series_max(by_level))
+
+
+@pytest.mark.parametrize(
+    "rows", [slice(0, 0), slice(None)], ids=["empty", "missing_keys"]
+)
+def test_parallel_without_groups(df, rows):
+    """Test that groupings without any group run the serial method."""
+    df = df.iloc[rows].assign(k=None)
+    grp = df.groupby("k")
+    pd.testing.assert_frame_equal(
+        grp[["x", "y"]].par_stats(), par_stats(grp[["x", "y"]])
+    )
+    pd.testing.assert_series_equal(grp["x"].par_series_max(), par_series_max(grp["x"]))
+
+
+def test_parallel_requires_pandas_results(df):
+    """Test that results which cannot be concatenated are rejected."""
+    with pytest.raises(TypeError, match="must return a DataFrame or a Series"):
+        df.groupby("k")["x"].par_count()
+
+
+def test_parallel_unknown_engine():
+    """Test that unknown engines are rejected at registration."""
+    with pytest.raises(ValueError, match="engine"):
+        pf.register_dataframe_groupby_method(engine="gpu")(lambda grp: grp)
@@ -0,0 +1,116 @@
+"""Tests for the sampling profiler."""
+
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_method
+def sampled_sum(df: pd.DataFrame) -> pd.Series:
+    """Sum the columns.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The column sums.
+    """
+    return df.sum()
+
+
+@pf.register_series_method(direct=True)
+def sampled_allocate(s: pd.Series, nbytes: int) -> int:
+    """Allocate a temporary array.
+
+    Args:
+        s: A pandas Series.
+        nbytes: The size of the array.
+
+    Returns:
+        The size of the array.
+
+    Raises:
+        ValueError: if nbytes is negative.
+    """
+    if nbytes < 0:
+        raise ValueError("negative size")
+    return np.ones(nbytes, dtype=np.uint8).nbytes
+
+
+@pf.register_series_method(direct=True)
+def sampled_allocate_then_call(s: pd.Series, nbytes: int) -> int:
+    """Allocate a temporary array, then call another sampled method.
+
+    Args:
+        s: A pandas Series.
+        nbytes: The size of the array.
+
+    Returns:
+        The size of the array allocated by the nested call.
+    """
+    np.ones(nbytes, dtype=np.uint8)
+    return s.sampled_allocate(10)
+
+
+def test_sampling_rates():
+    """Test that one call in N is sampled, per method."""
+    df = pd.DataFrame({"a": [1, 2]})
+    profiler = pf.SamplingProfiler(every=3, rates={"sampled_allocate": 1})
+    with profiler.scoped():
+        for _ in range(10):
+            df.sampled_sum()
+        for _ in range(2):
+            df["a"].sampled_allocate(10)
+    report = profiler.report()
+    assert report.loc["sampled_sum", ["calls", "samples"]].tolist() == [10, 4]
+    assert report.loc["sampled_allocate", ["calls", "samples"]].tolist() == [2, 2]
+    assert report.loc["sampled_sum", "est_total_ms"] == pytest.approx(
+        report.loc["sampled_sum", "mean_ms"] * 10
+    )
+    assert report.loc["sampled_sum", "peak_max_bytes"] == -1
+
+
+def test_sampled_calls_profile_and_memory():
+    """Test the cProfile statistics and peak memory of sampled calls."""
+    s = pd.Series([1, 2])
+    profiler = pf.SamplingProfiler(every=2, profile=True, memory=True)
+    with profiler:
+        for _ in range(4):
+            s.sampled_allocate(1_000_000)
+        with pytest.raises(ValueError):
+            s.sampled_allocate(-1)
+    report = profiler.report()
+    assert report.loc["sampled_allocate", "samples"] == 3
+    assert report.loc["sampled_allocate", "errors"] == 1
+    assert report.loc["sampled_allocate", "peak_max_bytes"] >= 1_000_000
+    # tracemalloc is only on during sampled calls
+    assert not tracemalloc.is_tracing()
+
+    stats = profiler.profile_stats("sampled_allocate")
+    functions = {function for _, _, function in stats.stats}
+    assert "sampled_allocate" in functions
+    assert profiler.profile_stats("sampled_sum") is None
+
+
+def test_nested_calls_keep_their_peak():
+    """Test that a nested sampled call does not reset the peak of the outer one."""
+    s = pd.Series([1, 2])
+    profiler = pf.SamplingProfiler(every=1, memory=True)
+    with profiler:
+        s.sampled_allocate_then_call(1_000_000)
+    report = profiler.report()
+    assert report.loc["sampled_allocate_then_call", "peak_max_bytes"] >= 1_000_000
+    assert report.loc["sampled_allocate", "peak_max_bytes"] < 1_000_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_invalid_rates():
+    """Test that sampling rates must be positive."""
+    with pytest.raises(ValueError):
+        pf.SamplingProfiler(every=0)
+    with pytest.raises(ValueError):
+        pf.SamplingProfiler(rates={"sampled_sum": -1})
@@ -0,0 +1,184 @@
+"""Tests for the batched registration of methods."""
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+from pandas_flavor.register import find_registered_method
+
+
+def batch_row_count(df):
+    """Count the rows.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The number of rows.
+    """
+    return len(df)
+
+
+def batch_column_count(df):
+    """Count the columns.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The number of columns.
+    """
+    return df.shape[1]
+
+
+def test_register_many():
+    """Test that all methods of a batch are installed with their options."""
+    batch = pf.register_many([batch_row_count, batch_column_count], direct=True)
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    assert df.batch_row_count() == 3
+    assert df.batch_column_count() == 2
+    assert len(batch) == 2
+    assert [registered.name for registered in batch.registered] == [
+        "batch_row_count",
+        "batch_column_count",
+    ]
+    assert all(registered.direct for registered in batch.registered)
+    assert batch.install_time > 0
+
+
+def test_batch_decorators_and_targets():
+    """Test adding methods with the decorator, installed on exiting the block."""
+    with pf.RegistrationBatch() as batch:
+
+        @batch.add
+        def batch_first_row(df):
+            """Return the first row.
+
+            Args:
+                df: A pandas DataFrame.
+
+            Returns:
+                The first row.
+            """
+            return df.iloc[0]
+
+        @batch.add(target="series_groupby")
+        def batch_group_total(grp):
+            """Sum each group.
+
+            Args:
+                grp: A pandas SeriesGroupBy.
+
+            Returns:
+                The sums.
+            """
+            return grp.sum()
+
+        # nothing is installed before the end of the block
+        assert not hasattr(pd.DataFrame, "batch_first_row")
+
+    df = pd.DataFrame({"a": [1, 1, 2], "b": [4, 5, 6]})
+    assert df.batch_first_row().tolist() == [1, 4]
+    assert df.groupby("a")["b"].batch_group_total().tolist() == [9, 6]
+    assert "batch_first_row" in pd.DataFrame._accessors
+    assert find_registered_method(df, "batch_first_row") is batch.registered[0]
+
+
+def test_batch_reports_conflicts_once():
+    """Test that overridden attributes are reported in a single warning."""
+
+    def batch_conflict_a(df):
+        """Return the DataFrame.
+
+        Args:
+            df: A pandas DataFrame.
+
+        Returns:
+            The DataFrame.
+        """
+        return df
+
+    def batch_conflict_b(df):
+        """Return the DataFrame.
+
+        Args:
+            df: A pandas DataFrame.
+
+        Returns:
+            The DataFrame.
+        """
+        return df
+
+    methods = [batch_conflict_a, batch_conflict_b]
+    pf.register_many(methods)
+    with pytest.warns(UserWarning) as record:
+        pf.register_many(methods, direct=True)
+    assert len(record) == 1
+    # pointing at the registering code
+    assert record[0].filename == __file__
+    message = str(record[0].message)
+    assert "DataFrame.batch_conflict_a, DataFrame.batch_conflict_b" in message
+    assert find_registered_method(pd.DataFrame, "batch_conflict_a").direct
+
+
+def test_batch_validates_options():
+    """Test that unknown targets and options are rejected when added."""
+    batch = pf.RegistrationBatch()
+    with pytest.raises(ValueError, match="target"):
+        batch.add(batch_row_count, target="index")
+    with pytest.raises(TypeError, match="engine"):
+        batch.add(batch_row_count, engine="threads")
+    assert len(batch) == 0
+
+
+def test_signature_computed_on_first_traced_call():
+    """Test that method signatures are only computed when tracing needs them."""
+
+    @pf.register_series_method
+    def lazy_signature_method(s, n=1):
+        """Return the first values.
+
+        Args:
+            s: A pandas Series.
+            n: The number of values.
+
+        Returns:
+            The first values.
+        """
+        return s.head(n)
+
+    registered = find_registered_method(pd.Series, "lazy_signature_method")
+    s = pd.Series([1, 2, 3])
+    s.lazy_signature_method()
+    assert registered._method_signature is None
+
+    tracer = pf.MethodCallTracer()
+    with tracer.scoped():
+        s.lazy_signature_method(n=2)
+    assert list(registered._method_signature.parameters) == ["s", "n"]
+    assert tracer.summary().loc["lazy_signature_method", "count"] == 1
+
+
+def test_cached_method_signature_computed_on_first_call():
+    """Test that caching defers the signature of pure methods to their first call."""
+    batch = pf.RegistrationBatch()
+
+    def lazy_pure_method(s, n=1):
+        """Return the first values.
+
+        Args:
+            s: A pandas Series.
+            n: The number of values.
+
+        Returns:
+            The first values.
+        """
+        return s.head(n)
+
+    batch.add(lazy_pure_method, target="series", pure=True)
+    batch.install()
+    registered = find_registered_method(pd.Series, "lazy_pure_method")
+    assert registered._method_signature is None
+    s = pd.Series([1, 2, 3])
+    pd.testing.assert_series_equal(s.lazy_pure_method(2), s.lazy_pure_method(n=2))
+    assert list(registered._method_signature.parameters) == ["s", "n"]
@@ -0,0 +1,114 @@
+"""Tests for the chunked execution of registered DataFrame methods."""
+
+import io
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_method(chunkwise=True)
+def stream_clean(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop the rows with a negative value and normalize the country names.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The cleaned DataFrame.
+    """
+    return df[df["value"] >= 0].assign(country=df["country"].str.upper())
+
+
+@pf.register_dataframe_method(combine=lambda a, b: a.add(b, fill_value=0))
+def stream_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """Sum and count the values per country.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The per-country sums and counts.
+    """
+    return df.groupby("country")["value"].agg(["sum", "count"])
+
+
+@pf.register_dataframe_method
+def stream_mean(df: pd.DataFrame) -> pd.Series:
+    """Compute the mean from sums and counts.
+
+    Args:
+        df: The per-country sums and counts.
+
+    Returns:
+        The per-country means.
+    """
+    return df["sum"] / df["count"]
+
+
+@pf.register_series_method
+def stream_percent(s: pd.Series) -> pd.Series:
+    """Express fractions as rounded percentages.
+
+    Args:
+        s: A pandas Series of fractions.
+
+    Returns:
+        The percentages.
+    """
+    return (s * 100).round()
+
+
+CSV = "country,value\n" + "".join(
+    f"{country},{value}\n"
+    for country, value in [("fr", 1), ("de", -1), ("FR", 3), ("de", 4), ("it", 5)] * 7
+)
+
+
+def chunks():
+    """Read the test CSV in chunks.
+
+    Returns:
+        A reader yielding DataFrames of 4 rows.
+    """
+    return pd.read_csv(io.StringIO(CSV), chunksize=4)
+
+
+def test_stream_chunkwise():
+    """Test that chunkwise methods are applied chunk by chunk."""
+    processed = list(pf.stream(chunks()).stream_clean())
+    assert len(processed) == 9
+    assert all(len(chunk) <= 4 for chunk in processed)
+    pd.testing.assert_frame_equal(
+        pf.stream(chunks()).stream_clean().collect(),
+        pd.read_csv(io.StringIO(CSV)).stream_clean(),
+    )
+
+
+def test_stream_aggregation():
+    """Test that aggregating methods combine the chunk results."""
+    whole = pd.read_csv(io.StringIO(CSV)).stream_clean()
+    result = pf.stream(chunks()).stream_clean().stream_totals().stream_mean().collect()
+    pd.testing.assert_series_equal(result, whole.stream_totals().stream_mean())
+    # the Series returned by stream_mean is followed by Series methods
+    result = (
+        pf.stream(chunks())
+        .stream_clean()
+        .stream_totals()
+        .stream_mean()
+        .stream_percent()
+    ).collect()
+    pd.testing.assert_series_equal(
+        result, whole.stream_totals().stream_mean().stream_percent()
+    )
+    with pytest.raises(TypeError, match="collect"):
+        list(pf.stream(chunks()).stream_totals())
+
+
+def test_stream_rejects_unsafe_methods():
+    """Test that methods which are not chunk-safe are rejected."""
+    with pytest.raises(ValueError, match="cannot be applied to chunks"):
+        pf.stream(chunks()).stream_mean()
+    with pytest.raises(AttributeError, match="not a method registered"):
+        pf.stream(chunks()).not_registered_anywhere()
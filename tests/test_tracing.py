@@ -0,0 +1,131 @@
+"""Tests for the tracing backend."""
+
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+
+
+@pf.register_dataframe_method
+def traced_transpose(df: pd.DataFrame) -> pd.DataFrame:
+    """Transpose the DataFrame.
+
+    Args:
+        df: A pandas DataFrame.
+
+    Returns:
+        The transposed DataFrame.
+    """
+    return df.transpose()
+
+
+@pf.register_series_method
+def traced_fail(s: pd.Series) -> pd.Series:
+    """Raise an error.
+
+    Args:
+        s: A pandas Series.
+
+    Raises:
+        ValueError: always.
+    """
+    raise ValueError("traced_fail")
+
+
+def test_tracer_records_calls():
+    """Test that the tracer records names, shapes and memory usage."""
+    tracer = pf.MethodCallTracer(memory=True)
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    with tracer:
+        df.traced_transpose().traced_transpose()
+        with pytest.raises(ValueError):
+            df["a"].traced_fail()
+    df.traced_transpose()  # not traced anymore
+    assert pf.register.method_call_ctx_factory is None
+
+    records = tracer.records()
+    assert list(records["method"]) == ["traced_transpose"] * 2 + ["traced_fail"]
+    assert list(records.loc[0, ["in_rows", "in_cols", "out_rows", "out_cols"]]) == [
+        3,
+        2,
+        2,
+        3,
+    ]
+    assert (records["in_bytes"] > 0).all()
+    assert list(records["error"]) == [False, False, True]
+    assert (records["wall_ns"] >= 0).all()
+
+    summary = tracer.summary()
+    assert summary.loc["traced_transpose", "count"] == 2
+    assert summary.loc["traced_fail", "errors"] == 1
+    assert {"total_ms", "p50_ms", "p99_ms", "cpu_ms"} <= set(summary.columns)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]}),
+        pd.DataFrame(
+            {"a": [1, 2, 3], "s": ["x", "y", "z"], "c": pd.Categorical(list("xyx"))},
+            index=pd.MultiIndex.from_arrays([[1, 1, 2], list("abc")]),
+        ),
+    ],
+    ids=["numpy", "extension"],
+)
+def test_memory_usage(df):
+    """Test that the memory of DataFrames is their shallow memory_usage total."""
+    expected = df.memory_usage(index=True).sum()
+    assert pf.tracing._memory_usage(df) == expected
+
+
+def test_call_failing_before_start():
+    """Test that calls failing before their clocks started are recorded."""
+    tracer = pf.MethodCallTracer()
+    with pytest.raises(KeyError):
+        with tracer("traced_transpose", (), {}):
+            raise KeyError("arguments")
+    record = tracer.records().iloc[0]
+    assert record["error"] and record["wall_ns"] == 0
+
+
+def test_tracer_ring_buffer():
+    """Test that the tracer keeps only the most recent calls."""
+    tracer = pf.MethodCallTracer(capacity=4)
+    df = pd.DataFrame({"a": range(10)})
+    with tracer:
+        for n in range(1, 7):
+            df.head(n).traced_transpose()
+    records = tracer.records()
+    assert len(records) == 4
+    assert tracer.dropped == 2
+    assert list(records["in_rows"]) == [3, 4, 5, 6]
+
+
+def test_tracer_export(tmp_path):
+    """Test JSON and CSV export of records and summaries."""
+    tracer = pf.MethodCallTracer()
+    with tracer:
+        pd.DataFrame({"a": [1]}).traced_transpose()
+    assert json.loads(tracer.to_json())[0]["method"] == "traced_transpose"
+    assert json.loads(tracer.to_json(summary=True))[0]["count"] == 1
+    tracer.to_csv(tmp_path / "records.csv")
+    assert pd.read_csv(tmp_path / "records.csv")["method"].tolist() == [
+        "traced_transpose"
+    ]
+    assert tracer.to_csv(summary=True).startswith("method,count")
+
+
+def test_tracer_scoped():
+    """Test that a scoped tracer does not trace other threads."""
+    tracer = pf.MethodCallTracer()
+    df = pd.DataFrame({"a": [1]})
+    with tracer.scoped():
+        df.traced_transpose()
+        thread = threading.Thread(target=df.traced_transpose)
+        thread.start()
+        thread.join()
+    assert pf.register.method_call_ctx_factory is None
+    assert len(tracer.records()) == 1
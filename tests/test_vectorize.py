@@ -0,0 +1,143 @@
+"""Tests for vectorized Series methods."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandas_flavor as pf
+from pandas_flavor.register import find_registered_method
+from pandas_flavor.vectorize import VectorizedFunction
+
+
+@pf.register_series_ufunc
+def clip_score(x, low=0.0, high=1.0):
+    """Clip a value.
+
+    Args:
+        x: The value.
+        low: The lower bound.
+        high: The upper bound.
+
+    Returns:
+        The clipped value.
+    """
+    return min(max(x, low), high)
+
+
+@pf.register_series_method(vectorize=True, direct=True)
+def describe_value(x, unit):
+    """Format a value with its unit.
+
+    Args:
+        x: The value.
+        unit: The unit.
+
+    Returns:
+        str: The formatted value.
+    """
+    return f"{x} {unit}"
+
+
+def test_vectorized_method_matches_apply():
+    """Vectorized methods give the same result as Series.apply."""
+    s = pd.Series([-0.5, 0.25, 2.0], index=list("abc"), name="score")
+    expected = s.apply(clip_score, high=0.5)
+    pd.testing.assert_series_equal(s.clip_score(high=0.5), expected)
+    pd.testing.assert_series_equal(s.clip_score(0.0, 0.5), expected)
+    assert s.clip_score().dtype == np.float64
+
+    result = pd.Series([1, 2]).describe_value("m")
+    assert result.tolist() == ["1 m", "2 m"]
+    assert pd.Series([], dtype=float).clip_score().empty
+
+
+def test_vectorized_registration():
+    """The registry keeps the vectorized function of the method."""
+    registered = find_registered_method(pd.Series([1.0]), "clip_score")
+    assert isinstance(registered.ufunc, VectorizedFunction)
+    assert registered.ufunc.func is clip_score
+    assert find_registered_method(pd.Series([1.0]), "describe_value").direct
+    with pytest.raises(ValueError, match="vectorize"):
+        pf.register_series_method(clip_score, jit=False)
+
+
+def test_kernels_are_cached_per_dtype():
+    """Each dtype and number of arguments compiles a single kernel."""
+    ufunc = VectorizedFunction(clip_score, jit=False)
+    values = np.array([0.5, 2.0])
+    kernel = ufunc.kernel(values.dtype)
+    assert ufunc.kernel(np.dtype("float64")) is kernel
+    assert ufunc.kernel(np.dtype("int64")) is not kernel
+    assert ufunc.kernel(values.dtype, 2) is not kernel
+    assert ufunc(values, 0.0, 1.0).tolist() == [0.5, 1.0]
+    assert len(ufunc._kernels) == 3
+
+
+def test_keyword_arguments_use_cached_kernels():
+    """Keyword arguments are bound positionally, reusing the kernels."""
+    ufunc = VectorizedFunction(clip_score, jit=False)
+    values = np.array([0.5, 2.0])
+    assert ufunc(values, high=0.5).tolist() == [0.5, 0.5]
+    kernel = ufunc.kernel(values.dtype, 2)
+    assert ufunc(values, 0.0, high=0.75).tolist() == [0.5, 0.75]
+    assert ufunc(values, low=1.0).tolist() == [1.0, 1.0]
+    assert list(ufunc._kernels) == [(values.dtype, 2)]
+    assert ufunc.kernel(values.dtype, 2) is kernel
+    with pytest.raises(TypeError):
+        ufunc(values, scale=2)
+
+    def scaled(x, *, factor=1.0):
+        """Scale a value.
+
+        Args:
+            x: The value.
+            factor: The scale.
+
+        Returns:
+            The scaled value.
+        """
+        return x * factor
+
+    # keyword-only parameters are passed by keyword
+    assert VectorizedFunction(scaled)(values, factor=2.0).tolist() == [1.0, 4.0]
+
+
+def test_jit_requires_numba():
+    """jit=True fails without numba, and compiles numeric kernels with it."""
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="numba"):
+            VectorizedFunction(clip_score, jit=True)
+        return
+    ufunc = VectorizedFunction(clip_score, jit=True)
+    result = ufunc(np.array([0.5, 2.0]))
+    assert result.dtype == np.float64
+    assert result.tolist() == [0.5, 1.0]
+
+
+def test_non_numeric_series():
+    """Non-numeric Series call the function once per distinct value."""
+    calls = []
+
+    @pf.register_series_ufunc
+    def initial(x):
+        """Return the capitalized initial of a string.
+
+        Args:
+            x: The string, or a missing value.
+
+        Returns:
+            The initial, or the missing value.
+        """
+        calls.append(x)
+        return x[:1].upper() if isinstance(x, str) else x
+
+    s = pd.Series(["alpha", "beta", None, "alpha", "beta"], dtype=object)
+    expected = s.apply(initial)
+    calls.clear()
+    pd.testing.assert_series_equal(s.initial(), expected)
+    assert len(calls) == 3
+
+    categories = s.astype("category")
+    pd.testing.assert_series_equal(categories.initial(), categories.apply(initial))
@@ -0,0 +1,99 @@
+"""Tests for blockwise xarray methods."""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import pandas_flavor as pf
+
+pytest.importorskip("dask")
+
+
+@pf.register_xarray_dataarray_method(blockwise="apply_ufunc")
+def scale_values(values, factor):
+    """Scale an array.
+
+    Args:
+        values: A NumPy array.
+        factor: The scaling factor.
+
+    Returns:
+        The scaled array.
+    """
+    assert isinstance(values, np.ndarray)
+    return values * factor
+
+
+@pf.register_xarray_dataset_method(blockwise="map_blocks")
+def center_blocks(ds, offset=0.0):
+    """Center each variable of a block around its mean.
+
+    Args:
+        ds: An xarray Dataset.
+        offset: A value added to the result.
+
+    Returns:
+        The centered Dataset.
+    """
+    return ds - ds.mean() + offset
+
+
+@pytest.fixture
+def chunked():
+    """A Dataset of two variables split into four chunks.
+
+    Returns:
+        The chunked Dataset.
+    """
+    data = np.arange(400.0).reshape(40, 10)
+    ds = xr.Dataset({"a": (("x", "y"), data), "b": (("x", "y"), -data)})
+    return ds.chunk({"x": 10})
+
+
+def test_apply_ufunc_is_lazy(chunked):
+    """apply_ufunc methods return lazy results computed chunk by chunk."""
+    result = chunked["a"].scale_values(2.0)
+    assert result.chunks == chunked["a"].chunks
+    assert len(result.data.__dask_graph__().layers) > 1
+    np.testing.assert_array_equal(result.compute().values, chunked["a"].values * 2)
+    # objects that are not chunked are passed at once
+    loaded = chunked["a"].load()
+    np.testing.assert_array_equal(loaded.scale_values(2.0), result.values)
+
+
+def test_map_blocks_per_block(chunked):
+    """map_blocks methods are applied to each block separately."""
+    result = chunked.center_blocks(offset=1.0)
+    assert result["a"].chunks == chunked["a"].chunks
+    computed = result.compute()
+    first = chunked.isel(x=slice(0, 10)).compute()
+    expected = first - first.mean() + 1.0
+    xr.testing.assert_allclose(computed.isel(x=slice(0, 10)), expected)
+    assert not np.allclose(computed["a"], (chunked - chunked.mean() + 1.0)["a"])
+
+
+def test_unknown_blockwise_mode():
+    """Unknown modes are rejected at registration."""
+    with pytest.raises(ValueError, match="blockwise"):
+        pf.register_xarray_dataarray_method(blockwise="rows")(lambda da: da)
+
+
+def test_tracing_xarray_calls(chunked):
+    """xarray calls go through the tracing hook and record their metadata."""
+    tracer = pf.MethodCallTracer()
+    with tracer:
+        chunked["a"].scale_values(factor=3.0)
+        chunked.load().center_blocks()
+    records = tracer.records().set_index("method")
+
+    lazy = records.loc["scale_values"]
+    assert lazy["dims"] == ("x", "y")
+    assert (lazy["in_chunks"], lazy["out_chunks"]) == (4, 4)
+    assert lazy["in_chunk_bytes"] == 10 * 10 * 8
+    assert lazy["in_bytes"] == lazy["out_bytes"] == 40 * 10 * 8
+    assert lazy["lazy"]
+
+    eager = records.loc["center_blocks"]
+    assert (eager["in_chunks"], eager["out_chunks"]) == (0, 0)
+    assert eager["in_bytes"] == 2 * 40 * 10 * 8
+    assert not eager["lazy"]